@@ -0,0 +1,69 @@
+"""Benchmark of loading many Bruker OPUS spectra (see `BrukerOpusLoader`).
+
+Compares the former serial loading (one `xr.DataArray` per file, which are
+concatenated by `xr.concat`) with stacking the spectra into preallocated
+arrays, serially and in a pool of threads or processes. The spectra are copies
+of the test data.
+
+Usage:
+    python benchmarks/bruker_opus.py [files] [workers]
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import xarray as xr
+
+from rdmlibpy.loaders import BrukerOpusLoader
+from rdmlibpy.process import Loader
+
+DATA_PATH = Path(__file__).parents[1] / 'tests' / 'data' / 'bruker'
+
+
+class ConcatenatingBrukerOpusLoader(BrukerOpusLoader):
+    # former implementation: concatenates one data array per file
+    def run(self, source):
+        generator = map(self._try_load_single_spectrum, Loader.glob(source))
+        generator = filter(lambda a: a is not None, generator)
+        data = xr.concat(generator, dim=self.concat_dim)
+        return data.sortby('timestamp')
+
+
+def create_files(path: Path, files: int):
+    spectra = sorted(DATA_PATH.glob('LC003.*'))
+    for index in range(files):
+        shutil.copy(spectra[index % len(spectra)], path / f'LC{index:06d}.0')
+    return path / 'LC*.0'
+
+
+def benchmark(label: str, loader: BrukerOpusLoader, source: Path, files: int):
+    start = time.perf_counter()
+    da = loader.run(source)
+    elapsed = time.perf_counter() - start
+    print(f'{label:36s} {elapsed:8.3f} s {files / elapsed:10,.0f} files/s')
+    return da
+
+
+def main(files: int = 2000, workers: int = 4):
+    with tempfile.TemporaryDirectory() as tmp:
+        source = create_files(Path(tmp), files)
+        print(f'Loading {files:,} spectra')
+        expected = benchmark(
+            'concatenate (former)', ConcatenatingBrukerOpusLoader(), source, files
+        )
+        for label, loader in {
+            'stack': BrukerOpusLoader(),
+            f'stack, {workers} threads': BrukerOpusLoader(workers=workers),
+            f'stack, {workers} processes': BrukerOpusLoader(
+                workers=workers, executor='processes'
+            ),
+        }.items():
+            da = benchmark(label, loader, source, files)
+            xr.testing.assert_equal(da, expected)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
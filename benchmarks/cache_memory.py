@@ -0,0 +1,111 @@
+"""Benchmark of the peak memory of cache round trips (see `DataFrameFileCache`).
+
+Writes and reads a cache of pint columns in separate processes (one per format
+and direction) and compares the peak resident memory with the size of the
+data: the memory required in addition to the data frame while writing it, and
+the memory required to read it (including the data frame itself). Fails if
+the peak exceeds the limits of `MAX_FACTOR`.
+
+Usage (Linux & macOS):
+    python benchmarks/cache_memory.py [rows]
+"""
+
+import gc
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pint_pandas
+
+from rdmlibpy.dataframes import DataFrameFileCache
+
+# maximum peak memory (relative to the size of the data) of writing a cache
+# (in addition to the data) and of reading it (including the data); compressed
+# Parquet pages are decoded into (chunked) Arrow buffers first, which are
+# concatenated when converted to a data frame
+MAX_FACTOR = {
+    'HDF5': dict(write=1.5, read=2.5),
+    'parquet': dict(write=1.5, read=4.5),
+    'feather': dict(write=1.5, read=2.5),
+}
+
+
+def create_frame(rows: int, columns: int = 8):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            f'T{index}': pint_pandas.PintArray(rng.random(rows), 'pint[degC][float64]')
+            for index in range(columns)
+        },
+        copy=False,
+    )
+
+
+def peak_rss():
+    # maximum resident set size (in bytes)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def measure(direction: str, format: str, rows: int, path: str):
+    cache = DataFrameFileCache(format=format)  # type: ignore
+    size = 0
+    if direction == 'write':
+        df = create_frame(rows)
+        size = int(df.memory_usage(index=False).sum())
+        gc.collect()
+        baseline = peak_rss()
+        cache.write(df, path)
+    else:
+        baseline = peak_rss()
+        df = cache.read(path)
+        size = int(df.memory_usage(index=False).sum())
+    print(json.dumps(dict(size=size, peak=peak_rss() - baseline)))
+
+
+def run(direction: str, format: str, rows: int, path: Path):
+    result = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            '--measure',
+            direction,
+            format,
+            str(rows),
+            str(path),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    measured = json.loads(result.stdout.strip().splitlines()[-1])
+    factor = measured['peak'] / measured['size']
+    print(
+        f'{format:8s} {direction:6s} {measured["peak"] / 1e6:8,.0f} MB {factor:6.2f} x'
+    )
+    return factor
+
+
+def main(rows: int = 10_000_000):
+    print(f'Peak memory of cache round trips ({rows:,} rows x 8 columns)')
+    failed = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for format, limits in MAX_FACTOR.items():
+            path = Path(tmp) / f'cache.{format.lower()}'
+            for direction in ['write', 'read']:
+                if run(direction, format, rows, path) > limits[direction]:
+                    failed.append(f'{format} ({direction})')
+    assert not failed, f'Peak memory exceeds the limit: {", ".join(failed)}'
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--measure']:
+        direction, format, rows, path = sys.argv[2:6]
+        measure(direction, format, int(rows), path)
+    else:
+        main(*(int(arg) for arg in sys.argv[1:]))
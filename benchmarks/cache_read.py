@@ -0,0 +1,68 @@
+"""Benchmark of reading cached data frames (see `DataFrameFileCache`).
+
+Compares the time to open a cache (HDF5, Parquet, Feather and memory-mapped
+Feather files) and the time to use a single column afterwards. Memory-mapped
+caches are opened without reading any data; pages are read on first access.
+
+Usage:
+    python benchmarks/cache_read.py [rows]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pint_pandas
+
+from rdmlibpy.dataframes import DataFrameFileCache
+
+
+def create_frame(rows: int, columns: int = 8):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            f'T{index}': pint_pandas.PintArray(rng.random(rows), 'pint[degC][float64]')
+            for index in range(columns)
+        },
+        index=pd.date_range('2024-01-01', periods=rows, freq='100ms', name='t'),
+    )
+    df.attrs.update(source='benchmark')
+    return df
+
+
+def benchmark(name: str, cache: DataFrameFileCache, path: Path, df: pd.DataFrame):
+    cache.write(df, path)
+
+    start = time.perf_counter()
+    cached = cache.read(path)
+    opened = time.perf_counter() - start
+    cached['T0'].pint.magnitude.sum()
+    used = time.perf_counter() - start - opened
+    print(f'{name:24s} open {opened:8.3f} s   first column {used:8.3f} s')
+
+
+def main(rows: int = 10_000_000):
+    df = create_frame(rows)
+    print(f'Reading a cache of {rows:,} rows ({df.memory_usage().sum() / 1e6:,.0f} MB)')
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        benchmark('HDF5', DataFrameFileCache(), tmp / 'cache.h5', df)
+        benchmark(
+            'Parquet', DataFrameFileCache(format='parquet'), tmp / 'cache.parquet', df
+        )
+        benchmark(
+            'Feather', DataFrameFileCache(format='feather'), tmp / 'cache.feather', df
+        )
+        benchmark(
+            'Feather (memory-mapped)',
+            DataFrameFileCache(format='feather', memory_map=True),
+            tmp / 'cache.feather',
+            df,
+        )
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
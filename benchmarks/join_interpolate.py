@@ -0,0 +1,88 @@
+"""Benchmark of joining data frames with interpolation (see `DataFrameJoin`).
+
+Joins 200 FTIR channels (with units) onto a 1 Hz temperature log and compares
+the former column-by-column interpolation with the batched interpolation of
+`interpolate_columns` (on the outer join) and with the modes `linear` and
+`asof`, which evaluate the channels at the index of the log directly.
+
+Usage:
+    python benchmarks/join_interpolate.py [seconds] [channels]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pint_pandas
+
+from rdmlibpy.dataframes import DataFrameJoin
+
+
+class ColumnwiseDataFrameJoin(DataFrameJoin):
+    # former implementation: interpolates (and re-wraps) column by column
+    def interpolate(self, df: pd.DataFrame, non_numeric):
+        x = (df.index - df.index[0]).total_seconds()
+        for col in df.columns:
+            if isinstance(df[col].values, pint_pandas.PintArray):
+                isnan = np.isnan(df[col].pint.m)
+                df[col] = pint_pandas.PintArray(
+                    np.interp(x, x[~isnan], df[col].pint.m[~isnan]),
+                    dtype=df[col].dtype,
+                )
+            else:
+                isnan = np.isnan(df[col])
+                df[col] = np.interp(x, x[~isnan], df[col][~isnan])
+        return df
+
+
+def create_frames(seconds: int, channels: int):
+    rng = np.random.default_rng(0)
+    start = pd.Timestamp('2024-01-01')
+    temperature = pd.DataFrame(
+        {'T': pint_pandas.PintArray(rng.random(seconds), 'pint[degC][float64]')},
+        index=start + pd.to_timedelta(np.arange(seconds), unit='s'),
+    )
+    rows = seconds // 3
+    ftir = pd.DataFrame(
+        {
+            f'channel {index}': pint_pandas.PintArray(
+                rng.random(rows), 'pint[ppm][float64]'
+            )
+            for index in range(channels)
+        },
+        index=start + pd.to_timedelta(np.arange(rows) * 3.0 + 0.7, unit='s'),
+    )
+    return temperature, ftir
+
+
+def benchmark(
+    name: str,
+    transform: DataFrameJoin,
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    **params,
+):
+    start = time.perf_counter()
+    transform.run(left, right, how='left', **params)
+    elapsed = time.perf_counter() - start
+    print(f'{name:32s} {elapsed:8.3f} s')
+
+
+def main(seconds: int = 3600, channels: int = 200):
+    temperature, ftir = create_frames(seconds, channels)
+    print(f'Joining {channels} channels onto {seconds:,} rows')
+    benchmark(
+        'column by column',
+        ColumnwiseDataFrameJoin(),
+        temperature,
+        ftir,
+        interpolate=True,
+    )
+    benchmark('batched', DataFrameJoin(), temperature, ftir, interpolate=True)
+    benchmark('mode=linear', DataFrameJoin(), temperature, ftir, mode='linear')
+    benchmark('mode=asof', DataFrameJoin(), temperature, ftir, mode='asof')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
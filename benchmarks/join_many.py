@@ -0,0 +1,75 @@
+"""Benchmark of aligning many instrument streams (see `DataFrameJoinMany`).
+
+Compares a chain of binary joins with interpolation (`dataframe.join`) with a
+single N-ary join (`dataframe.join.many`) of five streams with different
+sampling rates.
+
+Usage:
+    python benchmarks/join_many.py [seconds]
+"""
+
+import functools
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pint_pandas
+
+from rdmlibpy.dataframes import DataFrameJoin, DataFrameJoinMany
+
+# sampling periods (in seconds) & number of channels of the streams
+STREAMS = dict(
+    eurotherm=(1.0, 1),
+    tclogger=(0.1, 8),
+    ftir=(3.0, 200),
+    rga=(2.3, 20),
+    bruker=(30.0, 50),
+)
+
+
+def create_frames(seconds: int):
+    rng = np.random.default_rng(0)
+    start = pd.Timestamp('2024-01-01')
+    frames = {}
+    for name, (period, channels) in STREAMS.items():
+        rows = int(seconds / period)
+        frames[name] = pd.DataFrame(
+            {
+                f'{name} {index}': pint_pandas.PintArray(
+                    rng.random(rows), 'pint[ppm][float64]'
+                )
+                for index in range(channels)
+            },
+            index=start + pd.to_timedelta(np.arange(rows) * period, unit='s'),
+        )
+    return frames
+
+
+def benchmark(name: str, func):
+    start = time.perf_counter()
+    df = func()
+    elapsed = time.perf_counter() - start
+    print(f'{name:32s} {elapsed:8.3f} s   {df.shape[0]:10,d} rows')
+
+
+def main(seconds: int = 3600):
+    frames = create_frames(seconds)
+    join = DataFrameJoin()
+    print(f'Aligning {len(frames)} streams of {seconds:,} s')
+    benchmark(
+        'chained dataframe.join',
+        lambda: functools.reduce(
+            lambda left, right: join.run(left, right, interpolate=True),
+            frames.values(),
+        ),
+    )
+    benchmark('dataframe.join.many', lambda: DataFrameJoinMany().run(**frames))
+    benchmark(
+        'dataframe.join.many (1 s)',
+        lambda: DataFrameJoinMany().run(freq='1 s', **frames),
+    )
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
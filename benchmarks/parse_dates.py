@@ -0,0 +1,63 @@
+"""Benchmark of the date parsing of MKS FTIR files (separate date & time columns).
+
+Compares the former row-wise joining of the date & time columns with the
+vectorized implementation of `DataFrameReadCSVBase`.
+
+Usage:
+    python benchmarks/parse_dates.py [rows]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from rdmlibpy.loaders import MksFTIRLoader
+
+
+class RowwiseMksFTIRLoader(MksFTIRLoader):
+    # former implementation: joins date & time strings row by row
+    def _to_datetime_joining_columns(self, columns: List[pd.Series]):
+        df = pd.concat(columns, axis=1)
+        return self._to_datetime(df.astype(str).agg(' '.join, axis=1))
+
+
+def create_file(path: Path, rows: int):
+    timestamps = pd.Timestamp('2024-01-01') + pd.to_timedelta(
+        np.arange(rows) * 0.5, unit='s'
+    )
+    df = pd.DataFrame(
+        {
+            'Date': timestamps.strftime('%d.%m.%Y'),
+            'Time': timestamps.strftime('%H:%M:%S,%f').str[:-3],
+            'CO (ppm)': np.random.default_rng(0).random(rows),
+        }
+    )
+    df.to_csv(path, sep='\t', decimal=',', index=False)
+    return path
+
+
+def benchmark(loader: MksFTIRLoader, path: Path, rows: int):
+    df = loader._load(path)
+    start = time.perf_counter()
+    loader._parse_dates(df)
+    elapsed = time.perf_counter() - start
+    print(
+        f'{type(loader).__name__:24s} {elapsed:8.3f} s {rows / elapsed:12,.0f} rows/s'
+    )
+
+
+def main(rows: int = 1_000_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = create_file(Path(tmp) / 'ftir.txt', rows)
+        print(f'Parsing dates of {rows:,} rows')
+        benchmark(RowwiseMksFTIRLoader(), path, rows)
+        benchmark(MksFTIRLoader(), path, rows)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -3,8 +3,12 @@ __version__ = '0.2.26'
 
 
 from . import common, dataframes, loaders, metadata, serializers, xarrays
+from .glob_index import GlobIndex
+from .planning import WorkflowPlan
 from .process import DelegatedSource
+from .profiling import ProfileReport
 from .registry import register
+from .result_cache import ResultCache
 from .workflow import Workflow, run
 
 # set default (short) format for saving/loading units
@@ -19,7 +23,11 @@ __all__ = [
     xarrays,
     common,
     DelegatedSource,
+    GlobIndex,
+    WorkflowPlan,
+    ProfileReport,
     register,
+    ResultCache,
     Workflow,
     run,
 ]  # type: ignore
@@ -0,0 +1,93 @@
+import datetime
+import hashlib
+import json
+import os
+from collections.abc import Mapping, Sequence, Set
+from typing import Any, List, Optional, Tuple
+
+import pydantic
+
+
+def fingerprint(value: Any) -> str:
+    """Computes a stable hash of a (nested) value.
+
+    Args:
+        value (Any): The value to hash.
+
+    Returns:
+        str: The hex digest of the hash.
+    """
+    digest, _ = _hash(value)
+    return digest
+
+
+def persistent_fingerprint(value: Any) -> Optional[str]:
+    """Computes a hash of a (nested) value, which is stable across processes.
+
+    Args:
+        value (Any): The value to hash.
+
+    Returns:
+        Optional[str]: The hex digest of the hash or `None`, if the value
+            contains objects, which can only be identified by their identity
+            (e.g. functions).
+    """
+    digest, persistent = _hash(value)
+    return digest if persistent else None
+
+
+def file_digest(filename: str | os.PathLike) -> str:
+    """Computes a hash of the contents of a file.
+
+    Args:
+        filename (str | os.PathLike): The file.
+
+    Returns:
+        str: The hex digest of the hash.
+    """
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as fp:
+        for chunk in iter(lambda: fp.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hash(value: Any) -> Tuple[str, bool]:
+    identities: List[Any] = []
+    canonical = _canonical(value, identities)
+    serialized = json.dumps(canonical, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest(), not identities
+
+
+def _canonical(value: Any, identities: List[Any]) -> Any:
+    # convert the value to a structure, which can be serialized to JSON in
+    # a deterministic way
+    match value:
+        case None | bool() | int() | float() | str():
+            return value
+        case os.PathLike():
+            return os.fspath(value)
+        case datetime.date() | datetime.time():
+            return value.isoformat()
+        case datetime.timedelta():
+            return {'timedelta': value.total_seconds()}
+        case pydantic.BaseModel():
+            return {
+                'model': type(value).__qualname__,
+                'fields': _canonical(value.model_dump(), identities),
+            }
+        case bytes():
+            return {'bytes': hashlib.sha256(value).hexdigest()}
+        case Mapping():
+            return {
+                'mapping': {str(k): _canonical(v, identities) for k, v in value.items()}
+            }
+        case Sequence():
+            return [_canonical(v, identities) for v in value]
+        case Set():
+            return {'set': sorted(json.dumps(_canonical(v, identities)) for v in value)}
+        case _:
+            # fall back to the identity of the object; values of unknown type
+            # therefore never compare equal unless they are the same object
+            identities.append(value)
+            return {'object': f'{type(value).__qualname__}@{id(value)}'}
@@ -1,15 +1,38 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    cast,
+)
 
 import pydantic
 
+from ._hashing import fingerprint, persistent_fingerprint
+from .execution import current_context
+from .timespan import Timespan
+
 
 class ProcessBase(pydantic.BaseModel, abc.ABC):
     name: str
     version: str
 
+    # processes dominated by Python-level computations (rather than I/O);
+    # used to decide which branches of a workflow are run in worker processes
+    cpu_bound: ClassVar[bool] = False
+
+    # results may be stored in a persistent result cache (processes with
+    # side effects, e.g. writers, should not be skipped on later runs)
+    cacheable: ClassVar[bool] = True
+
     def updated(self, **config):
         _config = self.model_dump(exclude_defaults=True)
         _config.update(config)
@@ -26,11 +49,10 @@ class ProcessBase(pydantic.BaseModel, abc.ABC):
         # params = node.get_params()
 
         if node.parent is not None:
-            # run parent process
-            source = node.parent.run(**kwargs)
+            # run parent process & resolve parameters
+            source, params = node.get_inputs(**kwargs)
 
             # run process & return result
-            params = node.get_params()
             return self.run(source, **params)
         else:
             params = node.get_params()
@@ -40,6 +62,68 @@ class ProcessBase(pydantic.BaseModel, abc.ABC):
     def preprocess(self):
         return None
 
+    def get_input_files(self, **params) -> Optional[List[Path]]:
+        """Returns the files read by the process for the given parameters.
+
+        The files are used to detect changes of the inputs of a process
+        (e.g. to invalidate cached results).
+
+        Returns:
+            Optional[List[Path]]: The files read by the process or `None`, if
+                the inputs of the process cannot be determined in advance.
+        """
+        return []
+
+    def selected_timespan(self, **params) -> Optional[Timespan]:
+        """Returns the time window selected by the process for the given
+        parameters (see `Timespan`), which is pushed into upstream loaders.
+
+        Returns:
+            Optional[Timespan]: The time window or `None`, if the process
+                does not select a time window (default).
+        """
+        return None
+
+    def push_down_timespan(self, timespan: Timespan, **params) -> Optional[Timespan]:
+        """Maps a time window selected downstream onto the input of the
+        process.
+
+        Time windows are pushed across row-local processes only, i.e.
+        processes whose output rows within the window do not depend on input
+        rows outside the window and which have no side effects.
+
+        Args:
+            timespan (Timespan): The time window of the output.
+
+        Returns:
+            Optional[Timespan]: The time window of the input or `None`, if the
+                window cannot be pushed across the process (default).
+        """
+        return None
+
+    def selected_columns(self, **params) -> Optional[List[str]]:
+        """Returns the columns of the input used by the process for the given
+        parameters, which are pushed into upstream loaders.
+
+        Returns:
+            Optional[List[str]]: The columns or `None`, if the process does
+                not select columns (default).
+        """
+        return None
+
+    def push_down_columns(self, columns: List[str], **params) -> Optional[List[str]]:
+        """Maps the columns used downstream onto the columns of the input of
+        the process (including the columns used by the process itself).
+
+        Args:
+            columns (List[str]): The columns of the output used downstream.
+
+        Returns:
+            Optional[List[str]]: The columns of the input or `None`, if the
+                columns cannot be pushed across the process (default).
+        """
+        return None
+
     @property
     def fullname(self):
         return f'{self.name}@v{self.version}'
@@ -65,8 +149,118 @@ class ProcessNode(pydantic.BaseModel):
         return result
 
     def run(self, **kwargs):
+        # within a workflow run, the execution context decides whether the
+        # node is actually executed or its (shared) result is reused
+        context = current_context()
+        if context is not None:
+            return context.run_node(self, **kwargs)
         return self.runner._run_with_node(self, **kwargs)
 
+    def get_dependencies(self) -> List[ProcessNode]:
+        # all nodes, which are evaluated when running this node
+        # (the parent node followed by executable parameters)
+        nodes = [] if self.parent is None else [self.parent]
+        for param in self.params.values():
+            if isinstance(param, RunnableProcessParam):
+                nodes.append(param.node)
+        return nodes
+
+    def fingerprint(self, memo: Optional[Dict[int, str]] = None) -> str:
+        """Computes a hash of the structure of the node.
+
+        Two nodes have the same fingerprint, if they use the same runner
+        (name, version and configuration), the same parameters and if their
+        parent nodes and executable parameters are structurally identical.
+
+        Args:
+            memo (Optional[Dict[int, str]], optional): Fingerprints of nodes
+                that have already been visited (indexed by `id(node)`).
+                Defaults to None.
+
+        Returns:
+            str: The hex digest of the fingerprint.
+        """
+        return cast(str, self._fingerprint(fingerprint, {} if memo is None else memo))
+
+    def persistent_fingerprint(
+        self, memo: Optional[Dict[int, Optional[str]]] = None
+    ) -> Optional[str]:
+        """Computes a hash of the structure of the node, which is stable across
+        runs and processes (see `fingerprint`).
+
+        Args:
+            memo (Optional[Dict[int, Optional[str]]], optional): Fingerprints
+                of nodes that have already been visited (indexed by
+                `id(node)`). Defaults to None.
+
+        Returns:
+            Optional[str]: The hex digest of the fingerprint or `None`, if the
+                configuration or parameters contain objects, which can only be
+                identified by their identity (e.g. functions).
+        """
+        return self._fingerprint(persistent_fingerprint, {} if memo is None else memo)
+
+    def _fingerprint(
+        self, hasher: Callable[[Any], Optional[str]], memo: Dict[int, Any]
+    ) -> Optional[str]:
+        if id(self) not in memo:
+            memo[id(self)] = None
+            params = {}
+            for key, param in self.params.items():
+                if isinstance(param, RunnableProcessParam):
+                    params[key] = {'node': param.node._fingerprint(hasher, memo)}
+                    if params[key]['node'] is None:
+                        return None
+                else:
+                    params[key] = {'value': param.get_value()}
+
+            parent = None
+            if self.parent is not None:
+                parent = self.parent._fingerprint(hasher, memo)
+                if parent is None:
+                    return None
+
+            memo[id(self)] = hasher(
+                dict(
+                    runner=self.runner.fullname,
+                    config=self.runner.get_config(),
+                    params=params,
+                    parent=parent,
+                )
+            )
+        return memo[id(self)]
+
+    def get_input_files(self, **kwargs) -> Optional[List[Path]]:
+        """Returns the files read by the node and all of its upstream nodes.
+
+        Args:
+            **kwargs: Runtime arguments passed to the node.
+
+        Returns:
+            Optional[List[Path]]: The files (in order of their first occurrence)
+                or `None`, if the inputs of any node cannot be determined.
+        """
+        values = {
+            key: param.get_value()
+            for key, param in self.params.items()
+            if not isinstance(param, RunnableProcessParam)
+        }
+        if self.parent is None:
+            values.update(kwargs)
+        files = self.runner.get_input_files(**values)
+        if files is None:
+            return None
+
+        files = list(files)
+        for index, node in enumerate(self.get_dependencies()):
+            # runtime arguments are passed on to the parent node
+            node_kwargs = kwargs if (index == 0) and (self.parent is not None) else {}
+            upstream = node.get_input_files(**node_kwargs)
+            if upstream is None:
+                return None
+            files.extend(upstream)
+        return list(dict.fromkeys(files))
+
     def get_param(self, key: str, default=None):
         if default is None:
             return self.params[key].get_value()
@@ -80,7 +274,54 @@ class ProcessNode(pydantic.BaseModel):
         # resolve parameters;
         # Each parameter, which itself represents an executable node, is
         # evaluated before the process of the current node instance is executed.
-        return {key: item.get_value() for key, item in self.params.items()}
+        _, params = self._evaluate(None, self.params)
+        return params
+
+    def get_inputs(self, **kwargs) -> Tuple[Any, Dict[str, Any]]:
+        """Runs the parent node and resolves the parameters of the node.
+
+        Within a workflow run with an executor, the parent node and the
+        executable parameters are evaluated concurrently.
+
+        Returns:
+            Tuple[Any, Dict[str, Any]]: The result of the parent node and the
+                resolved parameters.
+        """
+        if self.parent is None:
+            raise ValueError('The process node has no parent.')
+        return self._evaluate((self.parent, kwargs), self.params)
+
+    @staticmethod
+    def _evaluate(
+        source: Optional[Tuple[ProcessNode, Mapping[str, Any]]],
+        params: Dict[str, ProcessParam],
+    ) -> Tuple[Any, Dict[str, Any]]:
+        # collect independent branches (parent & executable parameters)
+        runnable = {
+            key: item
+            for key, item in params.items()
+            if isinstance(item, RunnableProcessParam)
+        }
+        branches = [(item.node, {}) for item in runnable.values()]
+        if source is not None:
+            branches.insert(0, source)
+
+        context = current_context()
+        if context is not None:
+            results = context.evaluate(branches)
+        else:
+            results = [node.run(**kwargs) for node, kwargs in branches]
+
+        if source is not None:
+            source = results.pop(0)
+
+        # resolve plain parameters (keeping the order of all parameters)
+        values = dict(zip(runnable, results))
+        resolved = {
+            key: values[key] if key in values else item.get_value()
+            for key, item in params.items()
+        }
+        return source, resolved
 
 
 class ProcessParam(pydantic.BaseModel, abc.ABC):
@@ -24,6 +24,10 @@ class IncludeMetadataFile(ProcessBase):
     name: str = 'include.metadata.file'
     version: str = '1'
 
+    def get_input_files(self, **params):
+        # inputs of the included workflow are unknown
+        return None
+
     def run(self, source: str | Path, key: str | None = None):
         source = Path(source)
         conf = OmegaConf.load(source)
@@ -1,5 +1,6 @@
 from ..registry import register
 from .dataframes_io import DataFrameFileCache, DataFrameReadCSV, DataFrameWriteCSV
+from .dataframes_resampling import DataFrameResample
 from .dataframes_selection import SelectColumns, SelectTimespan
 from .dataframe_transforms import (
     DataFrameAsType,
@@ -7,6 +8,7 @@ from .dataframe_transforms import (
     DataFrameFillNA,
     DataFrameInterpolate,
     DataFrameJoin,
+    DataFrameJoinMany,
     DataFrameSetIndex,
     DataFrameTimeOffset,
     DataFrameUnits,
@@ -20,7 +22,9 @@ register(DataFrameFileCache())
 register(DataFrameFillNA())
 register(DataFrameInterpolate())
 register(DataFrameJoin())
+register(DataFrameJoinMany())
 register(DataFrameReadCSV())
+register(DataFrameResample())
 register(DataFrameSetIndex())
 register(DataFrameTimeOffset())
 register(DataFrameToXArray())
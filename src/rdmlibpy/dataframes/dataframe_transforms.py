@@ -1,5 +1,6 @@
 import datetime
-from typing import Any, Iterable, List, Literal, Mapping
+import functools
+from typing import Any, ClassVar, Dict, Iterable, List, Literal, Mapping
 
 import numpy as np
 import pandas as pd
@@ -7,9 +8,16 @@ import pint
 import pint_pandas
 from omegaconf import OmegaConf
 from pandas._typing import JoinHow
-from pandas.api.types import is_datetime64_dtype, is_numeric_dtype
+from pandas.api.types import (
+    is_datetime64_any_dtype,
+    is_datetime64_dtype,
+    is_numeric_dtype,
+)
 
 from ..process import Transform
+from ..timespan import Timespan
+from .dataframes_interpolation import interpolate_columns, interpolate_onto
+from .dataframes_streaming import chunkwise, collected
 
 
 class DataFrameSetIndex(Transform):
@@ -17,6 +25,7 @@ class DataFrameSetIndex(Transform):
     version: str = '1'
     sort: bool = True
 
+    @collected
     def run(
         self,
         source: pd.DataFrame,
@@ -30,58 +39,74 @@ class DataFrameSetIndex(Transform):
                 df.sort_index(inplace=True)
             return df
 
+    def push_down_columns(
+        self, columns: List[str], index_var: None | str | List[str] = None
+    ):
+        if index_var is None:
+            return columns
+        index = [index_var] if isinstance(index_var, str) else list(index_var)
+        return columns + [column for column in index if column not in columns]
+
 
 JoinNonNumericMethod = Literal['ignore', 'raise', 'fill forward', 'fill backward']
+JoinMode = Literal['index', 'asof', 'linear']
+JoinDirection = Literal['backward', 'forward', 'nearest']
 
 
 class DataFrameJoin(Transform):
     name: str = 'dataframe.join'
     version: str = '1'
+    cpu_bound: ClassVar[bool] = True
 
     def interpolate(self, df: pd.DataFrame, non_numeric: JoinNonNumericMethod):
-        # check if indices are datetime64
-        if np.issubdtype(df.index.dtype, np.datetime64):  # type: ignore
-            x = (df.index - df.index[0]).total_seconds()
-        else:
-            x = df.index
+        return _interpolate_frame(df, non_numeric)
 
-        # interpolate columns
-        for col in df.columns:
-            if is_numeric_dtype(df[col]):
-                if isinstance(df[col].values, pint_pandas.PintArray):
-                    isnan = np.isnan(df[col].pint.m)
-                    xp = x[~isnan]
-                    yp = df[col].pint.m[~isnan]
-                    try:
-                        df[col] = pint_pandas.PintArray(
-                            np.interp(x, xp, yp), dtype=df[col].dtype
-                        )
-                    except ValueError:
-                        values = df[col].pint.m.values
-                        df[col] = pint_pandas.PintArray(
-                            np.full_like(values, np.nan), dtype=df[col].dtype
-                        )
-                else:
-                    isnan = np.isnan(df[col])
-                    xp = x[~isnan]
-                    yp = df[col][~isnan]
-                    try:
-                        df[col] = np.interp(x, xp, yp)
-                    except ValueError:
-                        df[col] = np.full_like(df[col].values, np.nan)
-            else:
-                match non_numeric:
-                    case 'ignore':
-                        pass
-                    case 'fill forward':
-                        df[col] = df[col].ffill()
-                    case 'fill backward':
-                        df[col] = df[col].bfill()
-                    case 'raise':
-                        raise ValueError('Cannot interpolate non-numeric data on join.')
+    def asof(
+        self,
+        index: pd.Index,
+        other: pd.DataFrame,
+        tolerance: Any = None,
+        direction: JoinDirection = 'backward',
+    ):
+        # values of the nearest rows of `other` (see `pd.merge_asof`)
+        if isinstance(tolerance, str):
+            tolerance = pd.Timedelta(DataFrameTimeOffset._to_timedelta(tolerance))
+
+        # the keys must be sorted & share a dtype (e.g. int & float indices)
+        keys, order = index, None
+        if not keys.is_monotonic_increasing:
+            order = keys.argsort(kind='stable')
+            keys = keys[order]
+        if not other.index.is_monotonic_increasing:
+            other = other.sort_index(kind='stable')
+        if (
+            is_numeric_dtype(keys.dtype)
+            and is_numeric_dtype(other.index.dtype)
+            and (keys.dtype != other.index.dtype)
+        ):
+            dtype = np.result_type(keys.dtype, other.index.dtype)
+            keys = keys.astype(dtype)
+            other = other.copy(deep=False)
+            other.index = other.index.astype(dtype)
+            if (tolerance is not None) and (dtype.kind == 'f'):
+                tolerance = float(tolerance)
+
+        df = pd.merge_asof(
+            pd.DataFrame(index=keys),
+            other,
+            left_index=True,
+            right_index=True,
+            direction=direction,
+            tolerance=tolerance,
+        )
 
+        # restore the order of the index
+        if order is not None:
+            df = df.iloc[np.argsort(order)]
+        df.index = index
         return df
 
+    @collected
     def run(
         self,
         left: pd.DataFrame,
@@ -89,6 +114,66 @@ class DataFrameJoin(Transform):
         how: JoinHow = 'outer',
         interpolate: bool = False,
         non_numeric: JoinNonNumericMethod = 'ignore',
+        mode: JoinMode = 'index',
+        tolerance: Any = None,
+        direction: JoinDirection = 'backward',
+    ):
+        """Joins two data frames on their (sorted) indices.
+
+        Args:
+            left (pd.DataFrame): The left data frame.
+            right (pd.DataFrame): The right data frame.
+            how (JoinHow, optional): How to join the indices. The modes `asof`
+                and `linear` keep the index of the left (`left`) or right
+                (`right`) data frame. Defaults to 'outer'.
+            interpolate (bool, optional): Interpolates numeric columns on the
+                joined index (mode `index`). Defaults to False.
+            non_numeric (JoinNonNumericMethod, optional): Handling of
+                non-numeric columns on interpolation. Defaults to 'ignore'.
+            mode (JoinMode, optional): `index` joins the indices (see
+                `pd.DataFrame.join`), `asof` takes the values of the nearest
+                rows of the other data frame (see `pd.merge_asof`) and
+                `linear` interpolates the other data frame at the index.
+                Defaults to 'index'.
+            tolerance (Any, optional): Maximum distance of the nearest rows
+                (mode `asof`), e.g. '2 s'. Defaults to None.
+            direction (JoinDirection, optional): Direction of the nearest
+                rows (mode `asof`). Defaults to 'backward'.
+        """
+        match mode:
+            case 'index':
+                return self._join_indices(left, right, how, interpolate, non_numeric)
+            case 'asof' | 'linear':
+                if how not in ('left', 'right'):
+                    raise ValueError(
+                        f'Join mode {mode} requires how="left" or "right".'
+                    )
+                overlap = left.columns.intersection(right.columns)
+                if len(overlap) > 0:
+                    raise ValueError(
+                        f'columns overlap but no suffix specified: {list(overlap)}'
+                    )
+
+                # only the other data frame is evaluated at the index (the
+                # memory required is proportional to the size of the result)
+                target, other = (left, right) if how == 'left' else (right, left)
+                if mode == 'asof':
+                    values = self.asof(target.index, other, tolerance, direction)
+                else:
+                    values = _evaluate_at(target.index, other, non_numeric)
+                if how == 'left':
+                    return _concat_columns(target, values)
+                return _concat_columns(values, target)
+            case _:
+                raise ValueError(f'Unsupported join mode: {mode}')
+
+    def _join_indices(
+        self,
+        left: pd.DataFrame,
+        right: pd.DataFrame,
+        how: JoinHow,
+        interpolate: bool,
+        non_numeric: JoinNonNumericMethod,
     ):
         if interpolate:
             # joined = left.join(right, how='outer').interpolate(method='index')
@@ -106,53 +191,223 @@ class DataFrameJoin(Transform):
             return left.join(right, how=how)
 
 
+def _interpolate_frame(df: pd.DataFrame, non_numeric: JoinNonNumericMethod):
+    # interpolates numeric columns & fills non-numeric columns
+    numeric = [
+        position for position, dtype in enumerate(df.dtypes) if is_numeric_dtype(dtype)
+    ]
+    if (non_numeric == 'raise') and (len(numeric) < df.shape[1]):
+        raise ValueError('Cannot interpolate non-numeric data on join.')
+
+    # interpolate all numeric columns at once
+    df = interpolate_columns(df, numeric)
+
+    # fill non-numeric columns
+    for position in range(df.shape[1]):
+        if position in numeric:
+            continue
+        match non_numeric:
+            case 'fill forward':
+                df.isetitem(position, df.iloc[:, position].ffill())
+            case 'fill backward':
+                df.isetitem(position, df.iloc[:, position].bfill())
+
+    return df
+
+
+def _evaluate_at(
+    index: pd.Index, other: pd.DataFrame, non_numeric: JoinNonNumericMethod
+):
+    # values of `other` linearly interpolated at `index` (the interpolation
+    # requires a sorted index)
+    if not other.index.is_monotonic_increasing:
+        other = other.sort_index(kind='stable')
+    numeric = [
+        position
+        for position, dtype in enumerate(other.dtypes)
+        if is_numeric_dtype(dtype)
+    ]
+    if (non_numeric == 'raise') and (len(numeric) < other.shape[1]):
+        raise ValueError('Cannot interpolate non-numeric data on join.')
+    evaluated = interpolate_onto(other, index, numeric)
+
+    # values of non-numeric columns at identical rows (or the last valid
+    # values of preceding/following rows)
+    others = [position for position in range(other.shape[1]) if position not in numeric]
+    filled = other.iloc[:, others]
+    match non_numeric:
+        case 'fill forward':
+            filled = filled.ffill().reindex(index, method='ffill')
+        case 'fill backward':
+            filled = filled.bfill().reindex(index, method='bfill')
+        case _:
+            filled = filled.reindex(index)
+
+    # keep the order of the columns
+    columns = dict(zip(numeric, (column.array for _, column in evaluated.items())))
+    columns.update(zip(others, (column.array for _, column in filled.items())))
+    df = pd.DataFrame(
+        {position: columns[position] for position in range(other.shape[1])},
+        index=index,
+        copy=False,
+    )
+    df.columns = other.columns
+    return df
+
+
+def _concat_columns(*frames: pd.DataFrame):
+    # concatenates the columns of data frames with identical indices (without
+    # aligning or copying the columns)
+    df = pd.DataFrame(
+        {
+            position: column.array
+            for position, column in enumerate(
+                column for frame in frames for _, column in frame.items()
+            )
+        },
+        index=frames[0].index,
+        copy=False,
+    )
+    df.columns = functools.reduce(
+        lambda columns, frame: columns.append(frame.columns),
+        frames[1:],
+        frames[0].columns,
+    )
+    return df
+
+
+class DataFrameJoinMany(Transform):
+    name: str = 'dataframe.join.many'
+    version: str = '1'
+    cpu_bound: ClassVar[bool] = True
+
+    @collected
+    def run(
+        self,
+        source: None | pd.DataFrame | List[pd.DataFrame] = None,
+        on: None | int | str = None,
+        freq: Any = None,
+        non_numeric: JoinNonNumericMethod = 'ignore',
+        **frames: pd.DataFrame,
+    ):
+        """Joins many data frames on a common (sorted) index by interpolating
+        all data frames at once (instead of a chain of outer joins).
+
+        Args:
+            source (None | pd.DataFrame | List[pd.DataFrame], optional): The
+                first data frame (e.g. of the parent process) or a list of
+                data frames. Defaults to None.
+            on (None | int | str, optional): The data frame providing the
+                index: `source`, the position of a data frame in the list
+                `source` or the name of a keyword argument. Defaults to None
+                (the union of all indices).
+            freq (Any, optional): Creates a regular index with this frequency
+                (e.g. '1 s') spanning all data frames (or the data frame
+                `on`). Defaults to None.
+            non_numeric (JoinNonNumericMethod, optional): Handling of
+                non-numeric columns. Defaults to 'ignore'.
+            **frames (pd.DataFrame): Further data frames (by name).
+
+        Returns:
+            pd.DataFrame: The joined data frame (the columns of all data
+            frames in their order).
+        """
+        if isinstance(source, pd.DataFrame):
+            named: Dict[int | str, pd.DataFrame] = {'source': source}
+        else:
+            named = dict(enumerate(source or []))
+        named.update(frames)
+        if not named:
+            return pd.DataFrame()
+
+        columns = functools.reduce(
+            lambda columns, df: columns.append(df.columns),
+            list(named.values())[1:],
+            next(iter(named.values())).columns,
+        )
+        if columns.has_duplicates:
+            overlap = columns[columns.duplicated()].unique()
+            raise ValueError(
+                f'columns overlap but no suffix specified: {list(overlap)}'
+            )
+
+        # the target index is computed once & each data frame is evaluated at
+        # the index in a single pass
+        index = self._target_index(named, on, freq)
+        return _concat_columns(
+            *(
+                (
+                    _interpolate_frame(df, non_numeric)
+                    if df.index.equals(index) and index.is_monotonic_increasing
+                    else _evaluate_at(index, df, non_numeric)
+                )
+                for df in named.values()
+            )
+        )
+
+    @staticmethod
+    def _target_index(
+        frames: Dict[int | str, pd.DataFrame], on: None | int | str, freq: Any
+    ) -> pd.Index:
+        if on is not None:
+            if on not in frames:
+                raise ValueError(f'Unknown data frame: {on}')
+            if freq is None:
+                return frames[on].index
+            indices = [frames[on].index]
+        else:
+            indices = [df.index for df in frames.values()]
+            if freq is None:
+                return functools.reduce(lambda a, b: a.union(b), indices)
+
+        # regular index spanning all indices (aligned to the frequency)
+        indices = [index for index in indices if len(index) > 0]
+        if not indices:
+            return next(iter(frames.values())).index[:0]
+        start = min(index.min() for index in indices)
+        stop = max(index.max() for index in indices)
+        name = indices[0].name
+        if is_datetime64_any_dtype(indices[0].dtype):
+            if isinstance(freq, str):
+                freq = DataFrameTimeOffset._to_timedelta(freq)
+            freq = pd.Timedelta(freq)
+            return pd.date_range(start.floor(freq), stop, freq=freq, name=name)
+        freq = float(freq)
+        start = np.floor(start / freq) * freq
+        count = int(np.floor((stop - start) / freq)) + 1
+        return pd.Index(start + np.arange(count) * freq, name=name)
+
+
 class DataFrameInterpolate(Transform):
     name: str = 'dataframe.interpolate'
     version: str = '1'
+    cpu_bound: ClassVar[bool] = True
 
+    @collected
     def run(
         self,
         df: pd.DataFrame,
         include: None | Iterable[str] = None,
         exclude: None | Iterable[str] = None,
     ):
-        # check if indices are datetime64
-        if np.issubdtype(df.index.dtype, np.datetime64):  # type: ignore
-            x = (df.index - df.index[0]).total_seconds()
-        else:
-            x = df.index
-
         if not include:
             include = list(df.columns)
         if not exclude:
             exclude = []
 
-        # interpolate columns
-        for col in include:
-            if col in exclude:
-                continue
-            if isinstance(df[col].values, pint_pandas.PintArray):
-                isnan = np.isnan(df[col].pint.m)
-                xp = x[~isnan]
-                yp = df[col].pint.m[~isnan]
-                try:
-                    df[col] = pint_pandas.PintArray(
-                        np.interp(x, xp, yp), dtype=df[col].dtype
-                    )
-                except ValueError:
-                    df[col] = pint_pandas.PintArray(
-                        np.full_like(df[col].pint.m.values, np.nan), dtype=df[col].dtype
-                    )
-            else:
-                isnan = np.isnan(df[col])
-                xp = x[~isnan]
-                yp = df[col][~isnan]
-                try:
-                    df[col] = np.interp(x, xp, yp)
-                except ValueError:
-                    df[col] = np.full_like(df[col].values, np.nan)
-
-        return df
+        missing = [col for col in include if col not in df.columns]
+        if missing:
+            raise KeyError(f'Columns not in DataFrame: {missing}')
+
+        # interpolate all included columns at once
+        return interpolate_columns(
+            df,
+            [
+                position
+                for position, col in enumerate(df.columns)
+                if (col in include) and (col not in exclude)
+            ],
+        )
 
 
 FillMethod = Literal['forward', 'backward']
@@ -162,6 +417,7 @@ class DataFrameFillNA(Transform):
     name: str = 'dataframe.fillna'
     version: str = '1'
 
+    @collected
     def run(
         self,
         df: pd.DataFrame,
@@ -192,6 +448,7 @@ class DataFrameUnits(Transform):
     name: str = 'dataframe.units'
     version: str = '1'
 
+    @chunkwise
     def run(
         self,
         source: pd.DataFrame,
@@ -211,11 +468,18 @@ class DataFrameUnits(Transform):
                 pass
         return source
 
+    def push_down_timespan(self, timespan: Timespan, **params):
+        return timespan
+
+    def push_down_columns(self, columns: List[str], **params):
+        return columns
+
 
 class DataFrameAttributes(Transform):
     name: str = 'dataframe.set.attrs'
     version: str = '1'
 
+    @chunkwise
     def run(self, source: pd.DataFrame, **kwargs):
         # make deep copy of attributes
         # (roundtrip serialization to yaml)
@@ -230,17 +494,54 @@ class DataFrameAttributes(Transform):
         source.attrs.update(attrs)  # type: ignore
         return source
 
+    def push_down_timespan(self, timespan: Timespan, **params):
+        return timespan
+
+    def push_down_columns(self, columns: List[str], **params):
+        return columns
+
 
 class DataFrameTimeOffset(Transform):
     name: str = 'dataframe.timeoffset'
     version: str = '1'
 
+    @chunkwise
     def run(
         self, source: pd.DataFrame, offset: Any | None = None, column: str | None = None
     ):
         if (offset is None) or (column is None):
             return source
 
+        offset = self._to_timedelta(offset)
+
+        # check if column is a datetime type
+        if not is_datetime64_dtype(source[column]):
+            raise ValueError('Column [column] is not of type datetime64.')
+
+        # apply offset (replacing the column, which might be read-only, e.g.
+        # memory-mapped from a cache)
+        source[column] = source[column] + offset
+
+        # return modified dataframe
+        return source
+
+    def push_down_timespan(
+        self, timespan: Timespan, offset: Any | None = None, column: str | None = None
+    ):
+        if (offset is None) or (column != timespan.column):
+            return timespan
+        # the window of the input precedes the window of the output by `offset`
+        return timespan.shifted(-pd.Timedelta(self._to_timedelta(offset)))
+
+    def push_down_columns(
+        self, columns: List[str], offset: Any | None = None, column: str | None = None
+    ):
+        if (offset is None) or (column is None) or (column in columns):
+            return columns
+        return [*columns, column]
+
+    @staticmethod
+    def _to_timedelta(offset: Any):
         if isinstance(offset, str):
             # convert string with units to timedelta
             ureg = pint.application_registry.get()
@@ -251,33 +552,29 @@ class DataFrameTimeOffset(Transform):
 
             # convert to numpy.timedelta64
             # offset = np.timedelta64(offset)
-
-        # check if column is a datetime type
-        if not is_datetime64_dtype(source[column]):
-            raise ValueError('Column [column] is not of type datetime64.')
-
-        # apply offset
-        source[column] += offset
-
-        # return modified dataframe
-        return source
+        return offset
 
 
 class DataFrameToXArray(Transform):
     name: str = 'dataframe.to_xarray'
     version: str = '1'
 
+    @collected
     def run(self, source: pd.DataFrame, index: None | str | List[str] = None):
         if index is not None:
             return source.set_index(index).to_xarray()
         else:
             return source.to_xarray()
 
+    def push_down_timespan(self, timespan: Timespan, **params):
+        return timespan
+
 
 class DataFrameAsType(Transform):
     name: str = 'dataframe.astype'
     version: str = '1'
 
+    @chunkwise
     def run(self, source: pd.DataFrame, dtypes: Mapping[str, str]):
         result = source.copy()
         for column in dtypes:
@@ -285,3 +582,9 @@ class DataFrameAsType(Transform):
                 raise ValueError(f'Column {column} not in DataFrame.')
             result[column] = source[column].astype(dtypes[column])
         return result
+
+    def push_down_timespan(self, timespan: Timespan, dtypes: Mapping[str, str]):
+        return None if timespan.column in dtypes else timespan
+
+    def push_down_columns(self, columns: List[str], dtypes: Mapping[str, str]):
+        return columns + [column for column in dtypes if column not in columns]
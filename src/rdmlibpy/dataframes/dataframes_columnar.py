@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import datetime
+import functools
+import itertools
+import json
+import operator
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional
+
+import numpy as np
+import pandas as pd
+import pint_pandas
+
+from .dataframes_units import magnitudes, pint_array
+
+ColumnarFormat = Literal['parquet', 'feather']
+
+# key of the schema metadata holding the units of columns and `df.attrs`
+METADATA_KEY = 'rdmlibpy'
+
+# key tagging values of `df.attrs`, which are not JSON types (see `_encode_attr`)
+TYPE_KEY = '__rdmlibpy_type__'
+
+# options of `read_columnar` (any other options are write options)
+READ_OPTIONS = ('columns', 'start', 'stop', 'memory_map')
+
+
+def write_columnar(
+    source: pd.DataFrame | Iterable[pd.DataFrame],
+    filename: str | os.PathLike,
+    format: ColumnarFormat,
+    metadata: Optional[Dict[str, str]] = None,
+    row_group_size: Optional[int] = None,
+    compression: Optional[str] = None,
+    **options,
+):
+    """Writes a data frame (or a sequence of chunks) to a Parquet or Feather
+    (Arrow IPC) file.
+
+    The magnitudes of pint columns are stored, while their units and the
+    `attrs` dictionary (of the first chunk) are stored as JSON in the key-value
+    metadata of the file's schema (timestamps, dates, time deltas and numeric
+    arrays are tagged by their type and restored when reading). The index is always stored as a column,
+    such that it can be filtered when reading the file. Each chunk is stored
+    as separate row groups (record batches). The file is replaced atomically,
+    such that memory-mapped frames of a previous version stay valid.
+
+    Args:
+        source (pd.DataFrame | Iterable[pd.DataFrame]): The data frame or
+            chunks (with identical columns & dtypes).
+        filename (str | os.PathLike): The file name.
+        format (ColumnarFormat): `parquet` or `feather`.
+        metadata (Optional[Dict[str, str]], optional): Additional key-value
+            metadata. Defaults to None.
+        row_group_size (Optional[int], optional): Maximum number of rows per
+            row group. Defaults to None (a row group per chunk).
+        compression (Optional[str], optional): Compression codec. Defaults to
+            None (`snappy` for Parquet, uncompressed Feather files, which can
+            be memory-mapped).
+        **options: Additional options of `pyarrow.parquet.ParquetWriter`.
+
+    Raises:
+        TypeError: If `attrs` contains values, which cannot be stored.
+    """
+    chunks = iter([source] if isinstance(source, pd.DataFrame) else source)
+
+    # the schema (and metadata) is defined by the first chunk
+    first = next(chunks, pd.DataFrame())
+    table = _to_table(first, None)
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), **_encode_metadata(first, metadata)}
+    )
+    schema = table.schema
+
+    # write to a temporary file (overwriting a memory-mapped file in place
+    # would invalidate the mapped data)
+    directory, name = os.path.split(os.path.abspath(filename))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f'.{name}.', suffix='.tmp')
+    os.close(fd)
+    try:
+        with _open_writer(tmp, format, schema, compression, options) as writer:
+            for table in itertools.chain(
+                [table], (_to_table(chunk, schema) for chunk in chunks)
+            ):
+                if format == 'parquet':
+                    writer.write_table(table, row_group_size=row_group_size)
+                else:
+                    writer.write_table(table, max_chunksize=row_group_size)
+        os.replace(tmp, filename)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def read_columnar(
+    filename: str | os.PathLike,
+    format: ColumnarFormat,
+    columns: Optional[List[str]] = None,
+    start: Any = None,
+    stop: Any = None,
+    memory_map: bool = False,
+) -> pd.DataFrame:
+    """Reads a data frame written by `write_columnar`.
+
+    Args:
+        filename (str | os.PathLike): The file name.
+        format (ColumnarFormat): `parquet` or `feather`.
+        columns (Optional[List[str]], optional): Reads only these columns
+            (and the index). Defaults to None (all columns).
+        start (Any, optional): Reads only rows with an index (first level)
+            greater or equal to `start`. Defaults to None.
+        stop (Any, optional): Reads only rows with an index (first level)
+            less or equal to `stop`. Defaults to None.
+        memory_map (bool, optional): Memory-maps uncompressed Feather files,
+            such that numeric columns without missing values are not copied
+            but reference the (read-only) pages of the file, which are read
+            on first access. Ignored for Parquet files. Defaults to False.
+
+    Returns:
+        pd.DataFrame: The data frame (pint columns are restored).
+    """
+    import pyarrow as pa
+
+    if format == 'feather':
+        schema, batches = _read_record_batches(
+            filename, columns, start, stop, memory_map
+        )
+        tables = list(batches)
+        table = pa.concat_tables(tables) if tables else schema.empty_table()
+    else:
+        dataset = _open_dataset(filename, format)
+        schema = dataset.schema
+        table = dataset.to_table(**_scan_options(schema, columns, start, stop))
+    return _from_table(table.replace_schema_metadata(schema.metadata), memory_map)
+
+
+def iter_columnar(
+    filename: str | os.PathLike,
+    format: ColumnarFormat,
+    columns: Optional[List[str]] = None,
+    start: Any = None,
+    stop: Any = None,
+    memory_map: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """Reads a file written by `write_columnar` chunk by chunk (see
+    `read_columnar`).
+    """
+    import pyarrow as pa
+
+    if format == 'feather':
+        schema, tables = _read_record_batches(
+            filename, columns, start, stop, memory_map
+        )
+    else:
+        dataset = _open_dataset(filename, format)
+        schema = dataset.schema
+        tables = (
+            pa.Table.from_batches([batch])
+            for batch in dataset.to_batches(
+                **_scan_options(schema, columns, start, stop)
+            )
+        )
+
+    for table in tables:
+        if table.num_rows > 0:
+            yield _from_table(
+                table.replace_schema_metadata(schema.metadata), memory_map
+            )
+
+
+def read_columnar_metadata(
+    filename: str | os.PathLike, format: ColumnarFormat
+) -> Dict[str, str]:
+    """Reads the key-value metadata of a file written by `write_columnar`
+    (without reading any data).
+    """
+    metadata = _open_dataset(filename, format).schema.metadata or {}
+    return {
+        key.decode('utf-8'): value.decode('utf-8') for key, value in metadata.items()
+    }
+
+
+def _to_table(df: pd.DataFrame, schema):
+    import pyarrow as pa
+
+    # pint columns are stored as magnitudes (without copying them)
+    frame = pd.DataFrame(
+        {
+            index: (
+                magnitudes(df.iloc[:, index])
+                if isinstance(df.dtypes.iloc[index], pint_pandas.PintType)
+                else df.iloc[:, index]
+            )
+            for index in range(df.shape[1])
+        },
+        index=df.index,
+        copy=False,
+    )
+    frame.columns = df.columns
+    return pa.Table.from_pandas(frame, schema=schema, preserve_index=True)
+
+
+def _from_table(table, zero_copy: bool = False) -> pd.DataFrame:
+    metadata = json.loads(
+        (table.schema.metadata or {}).get(METADATA_KEY.encode('utf-8'), b'{}'),
+        object_hook=_decode_attr,
+    )
+    units = metadata.get('units', {})
+
+    # columns are kept in separate blocks (instead of being consolidated),
+    # such that they can reference the buffers of the table
+    df = table.to_pandas(split_blocks=zero_copy)
+    if units:
+        quantified = pd.DataFrame(
+            {
+                index: (
+                    pint_array(df.iloc[:, index], units[str(label)])
+                    if str(label) in units
+                    else df.iloc[:, index]
+                )
+                for index, label in enumerate(df.columns)
+            },
+            index=df.index,
+            copy=False,
+        )
+        quantified.columns = df.columns
+        df = quantified
+    df.attrs.update(metadata.get('attrs', {}))
+    return df
+
+
+def _encode_metadata(df: pd.DataFrame, metadata: Optional[Dict[str, str]]):
+    units = {
+        str(label): str(dtype.units)
+        for label, dtype in df.dtypes.items()
+        if isinstance(dtype, pint_pandas.PintType)
+    }
+    encoded = {
+        METADATA_KEY: json.dumps(
+            dict(units=units, attrs=df.attrs), default=_encode_attr
+        )
+    }
+    encoded.update(metadata or {})
+    return {
+        key.encode('utf-8'): value.encode('utf-8') for key, value in encoded.items()
+    }
+
+
+def _encode_attr(value: Any) -> Dict[str, Any]:
+    # timestamps, time deltas & arrays are tagged by their type (like the
+    # pickled attributes of HDF5 files, they are restored when reading)
+    if isinstance(value, datetime.datetime):
+        return {TYPE_KEY: 'timestamp', 'value': pd.Timestamp(value).isoformat()}
+    if isinstance(value, datetime.date):
+        return {TYPE_KEY: 'date', 'value': value.isoformat()}
+    if isinstance(value, (datetime.timedelta, np.timedelta64)):
+        return {TYPE_KEY: 'timedelta', 'value': int(pd.Timedelta(value).value)}
+    if isinstance(value, np.datetime64):
+        return {TYPE_KEY: 'datetime64', 'value': str(value)}
+    if isinstance(value, np.ndarray) and (value.dtype.kind in 'biufU'):
+        return {TYPE_KEY: 'ndarray', 'dtype': value.dtype.str, 'value': value.tolist()}
+    if isinstance(value, np.generic) and (value.dtype.kind in 'biufU'):
+        return value.item()
+    raise TypeError(
+        f'Cannot store attribute of type {type(value).__name__} in '
+        'Parquet/Feather files'
+    )
+
+
+def _decode_attr(value: Dict[str, Any]) -> Any:
+    match value.get(TYPE_KEY):
+        case 'timestamp':
+            return pd.Timestamp(value['value'])
+        case 'date':
+            return datetime.date.fromisoformat(value['value'])
+        case 'timedelta':
+            return pd.Timedelta(value['value'], unit='ns')
+        case 'datetime64':
+            return np.datetime64(value['value'])
+        case 'ndarray':
+            return np.asarray(value['value'], dtype=value['dtype'])
+    return value
+
+
+def _open_writer(filename, format: ColumnarFormat, schema, compression, options):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    match format:
+        case 'parquet':
+            return pq.ParquetWriter(
+                filename, schema, compression=compression or 'snappy', **options
+            )
+        case 'feather':
+            return pa.ipc.new_file(
+                filename,
+                schema,
+                options=pa.ipc.IpcWriteOptions(compression=compression),
+            )
+        case _:
+            raise ValueError(f'Unsupported format: {format}')
+
+
+def _open_dataset(filename: str | os.PathLike, format: ColumnarFormat):
+    import pyarrow.dataset as ds
+
+    if format not in ('parquet', 'feather'):
+        raise ValueError(f'Unsupported format: {format}')
+    return ds.dataset(os.fspath(filename), format=format)
+
+
+def _read_record_batches(
+    filename: str | os.PathLike,
+    columns: Optional[List[str]],
+    start: Any,
+    stop: Any,
+    memory_map: bool,
+):
+    # the record batches of a Feather file are read as written (datasets would
+    # split them into smaller batches, which are copied when concatenated)
+    import pyarrow as pa
+
+    source = (
+        pa.memory_map(os.fspath(filename))
+        if memory_map
+        else pa.OSFile(os.fspath(filename))
+    )
+    reader = pa.ipc.open_file(source)
+    options = _scan_options(reader.schema, columns, start, stop)
+    schema = reader.schema
+    if 'columns' in options:
+        schema = pa.schema(
+            [schema.field(name) for name in options['columns']],
+            metadata=schema.metadata,
+        )
+
+    def read_tables():
+        with source:
+            for index in range(reader.num_record_batches):
+                table = pa.Table.from_batches([reader.get_batch(index)])
+                if 'columns' in options:
+                    table = table.select(options['columns'])
+                if 'filter' in options:
+                    table = table.filter(options['filter'])
+                yield table
+
+    return schema, read_tables()
+
+
+def _scan_options(schema, columns: Optional[List[str]], start: Any, stop: Any):
+    import pyarrow.dataset as ds
+
+    index_columns = [
+        name
+        for name in (schema.pandas_metadata or {}).get('index_columns', [])
+        if isinstance(name, str)
+    ]
+
+    options: Dict[str, Any] = {}
+    if columns is not None:
+        # the index is always read
+        options['columns'] = index_columns + [
+            str(column) for column in columns if str(column) not in index_columns
+        ]
+
+    if ((start is not None) or (stop is not None)) and index_columns:
+        # skips row groups by their statistics (Parquet)
+        field = ds.field(index_columns[0])
+        dtype = schema.field(index_columns[0]).type
+        conditions = []
+        if start is not None:
+            conditions.append(field >= _scalar(start, dtype))
+        if stop is not None:
+            conditions.append(field <= _scalar(stop, dtype))
+        options['filter'] = functools.reduce(operator.and_, conditions)
+    return options
+
+
+def _scalar(value: Any, dtype):
+    import pyarrow as pa
+
+    if pa.types.is_timestamp(dtype):
+        value = pd.Timestamp(value)
+        if (value.tzinfo is None) and (dtype.tz is not None):
+            value = value.tz_localize(dtype.tz)
+    return pa.scalar(value).cast(dtype)
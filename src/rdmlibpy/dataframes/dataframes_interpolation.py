@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pint_pandas
+from pandas.api.types import is_datetime64_any_dtype
+
+from .dataframes_units import magnitudes, pint_array
+
+# Linear interpolation of missing values (NaN) of many columns at once. The
+# columns are grouped by their pattern of missing values, such that the
+# neighbours and weights of the missing values are computed once per group and
+# all columns of a group are interpolated by a single operation on a float64
+# block. Columns without missing values are kept as they are. Columns can also
+# be evaluated at another index (e.g. the index of another data frame).
+
+
+def index_to_float(index: pd.Index, origin: Any = None) -> np.ndarray:
+    """Converts an index to float64 values, on which columns are interpolated.
+
+    Datetime indices (of any unit, including Arrow-backed timestamps) are
+    converted to seconds relative to `origin`.
+
+    Args:
+        index (pd.Index): The (sorted) index.
+        origin (Any, optional): The origin of datetime indices. Defaults to
+            None (the first value of the index).
+
+    Returns:
+        np.ndarray: The float64 values.
+    """
+    if is_datetime64_any_dtype(index.dtype):
+        nanoseconds = pd.DatetimeIndex(index).as_unit('ns').asi8
+        if origin is not None:
+            start = pd.Timestamp(origin).value
+        elif len(nanoseconds) > 0:
+            start = nanoseconds[0]
+        else:
+            return np.empty(0, dtype=np.float64)
+        return (nanoseconds - start) * 1e-9
+    return np.asarray(index, dtype=np.float64)
+
+
+def interpolate_columns(
+    df: pd.DataFrame,
+    columns: Optional[Iterable[int]] = None,
+    x: Optional[np.ndarray] = None,
+) -> pd.DataFrame:
+    """Interpolates missing values of numeric (and pint) columns linearly on
+    the index (like `np.interp`).
+
+    Missing values before the first (after the last) valid value are filled
+    with the first (last) valid value. Columns without any valid value are
+    left as they are. Interpolated pint columns keep their units (as float64
+    magnitudes).
+
+    Args:
+        df (pd.DataFrame): The data frame (with a sorted index).
+        columns (Optional[Iterable[int]], optional): Positions of the columns
+            to interpolate. Defaults to None (all columns).
+        x (Optional[np.ndarray], optional): The float64 values of the index
+            (see `index_to_float`). Defaults to None (computed from the
+            index).
+
+    Returns:
+        pd.DataFrame: A data frame with the interpolated columns (other
+        columns are not copied).
+    """
+    if x is None:
+        x = index_to_float(df.index)
+    series = [column for _, column in df.items()]
+    values, groups = _group_by_missing_values(series, columns)
+
+    interpolated: Dict[int, np.ndarray] = {}
+    for isnan, members in groups:
+        valid = np.flatnonzero(~isnan)
+        missing = np.flatnonzero(isnan)
+        if (len(missing) == 0) or (len(valid) == 0):
+            continue
+
+        lower, upper, weight = _neighbours(x, valid, x[missing])
+        block = np.stack([values[position] for position in members])
+        out = np.empty_like(weight)
+        buffer = np.empty_like(weight)
+        for row in block:
+            _interpolate_row(row, lower, upper, weight, out, buffer)
+            row[missing] = out
+        interpolated.update(zip(members, block))
+
+    # re-attach units (other columns are kept as they are)
+    result = pd.DataFrame(
+        dict(enumerate(_restore_units(series, interpolated))),
+        index=df.index,
+        copy=False,
+    )
+    result.columns = df.columns
+    result.attrs.update(df.attrs)
+    return result
+
+
+def interpolate_onto(
+    df: pd.DataFrame,
+    index: pd.Index,
+    columns: Optional[Iterable[int]] = None,
+) -> pd.DataFrame:
+    """Evaluates numeric (and pint) columns at another index by linear
+    interpolation (like `np.interp`), ignoring missing values.
+
+    Values before the first (after the last) valid value are the first (last)
+    valid value. Columns without any valid value are NaN. The memory required
+    is proportional to the size of the result (not to the size of `df`).
+
+    Args:
+        df (pd.DataFrame): The data frame (with a sorted index).
+        index (pd.Index): The index, at which the columns are evaluated.
+        columns (Optional[Iterable[int]], optional): Positions of the columns
+            to evaluate. Defaults to None (all columns).
+
+    Returns:
+        pd.DataFrame: A data frame with the given index and the evaluated
+        columns (pint columns keep their units as float64 magnitudes).
+    """
+    origin = df.index[0] if len(df.index) > 0 else None
+    x = index_to_float(df.index, origin)
+    xq = index_to_float(index, origin)
+    series = [column for _, column in df.items()]
+    values, groups = _group_by_missing_values(series, columns)
+
+    evaluated: Dict[int, np.ndarray] = {}
+    for isnan, members in groups:
+        block = np.empty((len(members), len(xq)), dtype=np.float64)
+        valid = np.flatnonzero(~isnan)
+        if len(valid) == 0:
+            block.fill(np.nan)
+        else:
+            lower, upper, weight = _neighbours(x, valid, xq)
+            buffer = np.empty_like(weight)
+            for position, row in zip(members, block):
+                _interpolate_row(values[position], lower, upper, weight, row, buffer)
+        evaluated.update(zip(members, block))
+
+    positions = list(values)
+    restored = _restore_units(series, evaluated)
+    result = pd.DataFrame(
+        {i: restored[position] for i, position in enumerate(positions)},
+        index=index,
+        copy=False,
+    )
+    result.columns = df.columns[positions]
+    return result
+
+
+def _float_values(column: pd.Series) -> np.ndarray:
+    # magnitudes as float64 (without copying float64 columns)
+    values = magnitudes(column)
+    if isinstance(values, np.ndarray):
+        return np.asarray(values, dtype=np.float64)
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _group_by_missing_values(
+    series: List[pd.Series], columns: Optional[Iterable[int]]
+) -> Tuple[Dict[int, np.ndarray], List[Tuple[np.ndarray, List[int]]]]:
+    # float64 values of columns (by position) & groups of columns with
+    # identical missing values
+    positions = range(len(series)) if columns is None else columns
+    values: Dict[int, np.ndarray] = {}
+    groups: Dict[bytes, Tuple[np.ndarray, List[int]]] = {}
+    for position in positions:
+        values[position] = _float_values(series[position])
+        isnan = np.isnan(values[position])
+        key = np.packbits(isnan).tobytes()
+        groups.setdefault(key, (isnan, []))[1].append(position)
+    return values, list(groups.values())
+
+
+def _neighbours(x: np.ndarray, valid: np.ndarray, xq: np.ndarray):
+    # positions of the valid values enclosing `xq` & the weights of the upper
+    # values (clipped, such that values are not extrapolated)
+    if len(valid) == 1:
+        position = np.full(len(xq), valid[0])
+        return position, position, np.zeros(len(xq), dtype=np.float64)
+
+    xp = x[valid]
+    upper = np.clip(np.searchsorted(xp, xq, side='right'), 1, len(valid) - 1)
+    lower = valid[upper - 1]
+    upper = valid[upper]
+    dx = x[upper] - x[lower]
+    weight = np.divide(xq - x[lower], dx, out=np.ones_like(dx), where=dx != 0)
+    np.clip(weight, 0.0, 1.0, out=weight)
+    return lower, upper, weight
+
+
+def _interpolate_row(
+    row: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    weight: np.ndarray,
+    out: np.ndarray,
+    buffer: np.ndarray,
+):
+    # gathers from a contiguous row (reusing the buffers of all rows)
+    np.take(row, lower, out=out)
+    np.take(row, upper, out=buffer)
+    buffer -= out
+    buffer *= weight
+    out += buffer
+
+
+def _restore_units(series: List[pd.Series], values: Dict[int, np.ndarray]):
+    # columns with new values (units are parsed once per dtype)
+    units: Dict[Any, str] = {}
+    columns: List[Any] = list(series)
+    for position, magnitude in values.items():
+        dtype = series[position].dtype
+        if isinstance(dtype, pint_pandas.PintType):
+            if dtype not in units:
+                units[dtype] = str(dtype.units)
+            columns[position] = pint_array(magnitude, units[dtype])
+        else:
+            columns[position] = magnitude
+    return columns
@@ -1,22 +1,239 @@
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import datetime
+import functools
 import logging
+import operator
+import os
+import pickle
+import re
+import tempfile
 import textwrap
+import weakref
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, cast
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 import numpy as np
 import pandas as pd
-import pandas.arrays
-import pint_pandas
-import pint_pandas.pint_array
 import pydantic
 from omegaconf import OmegaConf
+from pandas.api.types import is_datetime64_any_dtype
 
+from .._hashing import fingerprint
 from .._typing import FilePath, ReadCsvBuffer, WriteBuffer
-from ..process import Cache, Loader, Writer
+from ..process import Cache, CacheManifest, Loader, Writer
+from ..timespan import Timespan
+from .dataframes_columnar import (
+    ColumnarFormat,
+    iter_columnar,
+    read_columnar,
+    read_columnar_metadata,
+    write_columnar,
+)
+from .dataframes_streaming import DataFrameStream
+from .dataframes_units import dequantify, magnitudes, quantify
 
 logger = logging.getLogger(__name__)
 
 ParseDatesType = None | List[str] | Dict[str, List[str]]
+CSVEngine = Literal['c', 'python', 'pyarrow']
+DTypeBackend = Literal['numpy_nullable', 'pyarrow']
+CacheFormat = Literal['HDF5'] | ColumnarFormat
+
+# key of the metadata holding the manifest of cached data
+MANIFEST_KEY = 'rdmlibpy_manifest'
+
+# maximum number of file time ranges remembered (see `DataFrameReadCSVBase`)
+MAX_TIME_RANGES = 4096
+
+# `pd.read_csv` options (and their default values) not supported by the pyarrow
+# engine; the C engine is used instead if any of them is set
+PYARROW_UNSUPPORTED_OPTIONS: Dict[str, Any] = dict(
+    decimal='.',
+    thousands=None,
+    chunksize=None,
+    iterator=False,
+    nrows=None,
+    skipfooter=0,
+    comment=None,
+    converters=None,
+    dialect=None,
+    quoting=0,
+    lineterminator=None,
+    float_precision=None,
+    skipinitialspace=False,
+    low_memory=True,
+    skiprows=None,  # skipped rows must have as many fields as the header
+)
+
+
+# time formats (and their decimal separator) supported by `parse_time_of_day`
+TIME_OF_DAY_FORMATS: Dict[str, Optional[str]] = {
+    '%H:%M:%S': None,
+    '%H:%M:%S,%f': ',',
+    '%H:%M:%S.%f': '.',
+}
+
+
+def parse_time_of_day(values: pd.Series, decimal: Optional[str] = None):
+    """Parses time strings with the fixed layout `HH:MM:SS[<decimal>fffffffff]`
+    (1 to 9 fractional digits) using vectorized operations on the character
+    codes.
+
+    Args:
+        values (pd.Series): The time strings.
+        decimal (Optional[str], optional): Separator of the fractional seconds.
+            If None, times must not have fractional seconds. Defaults to None.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Nanoseconds since midnight and a mask of
+        the values matching the layout (other values are set to zero).
+    """
+    text = values.to_numpy(dtype=str)
+    width = text.dtype.itemsize // 4
+    if (len(text) == 0) or (width < 8):
+        return np.zeros(len(text), dtype=np.int64), np.zeros(len(text), dtype=bool)
+
+    # unicode code points (strings are zero padded to the same width)
+    codes = text.view(np.uint32).reshape(len(text), width).astype(np.int64)
+
+    digits = codes[:, [0, 1, 3, 4, 6, 7]] - ord('0')
+    valid = ((digits >= 0) & (digits <= 9)).all(axis=1)
+    valid &= (codes[:, 2] == ord(':')) & (codes[:, 5] == ord(':'))
+    hours = 10 * digits[:, 0] + digits[:, 1]
+    minutes = 10 * digits[:, 2] + digits[:, 3]
+    seconds = 10 * digits[:, 4] + digits[:, 5]
+    valid &= (hours < 24) & (minutes < 60) & (seconds < 60)
+    nanoseconds = ((hours * 60 + minutes) * 60 + seconds) * 1_000_000_000
+
+    if decimal is None:
+        if width > 8:
+            valid &= codes[:, 8] == 0
+    elif width < 10:
+        valid[:] = False
+    else:
+        # separator followed by 1 to 9 digits and zero padding
+        fraction = codes[:, 9:18] - ord('0')
+        is_digit = (fraction >= 0) & (fraction <= 9)
+        count = is_digit.sum(axis=1)
+        valid &= codes[:, 8] == ord(decimal)
+        valid &= count > 0
+        valid &= (is_digit == (np.arange(fraction.shape[1]) < count[:, None])).all(
+            axis=1
+        )
+        valid &= ((fraction == -ord('0')) | is_digit).all(axis=1)
+        valid &= (codes[:, 18:] == 0).all(axis=1)
+        scale = 10 ** np.arange(8, 8 - fraction.shape[1], -1)
+        nanoseconds += (np.where(is_digit, fraction, 0) * scale).sum(axis=1)
+
+    return np.where(valid, nanoseconds, 0), valid
+
+
+def to_datetime64(values: pd.Series) -> pd.Series:
+    """Converts Arrow-backed timestamps (e.g. parsed by the pyarrow engine) to
+    `datetime64[ns]` (keeping the time zone), such that downstream transforms
+    see the same dtype for all CSV engines.
+
+    Args:
+        values (pd.Series): The timestamps.
+
+    Returns:
+        pd.Series: The converted timestamps (other values are returned as they
+        are).
+    """
+    if isinstance(values.dtype, pd.ArrowDtype) and is_datetime64_any_dtype(
+        values.dtype
+    ):
+        tz = getattr(values.dtype.pyarrow_dtype, 'tz', None)
+        return values.astype(
+            pd.DatetimeTZDtype('ns', tz) if tz else np.dtype('datetime64[ns]')
+        )
+    return values
+
+
+ISO_TIMESTAMP_PATTERN = re.compile(
+    r'\d{4}-\d{2}-\d{2}'
+    r'(?:(?P<separator>[T ])(?P<time>\d{2}:\d{2}(?::\d{2})?)(?P<fraction>\.\d+)?)?'
+    r'(?P<offset>Z|[+-]\d{2}(?::?\d{2})?)?'
+)
+
+
+class TimestampLayout(pydantic.BaseModel, frozen=True):
+    """Layout of ISO 8601 timestamps (as sniffed from a sample value).
+
+    Timestamps sharing a layout are parsed with an explicit format, which
+    avoids the per-value format detection of `format='ISO8601'`. A constant
+    UTC offset is stripped before parsing and attached to the result
+    afterwards.
+    """
+
+    format: str
+    offset: str = ''
+
+    @classmethod
+    def sniff(cls, value: Any) -> Optional[TimestampLayout]:
+        """Determines the layout of a timestamp string.
+
+        Args:
+            value (Any): The sample value.
+
+        Returns:
+            Optional[TimestampLayout]: The layout or None, if the value is not
+            an ISO 8601 timestamp with a supported layout.
+        """
+        if not isinstance(value, str):
+            return None
+        match = ISO_TIMESTAMP_PATTERN.fullmatch(value)
+        if match is None:
+            return None
+
+        format = '%Y-%m-%d'
+        if match['time'] is not None:
+            format += match['separator']
+            format += '%H:%M:%S' if len(match['time']) == 8 else '%H:%M'
+        if match['fraction'] is not None:
+            format += '.%f'
+        return cls(format=format, offset=match['offset'] or '')
+
+    @property
+    def tzinfo(self) -> Optional[datetime.tzinfo]:
+        if not self.offset:
+            return None
+        elif self.offset == 'Z':
+            return datetime.timezone.utc
+        sign = -1 if self.offset[0] == '-' else 1
+        digits = self.offset[1:].replace(':', '')
+        minutes = 60 * int(digits[:2]) + int(digits[2:] or 0)
+        return datetime.timezone(sign * datetime.timedelta(minutes=minutes))
+
+    def parse(self, values: pd.Series) -> pd.Series:
+        """Parses timestamps (values deviating from the layout are set to NaT).
+
+        Args:
+            values (pd.Series): The timestamp strings.
+
+        Returns:
+            pd.Series: The parsed timestamps.
+        """
+        if self.offset:
+            has_offset = values.str.endswith(self.offset).fillna(False)
+            values = values.where(has_offset).str[: -len(self.offset)]
+        dt = pd.to_datetime(values, format=self.format, errors='coerce', cache=False)
+        if self.offset:
+            dt = dt.dt.tz_localize(self.tzinfo)
+        return dt
 
 
 class DataFrameReadCSVBase(Loader):
@@ -28,11 +245,52 @@ class DataFrameReadCSVBase(Loader):
     parse_dates: ParseDatesType = None
     encoding: str = 'utf-8'
     thousands: Optional[str] = None
+    chunksize: Optional[int] = None
+    workers: int = 1
+    executor: Literal['threads', 'processes'] = 'threads'
+    engine: Optional[CSVEngine] = None
+    dtype_backend: Optional[DTypeBackend] = None
+    # format of the timestamps in file names (e.g. '%Y%m%dT%H%M%S'); if set,
+    # files are skipped by name when reading within a time window (set by the
+    # loaders of data loggers, which name files by their first record)
+    filename_timestamp: Optional[str] = None
+
+    # timestamp layouts by column (sniffed once per glob; see `_to_datetime`)
+    _timestamp_layouts: Dict[Any, Optional[TimestampLayout]] = pydantic.PrivateAttr(
+        default_factory=dict
+    )
 
-    def run(self, source: FilePath | ReadCsvBuffer, **kwargs):
-        if isinstance(source, FilePath):
+    # first & last timestamps of files read within a time window (indexed by
+    # the configuration of the loader, path, size, modification time &
+    # column); used to skip files later on (least recently used ranges are
+    # dropped beyond `MAX_TIME_RANGES`)
+    _time_ranges: ClassVar[
+        collections.OrderedDict[Tuple[str, str, int, int, str], Tuple[Any, Any]]
+    ] = collections.OrderedDict()
+
+    def run(
+        self,
+        source: FilePath | ReadCsvBuffer,
+        timespan: Optional[Mapping[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        **kwargs,
+    ):
+        self._timestamp_layouts.clear()
+        if (columns is not None) and ('usecols' not in (self.options | kwargs)):
+            kwargs['usecols'] = self._usecols(columns)
+        window = None if timespan is None else Timespan.model_validate(timespan)
+        if self.chunksize is not None:
+            # streaming mode: read files lazily in chunks of bounded size
+            return DataFrameStream(lambda: self._iter_chunks(source, window, **kwargs))
+        elif isinstance(source, FilePath):
             # load using filename (possible a glob pattern)
-            data = [self._read_csv(path, **kwargs) for path in Loader.glob(source)]
+            if window is None:
+                data = self._read_files(Loader.glob(source), **kwargs)
+            else:
+                paths = self._select_files(Loader.glob(source), window)
+                data = self._read_files(paths, **kwargs)
+                for path, df in zip(paths, data):
+                    self._record_time_range(path, window.column, df)
             if self.concatenate:
                 data = pd.concat(data)
             return data
@@ -40,6 +298,112 @@ class DataFrameReadCSVBase(Loader):
             # load from text buffer (e.g. file buffer or StringIO)
             return self._read_csv(source, **kwargs)
 
+    def _read_files(self, paths: Iterable[Path], **kwargs) -> List[pd.DataFrame]:
+        if self.workers <= 1:
+            return [self._read_csv(path, **kwargs) for path in paths]
+
+        # parse files concurrently (keeping the order of the files)
+        match self.executor:
+            case 'threads':
+                pool = concurrent.futures.ThreadPoolExecutor(self.workers)
+            case 'processes':
+                pool = concurrent.futures.ProcessPoolExecutor(self.workers)
+            case _:
+                raise ValueError(f'Invalid executor: {self.executor}')
+        with pool:
+            # files are submitted while the glob is still expanded (duplicate
+            # paths are loaded repeatedly, as in the serial case)
+            futures = [
+                (path, pool.submit(self._read_csv, path, **kwargs)) for path in paths
+            ]
+            concurrent.futures.wait([future for _, future in futures])
+
+        failures = [
+            (path, future.exception())
+            for path, future in futures
+            if future.exception() is not None
+        ]
+        if failures:
+            # report all failures, but raise the error of the first failing
+            # file (like the serial case)
+            messages = '\n'.join(f'  {path}: {exc!r}' for path, exc in failures)
+            logger.error(
+                f'Failed to load {len(failures)} of {len(futures)} files:\n{messages}'
+            )
+            raise failures[0][1]  # type: ignore
+        return [future.result() for _, future in futures]
+
+    def _usecols(self, columns: List[str]):
+        # parse the selected columns and the columns required to parse dates
+        # (columns missing from a file are ignored)
+        required = set(columns)
+        match self.parse_dates:
+            case [*column_names]:
+                required.update(column_names)
+            case {**nested}:
+                for column_names in nested.values():
+                    required.update(column_names)
+        return functools.partial(operator.contains, frozenset(required))
+
+    def _select_files(self, paths: Iterable[Path], timespan: Timespan) -> List[Path]:
+        # skip files outside of the time window (judged by the timestamps in
+        # the file names or the ranges of previous reads)
+        paths = list(paths)
+        ranges = {}
+        for path in paths:
+            key = self._time_range_key(path, timespan.column)
+            if key in self._time_ranges:
+                self._time_ranges.move_to_end(key)
+                ranges[path] = self._time_ranges[key]
+
+        selected = timespan.select_files(paths, self.filename_timestamp, ranges)
+        if paths and not selected:
+            # keep a single file (providing the columns of the empty selection)
+            selected = paths[:1]
+        if len(selected) < len(paths):
+            logger.info(
+                f'Skipping {len(paths) - len(selected)} of {len(paths)} files '
+                f'outside of [{timespan.start}, {timespan.stop}]'
+            )
+        return selected
+
+    def _time_range_key(self, path: Path, column: str):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        # ranges depend on how timestamps are parsed (e.g. `date_format`)
+        config = fingerprint(dict(name=self.fullname, config=self.get_config()))
+        return (config, str(path), stat.st_size, stat.st_mtime_ns, column)
+
+    def _record_time_range(self, path: Path, column: str, df: pd.DataFrame):
+        if (column not in df.columns) or not is_datetime64_any_dtype(df[column]):
+            return
+        first, last = df[column].min(), df[column].max()
+        key = self._time_range_key(path, column)
+        if (key is not None) and pd.notna(first) and pd.notna(last):
+            self._time_ranges[key] = (first, last)
+            self._time_ranges.move_to_end(key)
+            while len(self._time_ranges) > MAX_TIME_RANGES:
+                self._time_ranges.popitem(last=False)
+
+    def _iter_chunks(
+        self,
+        source: FilePath | ReadCsvBuffer,
+        timespan: Optional[Timespan] = None,
+        **kwargs,
+    ):
+        if not isinstance(source, FilePath):
+            sources = [source]
+        elif timespan is not None:
+            sources = self._select_files(Loader.glob(source), timespan)
+        else:
+            sources = Loader.glob(source)
+        for item in sources:
+            with self._load(item, chunksize=self.chunksize, **kwargs) as reader:
+                for chunk in reader:
+                    yield self._parse_dates(chunk)
+
     def _read_csv(self, source: FilePath | ReadCsvBuffer, **kwargs):
         df = self._load(source, **kwargs)
         df = self._parse_dates(df)
@@ -54,6 +418,29 @@ class DataFrameReadCSVBase(Loader):
         else:
             logger.info('Reading CSV data from text buffer')
 
+        options = self._read_csv_options(**kwargs)
+        if (options.get('engine') == 'pyarrow') and callable(options.get('usecols')):
+            options['usecols'] = self._resolve_usecols(source, options)
+
+        # load csv data & return
+        return pd.read_csv(source, **options)  # type: ignore
+
+    @staticmethod
+    def _resolve_usecols(source: FilePath | ReadCsvBuffer, options: Dict[str, Any]):
+        # the pyarrow engine requires a list of the columns (e.g. of pushed-down
+        # column selections): select the matching columns of the header
+        usecols = options['usecols']
+        header_options = dict(options, engine='c', usecols=None, nrows=0)
+        header_options.pop('dtype_backend', None)
+        if isinstance(source, FilePath):
+            header = pd.read_csv(source, **header_options)  # type: ignore
+        else:
+            position = source.tell()
+            header = pd.read_csv(source, **header_options)  # type: ignore
+            source.seek(position)
+        return [column for column in header.columns if usecols(column)]
+
+    def _read_csv_options(self, **kwargs) -> Dict[str, Any]:
         # merge process configuration with runtime keyword arguments
         options = dict(
             sep=self.separator,
@@ -62,10 +449,31 @@ class DataFrameReadCSVBase(Loader):
             thousands=self.thousands,
             **self.options,
         )
+        if self.engine is not None:
+            options['engine'] = self.engine
+        if self.dtype_backend is not None:
+            options['dtype_backend'] = self.dtype_backend
         options |= kwargs
 
-        # load csv data & return
-        return pd.read_csv(source, **options)  # type: ignore
+        if options.get('engine') == 'pyarrow':
+            # Arrow-backed columns unless requested otherwise
+            options.setdefault('dtype_backend', 'pyarrow')
+
+            # fall back to the C engine for options the pyarrow engine lacks
+            # (e.g. `decimal=','`); the dtype backend is kept
+            unsupported = [
+                key
+                for key, default in PYARROW_UNSUPPORTED_OPTIONS.items()
+                if options.get(key, default) != default
+            ]
+            if unsupported:
+                logger.debug(
+                    'Falling back to the C engine (pyarrow engine does not '
+                    f'support: {", ".join(unsupported)})'
+                )
+                options['engine'] = 'c'
+
+        return options
 
     def _parse_dates(self, df: pd.DataFrame):
         if self.parse_dates is None:
@@ -91,11 +499,10 @@ class DataFrameReadCSVBase(Loader):
     def _parse_dates_joining_columns(
         self, df: pd.DataFrame, target_name: str, column_names: List[str]
     ):
-        def join_columns(column_names):
-            return df[column_names].astype(str).agg(' '.join, axis=1)
-
         # generate datetime series from columns
-        dt = self._to_datetime(join_columns(column_names))
+        dt = self._to_datetime_joining_columns([df[name] for name in column_names])
+
+        dt = to_datetime64(dt)
 
         # drop source columns
         df = df.drop(columns=column_names)
@@ -115,7 +522,7 @@ class DataFrameReadCSVBase(Loader):
             )
 
         # "pop" column & generate datetime series
-        dt = self._to_datetime(df.pop(column))
+        dt = to_datetime64(self._to_datetime(df.pop(column)))
 
         # insert new column at original index
         df.insert(index, column, dt)
@@ -123,19 +530,126 @@ class DataFrameReadCSVBase(Loader):
         return df
 
     def _to_datetime(self, df: pd.Series):
+        if (self.date_format == 'ISO8601') and (df.dtype == object):
+            return self._to_datetime_iso8601(df)
         return pd.to_datetime(df, format=self.date_format, errors='coerce')
 
+    def _to_datetime_iso8601(self, df: pd.Series):
+        # sniff the layout of the timestamps from the first file (of a glob;
+        # the layouts are shared by threads parsing files concurrently)
+        try:
+            layout = self._timestamp_layouts[df.name]
+        except KeyError:
+            sample = df.first_valid_index()
+            if sample is None:
+                return pd.to_datetime(df, format='ISO8601', errors='coerce')
+            layout = TimestampLayout.sniff(df[sample])
+            self._timestamp_layouts[df.name] = layout
+        if layout is None:
+            return pd.to_datetime(df, format='ISO8601', errors='coerce')
+
+        dt = layout.parse(df)
+
+        # fall back to the generic parser, if deviating values are valid
+        # ISO 8601 timestamps (e.g. using a different layout or UTC offset)
+        failed = dt.isna().to_numpy()
+        if failed.any() and (failed := failed & df.notna().to_numpy()).any():
+            fallback = pd.to_datetime(df[failed], format='ISO8601', errors='coerce')
+            if fallback.notna().any():
+                if failed.all():
+                    # sniff again for the next file
+                    self._timestamp_layouts.pop(df.name, None)
+                return pd.to_datetime(df, format='ISO8601', errors='coerce')
+        return dt
+
+    def _to_datetime_joining_columns(self, columns: List[pd.Series]):
+        first, *others = (column.astype(str) for column in columns)
+
+        date_format, _, time_format = self.date_format.rpartition(' ')
+        if (len(others) == 1) and date_format and (time_format in TIME_OF_DAY_FORMATS):
+            # fast path for separate date & time columns: dates repeat (and are
+            # cached by `pd.to_datetime`), times are parsed from a fixed layout
+            dt = pd.to_datetime(first, format=date_format, errors='coerce')
+            nanoseconds, valid = parse_time_of_day(
+                others[0], TIME_OF_DAY_FORMATS[time_format]
+            )
+            dt += nanoseconds.astype('timedelta64[ns]')
+
+            # rows deviating from the fixed layout are parsed in full
+            if not valid.all():
+                invalid = first[~valid].str.cat(others[0][~valid], sep=' ')
+                dt[~valid] = self._to_datetime(invalid).to_numpy()
+            return dt
+
+        return self._to_datetime(first.str.cat(others, sep=' '))
+
 
 class DataFrameReadCSV(DataFrameReadCSVBase):
     version: str = '1'
     name: str = 'dataframe.read.csv'
 
 
+def select_rows_and_columns(
+    df: pd.DataFrame,
+    columns: Optional[List[str]] = None,
+    start: Any = None,
+    stop: Any = None,
+) -> pd.DataFrame:
+    """Selects columns and rows by their index (like the reads of Parquet and
+    Feather caches; see `read_columnar`).
+
+    Args:
+        df (pd.DataFrame): The data frame.
+        columns (Optional[List[str]], optional): The columns. Defaults to None
+            (all columns).
+        start (Any, optional): Selects rows with an index (first level)
+            greater or equal to `start`. Defaults to None.
+        stop (Any, optional): Selects rows with an index (first level) less or
+            equal to `stop`. Defaults to None.
+
+    Returns:
+        pd.DataFrame: The selection (or `df`, if nothing is selected).
+    """
+    if columns is not None:
+        df = df[list(columns)]
+    if ((start is None) and (stop is None)) or isinstance(df.index, pd.RangeIndex):
+        # (range indices are not stored as columns of Parquet & Feather files)
+        return df
+    index = df.index.get_level_values(0)
+    mask = np.ones(len(df), dtype=bool)
+    if start is not None:
+        mask &= index >= _index_scalar(start, index)
+    if stop is not None:
+        mask &= index <= _index_scalar(stop, index)
+    return df if mask.all() else df[mask]
+
+
+def _index_scalar(value: Any, index: pd.Index):
+    if not is_datetime64_any_dtype(index.dtype):
+        return value
+    value = pd.Timestamp(value)
+    tz = getattr(index, 'tz', None)
+    if (value.tzinfo is None) and (tz is not None):
+        value = value.tz_localize(tz)
+    return value
+
+
 IndexHandling = bool | Literal['reset-named'] | Literal['reset']
+CSV_CONTINUATION = dict(header=False, attributes='discard')
 UnitHandling = Literal['auto', 'keep-units', 'dequantify']
 AttributesHandling = Literal['auto', 'discard']
 
 
+def _iter_spilled(filename: str):
+    # chunks pickled one after another (see `DataFrameWriteCSV`)
+    with open(filename, 'rb') as fp:
+        while True:
+            try:
+                yield pickle.load(fp)
+            except EOFError:
+                return
+
+
 class DataFrameWriteCSV(Writer):
     name: str = 'dataframe.write.csv'
     version: str = '1'
@@ -150,7 +664,7 @@ class DataFrameWriteCSV(Writer):
 
     def run(
         self,
-        source: pd.DataFrame,
+        source: pd.DataFrame | DataFrameStream,
         filename: FilePath | WriteBuffer[str] | WriteBuffer[bytes],
         **kwargs,
     ):
@@ -161,13 +675,41 @@ class DataFrameWriteCSV(Writer):
         if isinstance(filename, FilePath):
             filename = self.ensure_path(filename)
             with open(filename, 'w', encoding='utf-8', newline='\n') as buffer:
-                self._write(source, buffer, **kwargs)
+                written = self._write_any(source, buffer, **kwargs)
         else:
             buffer = filename
-            self._write(source, buffer, **kwargs)
+            written = self._write_any(source, buffer, **kwargs)
 
-        # return unaltered data as input for the next process
-        return input
+        # return unaltered data as input for the next process (the chunks of a
+        # consumed stream are passed on as they were written)
+        return input if written is None else written
+
+    def _write_any(
+        self,
+        source: pd.DataFrame | DataFrameStream,
+        buffer: WriteBuffer[str] | WriteBuffer[bytes],
+        **kwargs,
+    ) -> Optional[DataFrameStream]:
+        if not isinstance(source, DataFrameStream):
+            self._write(source, buffer, **kwargs)
+            return None
+
+        # append chunks (header & attributes are written with the first chunk);
+        # the unaltered chunks are spilled to a temporary file, such that the
+        # sources of the stream are not read again downstream
+        fd, spill = tempfile.mkstemp(suffix='.pickle')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                for index, chunk in enumerate(source):
+                    options = kwargs if index == 0 else kwargs | CSV_CONTINUATION
+                    self._write(chunk, buffer, **options)
+                    pickle.dump(chunk, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        except BaseException:
+            os.remove(spill)
+            raise
+        stream = DataFrameStream(lambda: _iter_spilled(spill))
+        weakref.finalize(stream, os.remove, spill)
+        return stream
 
     def _write(
         self,
@@ -189,7 +731,7 @@ class DataFrameWriteCSV(Writer):
         # promote units to multi-index header
         match kwargs.pop('units', self.units):
             case 'auto':
-                if not source.select_dtypes('pint[]').empty:  # type: ignore
+                if len(source.select_dtypes('pint[]').columns) > 0:  # type: ignore
                     source = dequantify(source)
             case 'dequantify':
                 source = dequantify(source)
@@ -224,95 +766,227 @@ class DataFrameWriteCSV(Writer):
 class DataFrameFileCache(Cache):
     name: str = 'dataframe.cache'
     version: str = '1'
+    hash_files: bool = False
+    stream: bool = False
+    format: CacheFormat = 'HDF5'
+    # memory-map Feather caches (columns reference the read-only file pages)
+    memory_map: bool = False
+    uses_manifest: ClassVar[bool] = True
+
+    def read(
+        self,
+        filename: FilePath,
+        rebuild: bool = False,
+        columns: Optional[List[str]] = None,
+        start: Any = None,
+        stop: Any = None,
+        **kwargs,
+    ):
+        """Reads the cached data frame.
+
+        Args:
+            filename (FilePath): The cache file.
+            rebuild (bool, optional): Ignored. Defaults to False.
+            columns (Optional[List[str]], optional): Reads only these columns
+                (and the index). Defaults to None (all columns).
+            start (Any, optional): Reads only rows with an index (first level)
+                greater or equal to `start`. Defaults to None.
+            stop (Any, optional): Reads only rows with an index (first level)
+                less or equal to `stop`. Defaults to None.
+
+        Returns:
+            pd.DataFrame | DataFrameStream: The cached data (a stream, if
+            `stream` is set). Parquet & Feather caches skip the columns and
+            row groups outside of the selection; HDF5 caches are selected
+            after reading them.
+        """
+        selection = dict(columns=columns, start=start, stop=stop)
+        if self.stream:
+            # load chunks lazily
+            return DataFrameStream(lambda: self._iter_cached(filename, **selection))
+        chunks = list(self._iter_cached(filename, **selection))
+        if not chunks:
+            # all row groups are outside of the selection
+            return read_columnar(
+                filename, self.format, memory_map=self.memory_map, **selection
+            )
+        if len(chunks) == 1:
+            return chunks[0]
+        cached = pd.concat(chunks)
+        cached.attrs.update(chunks[0].attrs)
+        return cached
+
+    def written(
+        self,
+        source,
+        filename: FilePath,
+        columns: Optional[List[str]] = None,
+        start: Any = None,
+        stop: Any = None,
+        **kwargs,
+    ):
+        selection = dict(columns=columns, start=start, stop=stop)
+        if isinstance(source, DataFrameStream):
+            # streams are consumed by writing them: pass on the cached chunks
+            # (instead of reading the sources of the stream again)
+            return DataFrameStream(lambda: self._iter_cached(filename, **selection))
+        # (the selection of cache hits applies to cache misses as well)
+        return select_rows_and_columns(source, **selection)
+
+    def _iter_cached(
+        self,
+        filename: FilePath,
+        columns: Optional[List[str]] = None,
+        start: Any = None,
+        stop: Any = None,
+    ):
+        if self.format != 'HDF5':
+            # row groups of Parquet files (record batches of Feather files)
+            yield from iter_columnar(
+                filename,
+                self.format,
+                columns=columns,
+                start=start,
+                stop=stop,
+                memory_map=self.memory_map,
+            )
+            return
 
-    def read(self, filename: FilePath, rebuild: bool = False, **kwargs):
-        # load data from HDF5 file
+        # load data from HDF5 file; streams are stored as a sequence of chunks
         # cached = pd.read_hdf(filename, key='data')
         with pd.HDFStore(filename, 'r') as store:
-            cached = store['data']
+            keys = self._data_keys(store)
+            store_attrs = store.get_storer(keys[0]).attrs  # type: ignore
+            attrs = store_attrs.my_metadata if 'my_metadata' in store_attrs else {}
 
-            # load attributes
-            store_attrs = store.get_storer('data').attrs  # type: ignore
-            if 'my_metadata' in store_attrs:
-                cached.attrs.update(store_attrs.my_metadata)
+            for key in keys:
+                cached = store[key]
 
-        # convert units back to PintArrays
-        # cached = cached.pint.quantify(level=-1)
+                # load attributes
+                cached.attrs.update(attrs)
 
-        # temporary fix until https://github.com/hgrecco/pint-pandas/pull/217
-        # is released
-        cached = quantify(cached, level=-1)
+                # convert units back to PintArrays
+                # cached = cached.pint.quantify(level=-1)
 
-        # return cached data
-        return cached
+                # temporary fix until https://github.com/hgrecco/pint-pandas/pull/217
+                # is released
+                cached = quantify(cached, level=-1)
 
-    def write(
-        self, source: pd.DataFrame, filename: FilePath, rebuild: bool = False, **kwargs
-    ):
-        # promote units to multi-index
-        df = dequantify(source)
+                # return cached data
+                yield select_rows_and_columns(cached, columns, start, stop)
 
-        # get around some HDF5 restrictions, which can't handle FloatingArray data
-        # used by pint
-        for i, col in enumerate(df.columns):
-            if isinstance(
-                df.iloc[:, i].values,
-                pandas.arrays.FloatingArray,  # type: ignore
-            ):
-                df[col] = np.array(df[col])
+    @staticmethod
+    def _data_keys(store: pd.HDFStore):
+        if '/data' in store:
+            return ['data']
+        return sorted(key for key in store.keys() if key.startswith('/chunks/'))
 
+    def write(
+        self,
+        source: pd.DataFrame | DataFrameStream,
+        filename: FilePath,
+        rebuild: bool = False,
+        manifest: Optional[CacheManifest] = None,
+        **kwargs,
+    ):
         # create path (if necessary)
         self.ensure_path(filename)
 
+        if manifest is not None and self.hash_files:
+            manifest = manifest.with_hashes()
+
+        if self.format != 'HDF5':
+            # chunks of streams are written as row groups
+            metadata = {}
+            if manifest is not None:
+                metadata[MANIFEST_KEY] = manifest.model_dump_json()
+            write_columnar(source, filename, self.format, metadata=metadata)
+            return
+
         # write data to HDF5 file
         # source.to_hdf(filename, key='data')
         with pd.HDFStore(filename, mode='w') as store:
-            store['data'] = df
-
-            # save attributes
-            store.get_storer('data').attrs.my_metadata = df.attrs  # type: ignore
-            self.ensure_path(filename)
+            if isinstance(source, DataFrameStream):
+                # append chunks one after another
+                keys = []
+                for index, chunk in enumerate(source):
+                    keys.append(f'chunks/c{index:08d}')
+                    self._write_frame(store, keys[-1], chunk)
+                if not keys:
+                    keys.append('data')
+                    self._write_frame(store, 'data', pd.DataFrame())
+                key = keys[0]
+            else:
+                key = 'data'
+                self._write_frame(store, key, source)
+
+            # save description of the inputs
+            if manifest is not None:
+                store_attrs = store.get_storer(key).attrs  # type: ignore
+                store_attrs.rdmlibpy_manifest = manifest.model_dump_json()
+
+    def _write_frame(self, store: pd.HDFStore, key: str, source: pd.DataFrame):
+        # promote units to multi-index
+        df = dequantify(source)
 
-    def cache_is_valid(self, filename: FilePath, rebuild: bool = False):
+        # get around some HDF5 restrictions, which can't handle FloatingArray data
+        # used by pint
+        df = self._consolidate(df)
+
+        store[key] = df
+
+        # save attributes
+        store.get_storer(key).attrs.my_metadata = source.attrs  # type: ignore
+
+    @staticmethod
+    def _consolidate(df: pd.DataFrame) -> pd.DataFrame:
+        # HDF5 (fixed format) stores a single 2-D block per dtype; the float
+        # columns are copied once into a preallocated block (consolidating the
+        # columns in `HDFStore.put` holds several temporary copies)
+        values = [magnitudes(df.iloc[:, i]) for i in range(df.shape[1])]
+        floats = [
+            i
+            for i, value in enumerate(values)
+            if isinstance(value, np.ndarray) and (value.dtype == np.float64)
+        ]
+
+        # (rows of the block are written as they are)
+        block = np.empty((len(df), len(floats)), dtype=np.float64)
+        for j, i in enumerate(floats):
+            block[:, j] = values[i]
+        consolidated = pd.DataFrame(block, index=df.index, columns=floats, copy=False)
+
+        # add remaining columns at their position
+        for i, value in enumerate(values):
+            if i not in consolidated.columns:
+                consolidated.insert(i, i, value)
+        consolidated.columns = df.columns
+        return consolidated
+
+    def cache_is_valid(
+        self,
+        filename: FilePath,
+        rebuild: bool = False,
+        manifest: Optional[CacheManifest] = None,
+        **kwargs,
+    ):
         if rebuild:
             return False
-        return Path(filename).exists()
-
-
-def dequantify(df: pd.DataFrame):
-    df_new = df.pint.dequantify()
-    df_new = cast(pd.DataFrame, df_new)
-
-    # preserve attrs dictionary
-    df_new.attrs.update(df.attrs)
-
-    return df_new
-
-
-def quantify(df, level=-1):
-    # Fix for https://github.com/hgrecco/pint-pandas/pull/217
-    # (remove once that fix is rolled out in the next release of
-    # pint-pandas)
-    df_columns = df.columns.to_frame()
-    unit_col_name = df_columns.columns[level]
-    units = df_columns[unit_col_name]
-    df_columns = df_columns.drop(columns=unit_col_name)
-
-    df_new = pd.DataFrame(
-        {
-            i: (
-                pint_pandas.PintArray(df.iloc[:, i], unit)
-                if unit != pint_pandas.pint_array.NO_UNIT
-                else df.iloc[:, i]
-            )
-            for i, unit in enumerate(units.values)
-        }
-    )
-
-    df_new.columns = df_columns.index.droplevel(unit_col_name)
-    df_new.index = df.index
-
-    # preserve attrs dictionary
-    df_new.attrs.update(df.attrs)
+        if not Path(filename).exists():
+            return False
+        if manifest is None:
+            # inputs of the workflow are unknown
+            return True
 
-    return df_new
+        if self.format != 'HDF5':
+            stored = read_columnar_metadata(filename, self.format).get(MANIFEST_KEY)
+        else:
+            with pd.HDFStore(filename, 'r') as store:
+                key = self._data_keys(store)[0]
+                store_attrs = store.get_storer(key).attrs  # type: ignore
+                stored = getattr(store_attrs, MANIFEST_KEY, None)
+        if stored is None:
+            # cache has been created without a manifest (e.g. by a previous
+            # version): rebuild once to store the manifest
+            return False
+        return CacheManifest.model_validate_json(stored).matches(manifest)
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Literal, Optional
+
+import numpy as np
+import pandas as pd
+import pint_pandas
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+from ..process import Transform
+from ..timespan import Timespan
+from .dataframe_transforms import DataFrameTimeOffset
+from .dataframes_streaming import DataFrameStream
+from .dataframes_units import magnitudes, pint_array
+
+ResampleMethod = Literal['mean', 'min', 'max', 'first', 'last', 'count']
+
+# partial aggregates of a method (which are aggregated again when combining
+# the partial aggregates of chunks)
+_STATES = {
+    'mean': ('sum', 'count'),
+    'min': ('min',),
+    'max': ('max',),
+    'first': ('first',),
+    'last': ('last',),
+    'count': ('count',),
+}
+_COMBINE = dict(
+    sum='sum', count='sum', min='min', max='max', first='first', last='last'
+)
+
+
+def to_frequency(freq: Any, datetime_like: bool = True):
+    """Converts a frequency (e.g. '1 s' or '500 ms') to a `pd.Timedelta`
+    (or to a float for numeric indices).
+    """
+    if not datetime_like:
+        return float(freq)
+    return pd.Timedelta(DataFrameTimeOffset._to_timedelta(freq))
+
+
+def bin_labels(values: pd.Index, freq: Any) -> pd.Index:
+    """Labels of the bins of a frequency (the start of the bin) containing the
+    values. Bins are aligned to multiples of the frequency (e.g. to full
+    seconds), such that the bins do not depend on the first value.
+
+    Args:
+        values (pd.Index): The (datetime or numeric) values.
+        freq (Any): The frequency (see `to_frequency`).
+
+    Returns:
+        pd.Index: The labels.
+    """
+    if is_datetime64_any_dtype(values.dtype):
+        return pd.DatetimeIndex(values).floor(to_frequency(freq))
+    freq = to_frequency(freq, datetime_like=False)
+    return pd.Index(np.floor(np.asarray(values, dtype=np.float64) / freq) * freq)
+
+
+class DataFrameResample(Transform):
+    """Aggregates rows into bins of a fixed frequency (e.g. to downsample
+    logger data from 10 Hz to 1 Hz).
+
+    Bins without any rows are omitted. The methods `mean`, `min` and `max`
+    aggregate numeric (and pint) columns only. Streams (of chunks sorted in
+    time) are aggregated chunk by chunk: only the partial aggregates of the
+    last bin of a chunk are kept until the following chunk is read.
+    """
+
+    name: str = 'dataframe.resample'
+    version: str = '1'
+    cpu_bound: ClassVar[bool] = True
+
+    def run(
+        self,
+        source: pd.DataFrame | DataFrameStream,
+        freq: Any = '1 s',
+        method: ResampleMethod = 'mean',
+        column: Optional[str] = None,
+    ):
+        """Resamples a data frame (or a stream of chunks).
+
+        Args:
+            source (pd.DataFrame | DataFrameStream): The data frame.
+            freq (Any, optional): The frequency of the bins. Defaults to '1 s'.
+            method (ResampleMethod, optional): The aggregation of each bin.
+                Defaults to 'mean'.
+            column (Optional[str], optional): The time column (which becomes
+                the index of the result). Defaults to None (the index).
+
+        Returns:
+            pd.DataFrame | DataFrameStream: The resampled data frame (indexed
+            by the start of the bins).
+        """
+        if method not in _STATES:
+            raise ValueError(f'Unsupported resample method: {method}')
+        if isinstance(source, DataFrameStream):
+            return DataFrameStream(
+                lambda: self._resample_chunks(source, freq, method, column)
+            )
+        partial = self._partial(source, freq, method, column)
+        return self._finalize(partial, method, self._units(source, partial))
+
+    def push_down_timespan(
+        self,
+        timespan: Timespan,
+        freq: Any = '1 s',
+        method: ResampleMethod = 'mean',
+        column: Optional[str] = None,
+    ):
+        if column != timespan.column:
+            return None
+        # rows of all bins with a start inside the window
+        freq = to_frequency(freq)
+        start, stop = timespan.bounds
+        return Timespan.create(
+            timespan.column,
+            None if start is None else start.ceil(freq),
+            None if stop is None else stop.floor(freq) + freq - pd.Timedelta(1, 'ns'),
+        )
+
+    def push_down_columns(
+        self,
+        columns: List[str],
+        freq: Any = '1 s',
+        method: ResampleMethod = 'mean',
+        column: Optional[str] = None,
+    ):
+        if (column is None) or (column in columns):
+            return columns
+        return [*columns, column]
+
+    def _resample_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        freq: Any,
+        method: ResampleMethod,
+        column: Optional[str],
+    ) -> Iterator[pd.DataFrame]:
+        # the last bin of a chunk may continue in the following chunk
+        pending: Optional[Dict[str, pd.DataFrame]] = None
+        units: Dict[Any, str] = {}
+        for chunk in chunks:
+            partial = self._partial(chunk, freq, method, column)
+            units.update(self._units(chunk, partial))
+            if pending is not None:
+                partial = self._combine([pending, partial])
+            labels = next(iter(partial.values())).index
+            if len(labels) == 0:
+                continue
+            pending = {state: df.iloc[-1:] for state, df in partial.items()}
+            if len(labels) > 1:
+                complete = {state: df.iloc[:-1] for state, df in partial.items()}
+                yield self._finalize(complete, method, units)
+        if pending is not None:
+            yield self._finalize(pending, method, units)
+
+    @staticmethod
+    def _partial(
+        df: pd.DataFrame, freq: Any, method: ResampleMethod, column: Optional[str]
+    ) -> Dict[str, pd.DataFrame]:
+        # partial aggregates of the bins (of magnitudes)
+        if column is None:
+            values, labels = df, bin_labels(df.index, freq).rename(df.index.name)
+        else:
+            values = df.drop(columns=column)
+            labels = bin_labels(pd.Index(df[column]), freq).rename(column)
+
+        if method in ('mean', 'min', 'max'):
+            values = values.loc[:, [is_numeric_dtype(dtype) for dtype in values.dtypes]]
+        frame = pd.DataFrame(
+            {
+                position: (
+                    magnitudes(values.iloc[:, position])
+                    if isinstance(values.dtypes.iloc[position], pint_pandas.PintType)
+                    else values.iloc[:, position].to_numpy()
+                )
+                for position in range(values.shape[1])
+            },
+            copy=False,
+        )
+        frame.columns = values.columns
+
+        groups = frame.groupby(labels, sort=True)
+        partial = {state: getattr(groups, state)() for state in _STATES[method]}
+        for df_state in partial.values():
+            df_state.index.name = labels.name
+        return partial
+
+    @staticmethod
+    def _combine(partials: List[Dict[str, pd.DataFrame]]) -> Dict[str, pd.DataFrame]:
+        combined = {}
+        for state in partials[0]:
+            groups = pd.concat([partial[state] for partial in partials]).groupby(
+                level=0, sort=True
+            )
+            combined[state] = getattr(groups, _COMBINE[state])()
+        return combined
+
+    @staticmethod
+    def _units(source: pd.DataFrame, partial: Dict[str, pd.DataFrame]):
+        # units of the aggregated pint columns
+        columns = next(iter(partial.values())).columns
+        return {
+            label: str(dtype.units)
+            for label, dtype in source.dtypes.items()
+            if isinstance(dtype, pint_pandas.PintType) and (label in columns)
+        }
+
+    @staticmethod
+    def _finalize(
+        partial: Dict[str, pd.DataFrame], method: ResampleMethod, units: Dict[Any, str]
+    ) -> pd.DataFrame:
+        if method == 'mean':
+            total, count = partial['sum'], partial['count']
+            df = total / count.where(count > 0)
+        else:
+            df = partial[method].copy(deep=False)
+        if method == 'count':
+            return df
+
+        # re-attach units
+        for position, label in enumerate(df.columns):
+            if label in units:
+                values = np.asarray(df.iloc[:, position], dtype=np.float64)
+                df.isetitem(position, pint_array(values, units[label]))
+        return df
@@ -1,15 +1,18 @@
-from typing import Dict, List, Mapping, Sequence
+from typing import Dict, List, Mapping, Optional, Sequence
 
 import numpy as np
 import pandas as pd
 
 from ..process import Transform
+from ..timespan import Timespan
+from .dataframes_streaming import chunkwise
 
 
 class SelectColumns(Transform):
     name: str = 'dataframe.select.columns'
     version: str = '1'
 
+    @chunkwise
     def run(
         self,
         source: pd.DataFrame,
@@ -24,11 +27,49 @@ class SelectColumns(Transform):
         else:
             return source
 
+    def selected_columns(
+        self, select: None | str | List[str] | Dict[str, str] = None
+    ) -> Optional[List[str]]:
+        if isinstance(select, str):
+            return [select]
+        elif isinstance(select, Sequence):
+            return list(select)
+        elif isinstance(select, Mapping):
+            return list(select.keys())
+        else:
+            return None
+
+    def push_down_columns(
+        self,
+        columns: List[str],
+        select: None | str | List[str] | Dict[str, str] = None,
+    ) -> Optional[List[str]]:
+        if isinstance(select, Mapping):
+            # map renamed columns back onto their original names
+            return [
+                original for original, renamed in select.items() if renamed in columns
+            ]
+        return columns
+
+    def push_down_timespan(
+        self,
+        timespan: Timespan,
+        select: None | str | List[str] | Dict[str, str] = None,
+    ) -> Optional[Timespan]:
+        if isinstance(select, Mapping):
+            # map renamed column back onto its original name
+            for original, renamed in select.items():
+                if renamed == timespan.column:
+                    return timespan.renamed(original)
+            return None
+        return timespan
+
 
 class SelectTimespan(Transform):
     name: str = 'dataframe.select.timespan'
     version: str = '1'
 
+    @chunkwise
     def run(self, source: pd.DataFrame, column: str, start=None, stop=None):
         col = source[column]
         if (start is not None) and (stop is not None):
@@ -43,3 +84,14 @@ class SelectTimespan(Transform):
             return source.loc[start <= col]
         else:
             return source
+
+    def selected_timespan(self, column: str, start=None, stop=None):
+        if (start is None) and (stop is None):
+            return None
+        return Timespan.create(column, start, stop)
+
+    def push_down_timespan(self, timespan: Timespan, **params):
+        return timespan
+
+    def push_down_columns(self, columns: List[str], column: str, **params):
+        return columns if column in columns else [*columns, column]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Any, Callable, Iterable, Iterator
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class DataFrameStream:
+    """A lazy sequence of DataFrame chunks.
+
+    Streams are returned by loaders in streaming mode (see the `chunksize`
+    option of `dataframe.read.csv`). Row-local transforms are applied chunk by
+    chunk and sinks (e.g. `dataframe.write.csv` or `dataframe.cache`) write
+    the chunks incrementally, such that the whole dataset is never held in
+    memory at once.
+
+    The chunks are generated anew on every iteration (e.g. by reading the
+    source files again).
+
+    Args:
+        factory (Callable[[], Iterable[pd.DataFrame]]): Creates the iterable
+            of chunks.
+    """
+
+    def __init__(self, factory: Callable[[], Iterable[pd.DataFrame]]):
+        self._factory = factory
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return iter(self._factory())
+
+    def map(self, func: Callable[[pd.DataFrame], pd.DataFrame]) -> DataFrameStream:
+        """Applies a function to each chunk of the stream (lazily).
+
+        Args:
+            func (Callable[[pd.DataFrame], pd.DataFrame]): The function.
+
+        Returns:
+            DataFrameStream: The stream of transformed chunks.
+        """
+        return DataFrameStream(lambda: (func(chunk) for chunk in self))
+
+    def collect(self) -> pd.DataFrame:
+        """Concatenates all chunks into a single DataFrame."""
+        chunks = list(self)
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks)
+
+
+def chunkwise(run):
+    """Decorates the `run` method of a row-local transform, such that streams
+    are transformed chunk by chunk.
+    """
+
+    @functools.wraps(run)
+    def wrapper(self, source, *args, **kwargs):
+        if isinstance(source, DataFrameStream):
+            return source.map(lambda chunk: run(self, chunk, *args, **kwargs))
+        return run(self, source, *args, **kwargs)
+
+    return wrapper
+
+
+def collected(run):
+    """Decorates the `run` method of a transform, which is not row-local (e.g.
+    sorting or interpolating across rows), such that streams are collected into
+    a single DataFrame before transforming them.
+    """
+
+    def collect(value: Any):
+        if isinstance(value, DataFrameStream):
+            logger.debug('Collecting stream (transform is not row-local)')
+            return value.collect()
+        if isinstance(value, list):
+            return [collect(item) for item in value]
+        return value
+
+    @functools.wraps(run)
+    def wrapper(self, *args, **kwargs):
+        args = tuple(collect(value) for value in args)
+        kwargs = {key: collect(value) for key, value in kwargs.items()}
+        return run(self, *args, **kwargs)
+
+    return wrapper
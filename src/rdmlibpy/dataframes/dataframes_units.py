@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import functools
+from typing import cast
+
+import numpy as np
+import pandas as pd
+import pandas.arrays
+import pint_pandas
+import pint_pandas.pint_array
+
+# Conversions between pint columns (`PintArray`) and their magnitudes. The
+# magnitudes are wrapped (unwrapped) without copying their buffers, such that
+# round trips through files (see `DataFrameFileCache`) do not hold several
+# copies of a data frame in memory.
+
+
+def pint_array(values: pd.Series | pd.api.extensions.ExtensionArray, unit: str):
+    """Wraps magnitudes into a `PintArray` without copying them.
+
+    Args:
+        values (pd.Series | ExtensionArray): The magnitudes.
+        unit (str): The unit.
+
+    Returns:
+        pint_pandas.PintArray: The quantities.
+    """
+    # the subdtype is given explicitly, such that the magnitudes are wrapped as
+    # they are (inferring the subdtype scans and converts all values)
+    return pint_pandas.PintArray(values, dtype=_pint_dtype(unit, str(values.dtype)))
+
+
+@functools.lru_cache(maxsize=None)
+def _pint_dtype(unit: str, subdtype: str):
+    # parsing dtypes is expensive compared to wrapping the magnitudes
+    return pint_pandas.PintType.construct_from_string(f'pint[{unit}][{subdtype}]')
+
+
+def magnitudes(values: pd.Series):
+    """Returns the magnitudes of a (pint) column without copying them.
+
+    Nullable float arrays (e.g. the magnitudes of `PintArray`s created from
+    numpy arrays) are converted to numpy arrays, which share the buffer of
+    the array, unless values are missing.
+
+    Args:
+        values (pd.Series): The column.
+
+    Returns:
+        np.ndarray | ExtensionArray: The magnitudes.
+    """
+    data = values.array
+    if isinstance(data, pint_pandas.PintArray):
+        data = data.data
+    if isinstance(data, pandas.arrays.FloatingArray):
+        # missing values are replaced by NaN (which requires a copy)
+        return data.to_numpy(dtype=data.dtype.numpy_dtype, na_value=np.nan, copy=False)
+    if isinstance(data, pandas.arrays.NumpyExtensionArray):
+        return data.to_numpy()
+    return data
+
+
+def dequantify(df: pd.DataFrame):
+    df_new = df.pint.dequantify()
+    df_new = cast(pd.DataFrame, df_new)
+
+    # preserve attrs dictionary
+    df_new.attrs.update(df.attrs)
+
+    return df_new
+
+
+def quantify(df, level=-1):
+    # Fix for https://github.com/hgrecco/pint-pandas/pull/217
+    # (remove once that fix is rolled out in the next release of
+    # pint-pandas)
+    df_columns = df.columns.to_frame()
+    unit_col_name = df_columns.columns[level]
+    units = df_columns[unit_col_name]
+    df_columns = df_columns.drop(columns=unit_col_name)
+
+    df_new = pd.DataFrame(
+        {
+            i: (
+                pint_array(df.iloc[:, i], unit)
+                if unit != pint_pandas.pint_array.NO_UNIT
+                else df.iloc[:, i]
+            )
+            for i, unit in enumerate(units.values)
+        },
+        copy=False,
+    )
+
+    df_new.columns = df_columns.index.droplevel(unit_col_name)
+    df_new.index = df.index
+
+    # preserve attrs dictionary
+    df_new.attrs.update(df.attrs)
+
+    return df_new
@@ -0,0 +1,442 @@
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import copy
+import functools
+import pickle
+import threading
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ._hashing import fingerprint, persistent_fingerprint
+
+if TYPE_CHECKING:
+    from .base import ProcessNode
+    from .profiling import Profiler
+    from .result_cache import ResultCache
+
+Branch = Tuple['ProcessNode', Mapping[str, Any]]
+RemotePolicy = Literal['cpu-bound', 'all'] | Callable[['ProcessNode'], bool]
+
+_active_context: ContextVar[Optional[ExecutionContext]] = ContextVar(
+    'rdmlibpy_execution_context', default=None
+)
+
+
+def current_context() -> Optional[ExecutionContext]:
+    """Returns the execution context of the currently running workflow (if any)."""
+    return _active_context.get()
+
+
+class _MemoEntry:
+    # memoized result of a node, which is shared by several consumers
+    def __init__(self, consumers: int):
+        self.consumers = consumers
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+        self.lock = threading.Lock()
+
+
+class ExecutionContext:
+    """Execution state of a single workflow run.
+
+    The results of nodes are memoized using content-addressed keys, which are
+    derived from the runner (name, version and configuration), the resolved
+    parameters and the key of the parent node. Nodes with the same key are
+    therefore executed only once per run, even if they are represented by
+    different node instances within the workflow graph.
+
+    Results are only kept as long as they are needed by a downstream node.
+    Each consumer except the last one receives a copy of the memoized result,
+    such that in place modifications of one consumer do not leak into another.
+
+    If an executor is given, independent branches of the workflow (the parent
+    and the executable parameters of a node) are evaluated concurrently. For
+    process pools, the remote policy selects the branches, which are sent to
+    worker processes: `cpu-bound` (default) sends branches containing at least
+    one CPU-bound process, `all` sends every branch and a callable decides for
+    each branch (given its last node). Branches with shared nodes or runners,
+    which are not registered, are always evaluated locally.
+
+    If a result cache is given, the results of cacheable nodes are stored
+    persistently using keys, which are stable across runs (see
+    `persistent_key`). Nodes with a cached result are not executed again
+    (including all their upstream nodes).
+
+    If a profiler is given, the execution of each node is measured (see
+    `Profiler`).
+    """
+
+    def __init__(
+        self,
+        root: ProcessNode,
+        kwargs: Optional[Mapping[str, Any]] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        remote_policy: RemotePolicy = 'cpu-bound',
+        result_cache: Optional[ResultCache] = None,
+        profiler: Optional[Profiler] = None,
+    ):
+        self.executor = executor
+        self.remote_policy = remote_policy
+        self.result_cache = result_cache
+        self.profiler = profiler
+        self._fingerprints: Dict[int, str] = {}
+        self._persistent_keys: Dict[str, Optional[str]] = {}
+        self._nodes: Dict[int, ProcessNode] = {}
+        self._consumers = self._count_consumers(root, dict(kwargs or {}))
+        self._results: Dict[str, _MemoEntry] = {}
+        self._lock = threading.Lock()
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(_active_context.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active_context.reset(self._tokens.pop())
+        self._results.clear()
+
+    def run_node(self, node: ProcessNode, **kwargs):
+        key = self.key(node, kwargs)
+        consumers = self._consumers.get(key, 0)
+        if consumers <= 1:
+            # node has a single consumer -> nothing to share
+            return self._execute(node, kwargs)
+
+        with self._lock:
+            owner = key not in self._results
+            if owner:
+                self._results[key] = _MemoEntry(consumers)
+            entry = self._results[key]
+
+        if owner:
+            # the first consumer executes the node; all other consumers wait
+            # for the result
+            try:
+                entry.future.set_result(self._execute(node, kwargs))
+            except BaseException as exc:
+                entry.future.set_exception(exc)
+                raise
+        return self._fetch(key, entry)
+
+    def evaluate(self, branches: Sequence[Branch]) -> List[Any]:
+        """Runs independent branches of the workflow and returns their results.
+
+        Without an executor, the branches are evaluated one after another.
+        With a thread pool, all branches except the first one are submitted to
+        the executor, while the first branch is evaluated by the calling
+        thread. Branches, which have not been started by the executor once
+        their result is needed, are evaluated by the calling thread as well
+        (this avoids deadlocks, when nested branches are waiting for workers of
+        a bounded pool).
+
+        With a process pool, branches selected by the remote policy are sent
+        to worker processes and all other branches are evaluated locally.
+
+        Args:
+            branches (Sequence[Branch]): The nodes to run and their runtime
+                arguments.
+
+        Returns:
+            List[Any]: The results of the branches (in order).
+        """
+        if self.profiler is None:
+            return self._evaluate(branches)
+        with self.profiler.inputs():
+            return self._evaluate(branches)
+
+    def _evaluate(self, branches: Sequence[Branch]):
+        if (self.executor is None) or (len(branches) < 2):
+            return [node.run(**kwargs) for node, kwargs in branches]
+        elif isinstance(self.executor, concurrent.futures.ProcessPoolExecutor):
+            return self._evaluate_in_processes(branches)
+        else:
+            return self._evaluate_in_threads(branches)
+
+    def _evaluate_in_threads(self, branches: Sequence[Branch]):
+        def submit(node: ProcessNode, kwargs: Mapping[str, Any]):
+            task = functools.partial(node.run, **kwargs)
+            return self.executor.submit(contextvars.copy_context().run, task)
+
+        futures = [submit(node, kwargs) for node, kwargs in branches[1:]]
+        try:
+            node, kwargs = branches[0]
+            results = [node.run(**kwargs)]
+            for (node, kwargs), future in zip(branches[1:], futures):
+                if future.cancel():
+                    results.append(node.run(**kwargs))
+                else:
+                    results.append(future.result())
+            return results
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _evaluate_in_processes(self, branches: Sequence[Branch]):
+        futures = [self._submit_remote(node, kwargs) for node, kwargs in branches]
+        try:
+            # evaluate local branches while the remote branches are running
+            results = [
+                node.run(**kwargs) if future is None else None
+                for (node, kwargs), future in zip(branches, futures)
+            ]
+            for index, future in enumerate(futures):
+                if future is not None:
+                    results[index], profiles = future.result()
+                    if self.profiler is not None:
+                        self.profiler.extend(profiles)
+            return results
+        finally:
+            for future in futures:
+                if future is not None:
+                    future.cancel()
+
+    def _submit_remote(self, node: ProcessNode, kwargs: Mapping[str, Any]):
+        # returns `None` if the branch should be evaluated locally
+        from .workflow import Workflow
+
+        if not self._runs_remotely(node, kwargs):
+            return None
+        if self.result_cache is not None:
+            # loading cached results does not benefit from worker processes
+            key = self.persistent_key(node, kwargs)
+            if (key is not None) and (key in self.result_cache):
+                return None
+        try:
+            descriptor = Workflow.to_descriptor(node)
+            pickle.dumps((descriptor, kwargs))
+        except Exception:
+            # branch contains unregistered runners or values, which cannot
+            # be sent to a worker process
+            return None
+
+        assert self.executor is not None
+        return self.executor.submit(
+            _run_remote,
+            descriptor,
+            dict(kwargs),
+            self.result_cache,
+            self.profiler is not None,
+        )
+
+    def _runs_remotely(self, node: ProcessNode, kwargs: Mapping[str, Any]):
+        # shared nodes are kept local, such that they still run only once
+        visited: Dict[str, ProcessNode] = {}
+        for item in self._iter_invocations(node, kwargs, visited):
+            key = self.key(*item)
+            if (key in visited) or (self._consumers.get(key, 0) > 1):
+                return False
+            visited[key] = item[0]
+
+        match self.remote_policy:
+            case 'all':
+                return True
+            case 'cpu-bound':
+                return any(item.runner.cpu_bound for item in visited.values())
+            case policy if callable(policy):
+                return policy(node)
+            case _:
+                raise ValueError(f'Invalid remote policy: {self.remote_policy}')
+
+    def key(self, node: ProcessNode, kwargs: Optional[Mapping[str, Any]] = None):
+        """Returns the content-addressed key of a node invocation.
+
+        Args:
+            node (ProcessNode): The process node.
+            kwargs (Optional[Mapping[str, Any]], optional): Runtime arguments
+                passed to the node. Defaults to None.
+
+        Returns:
+            str: The hex digest of the key.
+        """
+        # keep a reference to the node, since fingerprints are memoized by the
+        # identity of nodes
+        self._nodes.setdefault(id(node), node)
+
+        # runtime arguments are only passed along the main chain of the
+        # workflow; the same node may therefore be invoked with and without
+        # arguments
+        return fingerprint(
+            dict(node=node.fingerprint(self._fingerprints), kwargs=kwargs or {})
+        )
+
+    def persistent_key(
+        self, node: ProcessNode, kwargs: Optional[Mapping[str, Any]] = None
+    ) -> Optional[str]:
+        """Returns the key of a node invocation within the result cache.
+
+        In contrast to `key`, the persistent key also depends on the state of
+        the files read by the node and its upstream nodes (see
+        `ProcessBase.get_input_files`).
+
+        Args:
+            node (ProcessNode): The process node.
+            kwargs (Optional[Mapping[str, Any]], optional): Runtime arguments
+                passed to the node. Defaults to None.
+
+        Returns:
+            Optional[str]: The hex digest of the key or `None`, if no result
+                cache is used or if the result of the node cannot be cached
+                (e.g. unknown input files or parameters, which are not stable
+                across runs).
+        """
+        if self.result_cache is None:
+            return None
+        index = self.key(node, kwargs)
+        if index not in self._persistent_keys:
+            self._persistent_keys[index] = self._persistent_key(node, kwargs or {})
+        return self._persistent_keys[index]
+
+    def _persistent_key(self, node: ProcessNode, kwargs: Mapping[str, Any]):
+        from .base import RunnableProcessParam
+
+        assert self.result_cache is not None
+
+        params: Dict[str, Any] = {}
+        values: Dict[str, Any] = {}
+        for name, param in node.params.items():
+            if isinstance(param, RunnableProcessParam):
+                key = self.persistent_key(param.node)
+                if key is None:
+                    return None
+                params[name] = {'node': key}
+            else:
+                values[name] = param.get_value()
+                params[name] = {'value': values[name]}
+
+        parent = None
+        if node.parent is not None:
+            # runtime arguments are passed on to the parent node
+            parent = self.persistent_key(node.parent, kwargs)
+            if parent is None:
+                return None
+        else:
+            values.update(kwargs)
+
+        try:
+            files = node.runner.get_input_files(**values)
+        except Exception:
+            files = None
+        if files is None:
+            return None
+        states = []
+        for filename in files:
+            state = self.result_cache.file_state(filename)
+            if state is None:
+                return None
+            states.append(state)
+
+        return persistent_fingerprint(
+            dict(
+                runner=node.runner.fullname,
+                config=node.runner.get_config(),
+                params=params,
+                kwargs=kwargs if node.parent is None else {},
+                parent=parent,
+                files=states,
+            )
+        )
+
+    def annotate(self, **info):
+        """Adds information to the profile of the currently executed node.
+
+        Args:
+            **info: Fields of the node profile (e.g. `cache='hit'`).
+        """
+        if self.profiler is not None:
+            self.profiler.annotate(**info)
+
+    def _execute(self, node: ProcessNode, kwargs: Mapping[str, Any]):
+        if self.profiler is None:
+            return self._execute_node(node, kwargs)
+        with self.profiler.record(node, self.key(node, kwargs)) as info:
+            info['output'] = self._execute_node(node, kwargs)
+        return info['output']
+
+    def _execute_node(self, node: ProcessNode, kwargs: Mapping[str, Any]):
+        # runs the node unless its result is found in the result cache
+        key = None
+        if (self.result_cache is not None) and node.runner.cacheable:
+            key = self.persistent_key(node, kwargs)
+        if key is not None:
+            assert self.result_cache is not None
+            found, result = self.result_cache.get(key)
+            self.annotate(cache='hit' if found else 'miss')
+            if found:
+                return result
+
+        result = node.runner._run_with_node(node, **kwargs)
+        if key is not None:
+            assert self.result_cache is not None
+            self.result_cache.put(key, result)
+        return result
+
+    def _fetch(self, key: str, entry: _MemoEntry):
+        # hand out copies of the memoized result and release it to the
+        # last consumer
+        result = entry.future.result()
+        with entry.lock:
+            entry.consumers -= 1
+            if entry.consumers > 0:
+                return copy.deepcopy(result)
+        with self._lock:
+            self._results.pop(key, None)
+        return result
+
+    def _count_consumers(self, root: ProcessNode, kwargs: Dict[str, Any]):
+        # count how often each node is invoked, if its result is reused;
+        # the dependencies of a node are visited only upon its first invocation
+        counts: Dict[str, int] = {}
+        for node, node_kwargs in self._iter_invocations(root, kwargs, counts):
+            key = self.key(node, node_kwargs)
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def _iter_invocations(
+        self,
+        root: ProcessNode,
+        kwargs: Mapping[str, Any],
+        visited: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[Branch]:
+        # yields all invocations of nodes within the graph; if given, the
+        # dependencies of nodes in `visited` are not expanded
+        stack: List[Branch] = [(root, kwargs)]
+        while stack:
+            node, node_kwargs = stack.pop()
+            expand = (visited is None) or (self.key(node, node_kwargs) not in visited)
+            yield node, node_kwargs
+            if expand:
+                dependencies = node.get_dependencies()
+                if node.parent is not None:
+                    # runtime arguments are passed on to the parent node
+                    stack.append((dependencies.pop(0), node_kwargs))
+                stack.extend((dependency, {}) for dependency in dependencies)
+
+
+def _run_remote(
+    descriptor: Any,
+    kwargs: Dict[str, Any],
+    result_cache: Optional[ResultCache],
+    profile: bool,
+):
+    # entry point of worker processes; returns the result and the profiles
+    # of the nodes executed by the worker
+    from .workflow import Workflow
+
+    workflow = Workflow.create(descriptor)
+    if not profile:
+        return workflow.run(result_cache=result_cache, **kwargs), []
+    result, report = workflow.run(result_cache=result_cache, profile=True, **kwargs)
+    return result, report.nodes
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path, PurePath
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pydantic
+
+# directories modified less than two seconds before they were listed might be
+# modified again without changing their modification time (coarse timestamps
+# of network & FAT file systems); their listings are not reused
+RACY_INTERVAL_NS = 2_000_000_000
+
+# directory entries: name, is directory (following symlinks), is symlink
+DirectoryEntry = Tuple[str, bool, bool]
+
+
+class GlobEntry(pydantic.BaseModel):
+    """Result of a glob expansion.
+
+    Attributes:
+        directories: Modification times (in ns) of the directories inspected
+            by the expansion (relative to the root).
+        matches: The matching paths (relative to the root).
+    """
+
+    directories: Dict[str, int]
+    matches: List[str]
+
+
+class GlobIndexFile(pydantic.BaseModel):
+    root: str
+    patterns: Dict[str, GlobEntry] = {}
+
+
+class GlobIndex:
+    """Cache of glob expansions (see `Loader.glob`).
+
+    Expansions are cached by root directory and pattern, together with the
+    modification times of all directories inspected by the expansion. Adding,
+    removing or renaming files changes the modification time of the parent
+    directory, such that a cached expansion is reused only if a `stat` of
+    the inspected directories shows no changes. Directory listings are
+    cached as well and shared by different patterns.
+
+    Expansion is lazy: matches are yielded while the directory tree is
+    walked, such that loaders can start parsing the first file early.
+
+    Args:
+        directory (str | os.PathLike | None, optional): If set, expansions
+            are also persisted to an index file per root directory in this
+            directory and are reused across sessions. Defaults to None.
+    """
+
+    def __init__(self, directory: str | os.PathLike | None = None):
+        self.directory = None if directory is None else Path(directory)
+        self._lock = threading.Lock()
+        self._listings: Dict[str, Tuple[int, List[DirectoryEntry]]] = {}
+        self._entries: Dict[Tuple[str, str], GlobEntry] = {}
+
+    def clear(self):
+        """Clears the in-memory cache (index files are kept)."""
+        with self._lock:
+            self._listings.clear()
+            self._entries.clear()
+
+    def glob(self, root: str | os.PathLike, pattern: str) -> Iterator[Path]:
+        """Yields the paths below `root` matching `pattern` (see `Path.glob`).
+
+        Args:
+            root (str | os.PathLike): The root directory.
+            pattern (str): The relative glob pattern.
+
+        Yields:
+            Path: The matching paths.
+        """
+        root = os.fspath(root)
+        entry = self._lookup(root, pattern)
+        if entry is not None:
+            for name in entry.matches:
+                yield Path(root, name)
+            return
+
+        expansion = _GlobExpansion(self, root)
+        matches = []
+        for name in expansion.select('', PurePath(pattern).parts):
+            matches.append(name)
+            yield Path(root, name)
+
+        if expansion.cacheable:
+            entry = GlobEntry(directories=expansion.directories, matches=matches)
+            with self._lock:
+                self._entries[(root, pattern)] = entry
+            if self.directory is not None:
+                self._write_index(root, pattern, entry)
+
+    def _lookup(self, root: str, pattern: str) -> Optional[GlobEntry]:
+        entry = self._entries.get((root, pattern))
+        if (entry is None) and (self.directory is not None):
+            entry = self._read_index(root).patterns.get(pattern)
+        if (entry is None) or not self._is_valid(root, entry):
+            return None
+
+        with self._lock:
+            self._entries[(root, pattern)] = entry
+        return entry
+
+    @staticmethod
+    def _is_valid(root: str, entry: GlobEntry):
+        for name, mtime in entry.directories.items():
+            try:
+                if os.stat(os.path.join(root, name)).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def _list(self, path: str, mtime: int) -> Optional[List[DirectoryEntry]]:
+        cached = self._listings.get(path)
+        if (cached is not None) and (cached[0] == mtime):
+            return cached[1]
+
+        try:
+            with os.scandir(path) as it:
+                entries = [
+                    (entry.name, _is_dir(entry), entry.is_symlink()) for entry in it
+                ]
+        except OSError:
+            return None
+
+        if not _is_racy(mtime):
+            with self._lock:
+                self._listings[path] = (mtime, entries)
+        return entries
+
+    def _index_filename(self, root: str) -> Path:
+        assert self.directory is not None
+        digest = hashlib.sha1(root.encode('utf-8')).hexdigest()
+        return self.directory / f'{digest}.json'
+
+    def _read_index(self, root: str) -> GlobIndexFile:
+        try:
+            index = GlobIndexFile.model_validate_json(
+                self._index_filename(root).read_bytes()
+            )
+        except (OSError, ValueError):
+            return GlobIndexFile(root=root)
+        return index if index.root == root else GlobIndexFile(root=root)
+
+    def _write_index(self, root: str, pattern: str, entry: GlobEntry):
+        assert self.directory is not None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            index = self._read_index(root)
+            index.patterns[pattern] = entry
+
+            # write atomically, such that concurrent readers never see partial files
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as fp:
+                    fp.write(index.model_dump_json())
+                os.replace(tmp, self._index_filename(root))
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+
+
+class _GlobExpansion:
+    """State of a single glob expansion. Matches the semantics of `Path.glob`
+    (Python 3.11), while recording the modification times of the inspected
+    directories.
+    """
+
+    def __init__(self, index: GlobIndex, root: str):
+        self.index = index
+        self.root = root
+        self.directories: Dict[str, int] = {}
+        self.cacheable = True
+        self._entries: Dict[str, List[DirectoryEntry]] = {}
+
+    def _record(self, name: str) -> Optional[int]:
+        if name in self.directories:
+            return self.directories[name]
+        try:
+            mtime = os.stat(os.path.join(self.root, name)).st_mtime_ns
+        except OSError:
+            self.cacheable = False
+            return None
+        if _is_racy(mtime):
+            self.cacheable = False
+        self.directories[name] = mtime
+        return mtime
+
+    def _list(self, name: str) -> List[DirectoryEntry]:
+        if name not in self._entries:
+            mtime = self._record(name)
+            entries = None
+            if mtime is not None:
+                entries = self.index._list(os.path.join(self.root, name), mtime)
+            if entries is None:
+                # e.g. missing permissions (ignored by `Path.glob` as well)
+                self.cacheable = False
+                entries = []
+            self._entries[name] = entries
+        return self._entries[name]
+
+    def _iterate_directories(self, name: str) -> Iterator[str]:
+        yield name
+        for child, is_dir, is_symlink in self._list(name):
+            if is_dir and not is_symlink:
+                yield from self._iterate_directories(_join(name, child))
+
+    def select(self, name: str, parts: Tuple[str, ...]) -> Iterator[str]:
+        if not parts:
+            yield name
+            return
+
+        head, tail = parts[0], parts[1:]
+        if head == '**':
+            yielded = set()
+            for directory in self._iterate_directories(name):
+                for match in self.select(directory, tail):
+                    if match not in yielded:
+                        yielded.add(match)
+                        yield match
+        elif any(char in head for char in '*?['):
+            pattern = os.path.normcase(head)
+            for child, is_dir, _ in self._list(name):
+                if tail and not is_dir:
+                    continue
+                if fnmatch.fnmatchcase(os.path.normcase(child), pattern):
+                    yield from self.select(_join(name, child), tail)
+        else:
+            # literal names are checked directly (their existence depends on
+            # the parent directory only)
+            self._record(name)
+            path = os.path.join(self.root, name, head)
+            if os.path.isdir(path) if tail else os.path.exists(path):
+                yield from self.select(_join(name, head), tail)
+
+
+def _join(name: str, child: str):
+    return os.path.join(name, child) if name else child
+
+
+def _is_dir(entry: os.DirEntry):
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _is_racy(mtime: int):
+    return time.time_ns() - mtime < RACY_INTERVAL_NS
@@ -1,7 +1,9 @@
+import concurrent.futures
 import logging
 from datetime import datetime
-from typing import Literal
+from typing import Callable, Iterable, Iterator, List, Literal, Optional, Tuple
 
+import numpy as np
 import xarray as xr
 from brukeropus import read_opus
 
@@ -36,23 +38,80 @@ class BrukerOpusLoader(Loader):
         True  # return DataArray instead of List[DataArray] for single spectrum
     )
     sort_by_timestamp: bool = True
+    workers: int = 1  # read files concurrently if > 1
+    executor: Literal['threads', 'processes'] = 'threads'
 
     def run(self, source):
         # load using filename (possible a glob pattern)
-        generator = map(self._try_load_single_spectrum, Loader.glob(source))
-        generator = filter(lambda a: a is not None, generator)
         if self.concatenate:
-            data = xr.concat(generator, dim=self.concat_dim)
+            data = self._stack(list(Loader.glob(source)))
             if self.sort_by_timestamp:
                 data = data.sortby('timestamp')
         else:
-            data = list(generator)
+            generator = self._map(self._try_load_single_spectrum, Loader.glob(source))
+            data = [da for da in generator if da is not None]
             if self.sort_by_timestamp:
                 data = sorted(data, key=lambda da: da.timestamp)
             if self.squeeze and len(data) == 1:
                 data = data[0]
         return data
 
+    def _stack(self, paths: List[FilePath]) -> xr.DataArray:
+        # stack the spectra into preallocated arrays (spectra are concatenated
+        # by xarray only if their wavenumbers differ)
+        values: Optional[np.ndarray] = None
+        timestamps = np.empty(len(paths), dtype='datetime64[ns]')
+        arrays: Optional[List[xr.DataArray]] = None
+        rows = 0
+        for spectrum in self._map(self._try_read_spectrum, paths):
+            if spectrum is None:
+                continue
+            y, nu, timestamp = spectrum
+            if values is None:
+                values = np.empty((len(paths), len(y)), dtype=y.dtype)
+                axis = nu
+            if arrays is not None:
+                arrays.append(self._to_data_array(y, nu, timestamp))
+            elif (len(nu) != len(axis)) or not np.array_equal(nu, axis):
+                logger.debug('Wavenumbers of spectra differ; concatenating spectra')
+                arrays = [
+                    self._to_data_array(values[row], axis, timestamps[row])
+                    for row in range(rows)
+                ]
+                arrays.append(self._to_data_array(y, nu, timestamp))
+            else:
+                values[rows] = y
+                timestamps[rows] = timestamp
+                rows += 1
+
+        if arrays is not None:
+            return xr.concat(arrays, dim=self.concat_dim, join='outer')
+        if values is None:
+            raise ValueError('No spectra found.')
+        return xr.DataArray(
+            values[:rows],
+            coords={'nu': axis, 'timestamp': (self.concat_dim, timestamps[:rows])},
+            dims=(self.concat_dim, 'nu'),
+            name=self.spectrum,
+        )
+
+    def _map(self, func: Callable, paths: Iterable[FilePath]) -> Iterator:
+        # apply `func` to all files (concurrently if `workers` > 1), keeping the
+        # order of the files
+        if self.workers <= 1:
+            yield from map(func, paths)
+            return
+
+        match self.executor:
+            case 'threads':
+                pool = concurrent.futures.ThreadPoolExecutor(self.workers)
+            case 'processes':
+                pool = concurrent.futures.ProcessPoolExecutor(self.workers)
+            case _:
+                raise ValueError(f'Invalid executor: {self.executor}')
+        with pool:
+            yield from pool.map(func, paths)
+
     def _try_load_single_spectrum(self, source: FilePath, **kwargs):
         try:
             return self._load_single_spectrum(source, **kwargs)
@@ -60,23 +119,36 @@ class BrukerOpusLoader(Loader):
             return None
 
     def _load_single_spectrum(self, source: FilePath, **kwargs):
+        return self._to_data_array(*self._read_spectrum(source))
+
+    def _try_read_spectrum(self, source: FilePath):
+        try:
+            return self._read_spectrum(source)
+        except AttributeError:
+            return None
+
+    def _read_spectrum(
+        self, source: FilePath
+    ) -> Tuple[np.ndarray, np.ndarray, datetime]:
+        # intensities, wavenumbers & timestamp of a spectrum
         logger.debug(f'Loading OPUS file: {source}')
         opus_file = read_opus(str(source))
 
         key = self.map_spectrum_key(self.spectrum)
         logger.debug(f'Extracting spectrum of type: {self.spectrum} (key: {key})')
         spectrum = getattr(opus_file, key)
-        da = xr.DataArray(
-            spectrum.y, coords=dict(nu=spectrum.x), dims='nu', name=self.spectrum
-        )
 
         time_str = (
             spectrum.dat
             + ' '
             + spectrum.tim.split(' ')[0]  # get rid of the (GMT+2) part
         )
-        da['timestamp'] = datetime.strptime(time_str, self.date_format)
+        timestamp = datetime.strptime(time_str, self.date_format)
+        return spectrum.y, spectrum.x, timestamp
 
+    def _to_data_array(self, y: np.ndarray, nu: np.ndarray, timestamp) -> xr.DataArray:
+        da = xr.DataArray(y, coords=dict(nu=nu), dims='nu', name=self.spectrum)
+        da['timestamp'] = timestamp
         return da
 
     def map_spectrum_key(self, key: TypeOfSpectrum):
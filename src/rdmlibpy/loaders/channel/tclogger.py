@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 from ...dataframes.dataframes_io import DataFrameReadCSVBase, ParseDatesType
@@ -12,6 +12,7 @@ class ChannelTCLoggerLoader(DataFrameReadCSVBase):
     separator: str = ';'
     parse_dates: ParseDatesType = ['timestamp']
     date_format: str = 'ISO8601'
+    filename_timestamp: Optional[str] = '%Y-%m-%dT%H-%M-%S'
     options: Dict[str, Any] = dict(
         header='infer',
     )
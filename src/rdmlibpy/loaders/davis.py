@@ -1,6 +1,6 @@
 # %%
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, List, Optional
 
 import davislib as dl
 import xarray as xr
@@ -13,6 +13,27 @@ class DavisImageSetLoader(Loader):
     name: str = 'davis.image_set'
     version: str = '1'
 
+    def get_input_files(self, source: Any = None, **params) -> Optional[List[Path]]:
+        # image sets consist of a `.set` file and a directory of the same name
+        # (holding the images), either of which may be given as source
+        paths = super().get_input_files(source, **params)
+        if paths is None:
+            return None
+        files: Dict[Path, None] = {}
+        for path in paths:
+            if path.suffix == '.set':
+                items = [path, path.with_suffix('')]
+            else:
+                items = [path.with_name(path.name + '.set'), path]
+            for item in items:
+                if item.is_dir():
+                    files.update(
+                        dict.fromkeys(sorted(p for p in item.rglob('*') if p.is_file()))
+                    )
+                elif item.is_file():
+                    files[item] = None
+        return list(files)
+
     def run(
         self,
         source: FilePath,
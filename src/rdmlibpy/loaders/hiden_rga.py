@@ -1,9 +1,11 @@
 import tokenize
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 from ..dataframes.dataframes_io import DataFrameReadCSVBase
+from ..dataframes.dataframes_streaming import DataFrameStream
 
 
 class HidenRGALoader(DataFrameReadCSVBase):
@@ -56,7 +58,9 @@ class HidenRGALoader(DataFrameReadCSVBase):
 
     def create_timestamp(self, df: pd.DataFrame, t0: datetime):
         # create timestamp column
-        df['timestamp'] = t0 + df['ms'].astype('<m8[ms]')  # type: ignore
+        # (via numpy, as Arrow-backed integers are cast to nanoseconds)
+        ms = df['ms'].to_numpy(dtype=np.float64, na_value=np.nan)
+        df['timestamp'] = t0 + pd.Series(ms.astype('<m8[ms]'), index=df.index)
 
         # move timestamp to front
         cols = list(df.columns)
@@ -74,7 +78,9 @@ class HidenRGALoader(DataFrameReadCSVBase):
 
         data = super().run(source)
 
-        if isinstance(data, list):
+        if isinstance(data, DataFrameStream):
+            return data.map(lambda df: self.create_timestamp(df, t0))
+        elif isinstance(data, list):
             return [self.create_timestamp(df, t0) for df in data]
         else:
             return self.create_timestamp(data, t0)
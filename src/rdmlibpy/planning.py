@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Set
+
+import pydantic
+
+from .base import ProcessNode, RunnableProcessParam
+from .execution import ExecutionContext
+from .process import Cache
+from .profiling import ProfileReport
+from .registry import is_registered
+from .result_cache import ResultCache
+
+
+class PlannedNode(pydantic.BaseModel):
+    """Description of a node within the execution plan of a workflow.
+
+    Attributes:
+        key: The key of the node invocation (see `ExecutionContext.key`).
+        runner: The full name of the runner.
+        registered: Whether the runner is available in the registry.
+        dependencies: The keys of the parent node & executable parameters.
+        cache_valid: Whether the cache of a cache node is valid (`None` for
+            other nodes or if validity cannot be checked without running
+            upstream nodes).
+        result_cached: Whether the result is stored in the result cache.
+        skipped: Whether the node is not executed, since all its consumers are
+            served from a cache.
+        files: The files read by the node (`None`, if unknown).
+        file_bytes: Total size of the files read by the node.
+        input_bytes: Total size of the files read by the node and all its
+            upstream nodes.
+        estimated_time: Self time of the node measured in a previous run (if
+            a profile is given).
+    """
+
+    key: str
+    runner: str
+    registered: bool
+    dependencies: List[str] = []
+    cache_valid: Optional[bool] = None
+    result_cached: Optional[bool] = None
+    skipped: bool = False
+    files: Optional[List[str]] = []
+    file_bytes: int = 0
+    input_bytes: int = 0
+    estimated_time: Optional[float] = None
+
+
+class WorkflowPlan(pydantic.BaseModel):
+    """Execution plan of a workflow (see `Workflow.plan`)."""
+
+    nodes: List[PlannedNode] = []
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the files read by nodes, which are executed."""
+        files: Dict[str, int] = {}
+        for node in self.nodes:
+            if not node.skipped:
+                files.update(_file_sizes(node.files or []))
+        return sum(files.values())
+
+    def ranking(self) -> List[PlannedNode]:
+        """Returns the executed nodes sorted by their estimated cost.
+
+        The cost is given by the self time measured in a previous run (if
+        available) and by the size of the input files of a node otherwise.
+        """
+        return sorted(
+            (node for node in self.nodes if not node.skipped),
+            key=lambda node: (
+                -1.0 if node.estimated_time is None else node.estimated_time,
+                node.input_bytes,
+            ),
+            reverse=True,
+        )
+
+    def __str__(self):
+        lines = []
+        for node in self.ranking():
+            status = ''
+            if node.cache_valid:
+                status = ' [cache valid]'
+            elif node.result_cached:
+                status = ' [result cached]'
+            lines.append(f'{node.runner}: {node.input_bytes} bytes{status}')
+        skipped = sum(node.skipped for node in self.nodes)
+        lines.append(f'{skipped} of {len(self.nodes)} nodes skipped')
+        return '\n'.join(lines)
+
+
+def create_plan(
+    root: ProcessNode,
+    kwargs: Mapping[str, Any],
+    result_cache: Optional[ResultCache] = None,
+    profile: Optional[ProfileReport] = None,
+) -> WorkflowPlan:
+    """Creates the execution plan of a workflow without running any node.
+
+    Args:
+        root (ProcessNode): The last node of the workflow.
+        kwargs (Mapping[str, Any]): Runtime arguments of the workflow.
+        result_cache (Optional[ResultCache], optional): The result cache used
+            to run the workflow. Defaults to None.
+        profile (Optional[ProfileReport], optional): Profile of a previous run
+            used to estimate the cost of nodes. Defaults to None.
+
+    Returns:
+        WorkflowPlan: The plan.
+    """
+    context = ExecutionContext(root, kwargs, result_cache=result_cache)
+    times: Dict[str, float] = {}
+    for record in [] if profile is None else profile.nodes:
+        times[record.key] = times.get(record.key, 0.0) + record.self_time
+
+    planned: Dict[str, PlannedNode] = {}
+    active: Set[str] = set()
+    upstream_files: Dict[str, List[str]] = {}
+
+    def visit(node: ProcessNode, node_kwargs: Mapping[str, Any], executed: bool):
+        key = context.key(node, node_kwargs)
+        if key in planned and ((key in active) or not executed):
+            return key
+
+        if key not in planned:
+            planned[key] = _describe(context, node, node_kwargs, key)
+            planned[key].estimated_time = times.get(key, None)
+        item = planned[key]
+        if executed:
+            active.add(key)
+            # consumers of valid caches do not execute upstream nodes
+            executed = not (item.cache_valid or item.result_cached)
+
+        dependencies = node.get_dependencies()
+        item.dependencies = [
+            visit(
+                dependency,
+                node_kwargs if (index == 0) and (node.parent is not None) else {},
+                executed,
+            )
+            for index, dependency in enumerate(dependencies)
+        ]
+        return key
+
+    visit(root, kwargs, True)
+
+    def collect(key: str) -> List[str]:
+        # files read by the node and its upstream nodes (unknown files of
+        # nodes are ignored)
+        if key not in upstream_files:
+            item = planned[key]
+            files = list(item.files or [])
+            for dependency in item.dependencies:
+                files.extend(collect(dependency))
+            upstream_files[key] = list(dict.fromkeys(files))
+        return upstream_files[key]
+
+    for key, item in planned.items():
+        item.skipped = key not in active
+        item.input_bytes = sum(_file_sizes(collect(key)).values())
+
+    return WorkflowPlan(nodes=list(planned.values()))
+
+
+def _describe(
+    context: ExecutionContext,
+    node: ProcessNode,
+    kwargs: Mapping[str, Any],
+    key: str,
+) -> PlannedNode:
+    runner = node.runner
+    item = PlannedNode(
+        key=key, runner=runner.fullname, registered=is_registered(runner)
+    )
+
+    if isinstance(runner, Cache):
+        try:
+            item.cache_valid = runner.check_cache(node, **kwargs)
+        except Exception:
+            item.cache_valid = None
+
+    if context.result_cache is not None and runner.cacheable:
+        persistent_key = context.persistent_key(node, kwargs)
+        if persistent_key is not None:
+            item.result_cached = persistent_key in context.result_cache
+
+    # files read by the node itself
+    values = {
+        name: param.get_value()
+        for name, param in node.params.items()
+        if not isinstance(param, RunnableProcessParam)
+    }
+    if node.parent is None:
+        values.update(kwargs)
+    try:
+        files = runner.get_input_files(**values)
+    except Exception:
+        files = None
+    if files is None:
+        item.files = None
+    else:
+        item.files = [str(Path(file).absolute()) for file in files]
+        item.file_bytes = sum(_file_sizes(item.files).values())
+    return item
+
+
+def _file_sizes(files: List[str]) -> Dict[str, int]:
+    sizes = {}
+    for file in files:
+        try:
+            sizes[file] = Path(file).stat().st_size
+        except OSError:
+            sizes[file] = 0
+    return sizes
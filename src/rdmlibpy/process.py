@@ -1,21 +1,44 @@
+from __future__ import annotations
+
 import abc
+import inspect
 import os
 from pathlib import Path
-from typing import Any, Callable, List
+from typing import Any, Callable, ClassVar, List, Optional
+
+import pydantic
 
-from rdmlibpy.base import ProcessBase, ProcessNode
+from rdmlibpy._hashing import file_digest, fingerprint
+from rdmlibpy.base import ProcessBase, ProcessNode, RunnableProcessParam
+from rdmlibpy.execution import current_context
+from rdmlibpy.glob_index import GlobIndex
 
 
 class DelegatedSource(ProcessBase):
     name: str = 'delegated.source'
     version: str = '1'
     delegate: Callable[[], Any]
+    cacheable: ClassVar[bool] = False
 
     def run(self):
         return self.delegate()
 
 
 class Loader(ProcessBase):
+    # caches glob expansions of sources (e.g. to use a persisted index, set
+    # `Loader.glob_index = GlobIndex(directory=...)`)
+    glob_index: ClassVar[GlobIndex] = GlobIndex()
+
+    def get_input_files(self, source: Any = None, **params) -> Optional[List[Path]]:
+        if isinstance(source, (str, os.PathLike, list)):
+            try:
+                return list(Loader.glob(source))
+            except FileNotFoundError:
+                return None
+        else:
+            # e.g. text buffers
+            return None
+
     @staticmethod
     def glob(source: str | os.PathLike | List[str | os.PathLike]):
         if isinstance(source, List):
@@ -34,17 +57,22 @@ class Loader(ProcessBase):
                 root = path.parent
                 pattern = path.name
 
-            sources = list(root.glob(pattern))
+            # expanded lazily (the first matches are yielded while the
+            # directory tree is still walked)
+            found = False
+            for src in Loader.glob_index.glob(root, pattern):
+                found = True
+                yield src
 
-            if not sources:
+            if not found:
                 raise FileNotFoundError(
                     f'No sources found matching expression: {source}'
                 )
-            for src in sources:
-                yield src
 
 
 class Writer(ProcessBase):
+    cacheable: ClassVar[bool] = False
+
     @classmethod
     def ensure_path(cls, filepath: str | os.PathLike):
         """Ensures that the parent path of the given file exists.
@@ -65,6 +93,8 @@ class Writer(ProcessBase):
 
 
 class Serializer(ProcessBase):
+    cacheable: ClassVar[bool] = False
+
     def ensure_parent_path_exists(self, uri: Path):
         if not uri.parent.exists():
             uri.parent.mkdir(parents=True)
@@ -81,7 +111,107 @@ class Transform(ProcessBase):
     pass
 
 
+class FileState(pydantic.BaseModel):
+    path: str
+    size: int
+    mtime: int
+    sha256: Optional[str] = None
+
+    @classmethod
+    def create(cls, filename: str | os.PathLike):
+        path = Path(filename).absolute()
+        stat = path.stat()
+        return cls(path=str(path), size=stat.st_size, mtime=stat.st_mtime_ns)
+
+    def matches(self, other: FileState):
+        if self.path != other.path:
+            return False
+        if (self.size == other.size) and (self.mtime == other.mtime):
+            return True
+        # the file has been touched or modified; compare contents only if a
+        # hash is known (sizes differ for sure if the contents differ)
+        if (self.sha256 is None) or (self.size != other.size):
+            return False
+        return self.sha256 == file_digest(other.path)
+
+
+class CacheManifest(pydantic.BaseModel):
+    """Describes the inputs of a cached value.
+
+    The manifest contains the fingerprint of the upstream workflow and the
+    state of the files read by the upstream nodes. It is stored together with
+    the cached value and a cache is considered invalid, if the manifest does
+    not match the current state of the workflow.
+    """
+
+    upstream: str
+    files: List[FileState]
+
+    @classmethod
+    def create(cls, node: ProcessNode, **kwargs) -> Optional[CacheManifest]:
+        """Creates the manifest for the parent of the given cache node.
+
+        Only the size & modification time of the input files are collected
+        (see `with_hashes`).
+
+        Args:
+            node (ProcessNode): The cache node.
+            **kwargs: Runtime arguments passed to the cache node.
+
+        Returns:
+            Optional[CacheManifest]: The manifest or `None`, if the inputs of
+                the upstream workflow cannot be determined.
+        """
+        if node.parent is None:
+            return None
+        upstream = node.parent.persistent_fingerprint()
+        files = node.parent.get_input_files(**kwargs)
+        if (upstream is None) or (files is None):
+            return None
+        try:
+            states = [FileState.create(file) for file in files]
+        except OSError:
+            return None
+        return cls(
+            upstream=fingerprint(dict(node=upstream, kwargs=kwargs)), files=states
+        )
+
+    def with_hashes(self) -> CacheManifest:
+        """Returns a copy of the manifest including the hashes of all files.
+
+        Caches storing hashes remain valid, if input files are touched
+        without modifying their contents.
+        """
+        files = [
+            file.model_copy(update=dict(sha256=file_digest(file.path)))
+            for file in self.files
+        ]
+        return self.model_copy(update=dict(files=files))
+
+    def matches(self, other: CacheManifest):
+        """Checks whether the inputs of the other manifest are unchanged.
+
+        Only the size & modification time of files are compared, unless they
+        differ and this manifest contains the hashes of the files.
+
+        Args:
+            other (CacheManifest): The manifest of the current workflow.
+
+        Returns:
+            bool: `True`, if the manifests match.
+        """
+        if self.upstream != other.upstream:
+            return False
+        if len(self.files) != len(other.files):
+            return False
+        return all(old.matches(new) for old, new in zip(self.files, other.files))
+
+
 class Cache(Writer):
+    # caches supporting manifests receive the manifest of the current
+    # workflow as `manifest` argument in `write` and `cache_is_valid`
+    uses_manifest: ClassVar[bool] = False
+
     def run(self, source, **params):
         # check if cache is valid
         if self.cache_is_valid(**params):
@@ -91,20 +221,95 @@ class Cache(Writer):
             # write source to cache
             self.write(source, **params)
 
-            # return source unaltered
-            return source
+            # return source (unaltered)
+            return self.written(source, **params)
+
+    def check_cache(self, node: ProcessNode, **kwargs) -> Optional[bool]:
+        """Checks whether the cache of a node is valid without running any
+        other node.
+
+        Args:
+            node (ProcessNode): The cache node.
+            **kwargs: Runtime arguments passed to the cache node.
+
+        Returns:
+            Optional[bool]: Whether the cache is valid or `None`, if the check
+                requires the evaluation of executable parameters.
+        """
+        eager = self._validity_params(node)
+        if any(isinstance(param, RunnableProcessParam) for param in eager.values()):
+            return None
+
+        params = {key: param.get_value() for key, param in eager.items()}
+        if node.parent is None:
+            params.update(kwargs)
+        extra = {}
+        if self.uses_manifest:
+            extra['manifest'] = CacheManifest.create(node, **kwargs)
+        return self.cache_is_valid(**params, **extra)
+
+    def _validity_params(self, node: ProcessNode):
+        # the parameters required to check the validity of the cache;
+        # executable parameters are only evaluated upfront, if they are
+        # explicitly named in the signature of `cache_is_valid`
+        required = {
+            name
+            for name, parameter in inspect.signature(
+                self.cache_is_valid
+            ).parameters.items()
+            if parameter.kind != inspect.Parameter.VAR_KEYWORD
+        }
+        return {
+            key: param
+            for key, param in node.params.items()
+            if (key in required) or not isinstance(param, RunnableProcessParam)
+        }
+
+    def _run_with_node(self, node: ProcessNode, **kwargs):
+        # resolve the parameters required to check the validity of the cache
+        eager = self._validity_params(node)
+        _, params = ProcessNode._evaluate(None, eager)
+        if node.parent is None:
+            params.update(kwargs)
 
-    def _run_with_node(self, node: ProcessNode):
-        # get parameters
-        params = node.get_params()
+        extra = {}
+        if self.uses_manifest:
+            extra['manifest'] = CacheManifest.create(node, **kwargs)
 
         # check if cache is valid
-        if self.cache_is_valid(**params):
-            # return cached value
+        context = current_context()
+        if self.cache_is_valid(**params, **extra):
+            # return cached value (without running upstream nodes)
+            if context is not None:
+                context.annotate(cache='hit')
             return self.read(**params)
-        else:
-            # run process normally (and save value to cache)
-            return super()._run_with_node(node)
+        if context is not None:
+            context.annotate(cache='miss')
+
+        # run parent process & remaining parameters (and save value to cache)
+        source_branch = None if node.parent is None else (node.parent, kwargs)
+        remaining = {
+            key: param for key, param in node.params.items() if key not in eager
+        }
+        source, resolved = ProcessNode._evaluate(source_branch, remaining)
+        params.update(resolved)
+        if node.parent is None:
+            source = params.pop('source')
+
+        self.write(source, **params, **extra)
+        return self.written(source, **params)
+
+    def written(self, source, **kwargs):
+        """Returns the value passed on after writing `source` to the cache.
+
+        Caches of values, which are consumed by writing them (e.g. streams),
+        return the cached value instead.
+
+        Args:
+            source: The value written to the cache.
+            **kwargs: The parameters of the cache.
+        """
+        return source
 
     @abc.abstractmethod
     def read(self, **kwargs):
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    cast,
+)
+
+import pydantic
+
+try:
+    import resource
+except ImportError:  # pragma: no cover (Windows)
+    resource = None
+
+if TYPE_CHECKING:
+    from .base import ProcessNode
+
+
+class NodeProfile(pydantic.BaseModel):
+    """Measurements of a single node execution.
+
+    All times are given in seconds. The wall time includes the evaluation of
+    the inputs (parent node & executable parameters), while the self time and
+    the CPU time only cover the node itself.
+
+    The peak RSS delta (in bytes) is the increase of the high-water mark of
+    the resident memory of the whole process during the execution (including
+    the inputs and any concurrently executed nodes). It is not the peak memory
+    of the node itself: it is zero, if the node does not exceed the peak of
+    previously executed nodes.
+    """
+
+    runner: str
+    key: str
+    pid: int
+    thread: int
+    start: float
+    wall_time: float
+    self_time: float
+    cpu_time: float
+    peak_rss_delta: Optional[int] = None
+    output_type: Optional[str] = None
+    output_shape: Optional[List[int] | Dict[str, int]] = None
+    output_rows: Optional[int] = None
+    cache: Optional[Literal['hit', 'miss']] = None
+    error: Optional[str] = None
+
+
+class ProfileReport(pydantic.BaseModel):
+    """Profile of a workflow run (see `Workflow.run`)."""
+
+    nodes: List[NodeProfile] = []
+
+    def ranking(self) -> List[NodeProfile]:
+        """Returns the node profiles sorted by their self time (descending)."""
+        return sorted(self.nodes, key=lambda node: node.self_time, reverse=True)
+
+    def to_json(self, filename: Optional[str | os.PathLike] = None) -> str:
+        """Converts the report to JSON.
+
+        Args:
+            filename (Optional[str | os.PathLike], optional): Also writes the
+                report to the given file. Defaults to None.
+
+        Returns:
+            str: The JSON representation of the report.
+        """
+        text = self.model_dump_json(indent=2)
+        if filename is not None:
+            Path(filename).write_text(text, encoding='utf-8')
+        return text
+
+    def to_chrome_trace(
+        self, filename: Optional[str | os.PathLike] = None
+    ) -> Dict[str, Any]:
+        """Converts the report to the Chrome trace event format.
+
+        The trace can be opened in `chrome://tracing` or https://ui.perfetto.dev.
+
+        Args:
+            filename (Optional[str | os.PathLike], optional): Also writes the
+                trace to the given file. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: The trace events.
+        """
+        origin = min((node.start for node in self.nodes), default=0.0)
+        events = [
+            dict(
+                name=node.runner,
+                cat='cache' if node.cache == 'hit' else 'node',
+                ph='X',
+                ts=(node.start - origin) * 1e6,
+                dur=node.wall_time * 1e6,
+                pid=node.pid,
+                tid=node.thread,
+                args=node.model_dump(
+                    exclude={'runner', 'pid', 'thread', 'start'}, exclude_none=True
+                ),
+            )
+            for node in self.nodes
+        ]
+        trace = dict(traceEvents=events, displayTimeUnit='ms')
+        if filename is not None:
+            Path(filename).write_text(json.dumps(trace), encoding='utf-8')
+        return trace
+
+
+class _ActiveRecord:
+    # measurements of a node, which is currently executed
+    def __init__(self):
+        self.inputs_wall = 0.0
+        self.inputs_cpu = 0.0
+        self.info: Dict[str, Any] = {}
+
+
+_active_record: ContextVar[Optional[_ActiveRecord]] = ContextVar(
+    'rdmlibpy_profile_record', default=None
+)
+
+
+class Profiler:
+    """Collects the measurements of nodes during a workflow run."""
+
+    def __init__(self):
+        self._nodes: List[NodeProfile] = []
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def record(self, node: ProcessNode, key: str):
+        """Measures the execution of a node.
+
+        Args:
+            node (ProcessNode): The executed node.
+            key (str): The key of the node invocation.
+
+        Yields:
+            Dict[str, Any]: Additional information about the execution (e.g.
+                the output), which is stored in the node profile.
+        """
+        record = _ActiveRecord()
+        token = _active_record.set(record)
+        start = time.time()
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        rss = _peak_rss()
+        try:
+            yield record.info
+        except BaseException as exc:
+            record.info['error'] = f'{type(exc).__name__}: {exc}'
+            raise
+        finally:
+            _active_record.reset(token)
+            wall = time.perf_counter() - wall
+            cpu = time.thread_time() - cpu
+            peak_rss_delta = None
+            if rss is not None:
+                peak_rss_delta = cast(int, _peak_rss()) - rss
+
+            info = dict(record.info)
+            output = info.pop('output', None)
+            profile = NodeProfile(
+                runner=node.runner.fullname,
+                key=key,
+                pid=os.getpid(),
+                thread=threading.get_ident(),
+                start=start,
+                wall_time=wall,
+                self_time=max(wall - record.inputs_wall, 0.0),
+                cpu_time=max(cpu - record.inputs_cpu, 0.0),
+                peak_rss_delta=peak_rss_delta,
+                **_describe_output(output, 'error' not in info),
+                **info,
+            )
+            with self._lock:
+                self._nodes.append(profile)
+
+    @contextlib.contextmanager
+    def inputs(self):
+        """Measures the evaluation of the inputs of the current node."""
+        record = _active_record.get()
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            if record is not None:
+                record.inputs_wall += time.perf_counter() - wall
+                record.inputs_cpu += time.thread_time() - cpu
+
+    def annotate(self, **info):
+        """Adds information to the profile of the current node."""
+        record = _active_record.get()
+        if record is not None:
+            record.info.update(info)
+
+    def extend(self, nodes: Iterable[NodeProfile]):
+        """Adds node profiles (e.g. recorded by worker processes)."""
+        with self._lock:
+            self._nodes.extend(nodes)
+
+    def report(self) -> ProfileReport:
+        with self._lock:
+            nodes = sorted(self._nodes, key=lambda node: node.start)
+        return ProfileReport(nodes=nodes)
+
+
+def _peak_rss() -> Optional[int]:
+    # peak resident set size (high-water mark) of the process in bytes
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macOS and in kilobytes on Linux
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _describe_output(output: Any, available: bool) -> Dict[str, Any]:
+    if not available:
+        return {}
+
+    description: Dict[str, Any] = dict(output_type=type(output).__qualname__)
+    shape = getattr(output, 'shape', None)
+    if isinstance(shape, tuple):
+        description['output_shape'] = [int(size) for size in shape]
+        if shape:
+            description['output_rows'] = int(shape[0])
+    elif hasattr(output, 'sizes'):
+        # xarray datasets
+        description['output_shape'] = {
+            str(dim): int(size) for dim, size in dict(output.sizes).items()
+        }
+    elif isinstance(output, (list, tuple, dict)):
+        description['output_rows'] = len(output)
+    return description
@@ -14,6 +14,11 @@ def register(runner: ProcessBase):
     _registry[runner.fullname] = runner
 
 
+def is_registered(runner: ProcessBase):
+    # check if the runner can be re-created from its name and configuration
+    return type(_registry.get(runner.fullname, None)) is type(runner)
+
+
 def get_runner(name: str, **config):
     # `updated` makes sure, that we return a new instance as to avoid
     # changing properties of registered runners
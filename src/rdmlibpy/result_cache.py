@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from ._hashing import file_digest
+
+
+class ResultCache:
+    """Persistent on-disk cache of node results.
+
+    Results are stored as pickle files named by the key of the node
+    invocation. The keys are computed by the execution context from the
+    runner (name, version and configuration), the parameters, the keys of
+    upstream nodes and the state (size & modification time) of the files
+    read by loaders. A result is therefore invalidated automatically, if the
+    workflow or the input files change.
+
+    The total size of the cache is limited by evicting the least recently
+    used entries.
+
+    Args:
+        directory (str | os.PathLike): The directory of the cache files.
+        max_size (int, optional): The maximum total size of the cache in
+            bytes. Defaults to 10 GiB.
+        hash_files (bool, optional): Use a hash of the contents of input files
+            in the keys instead of their size & modification time. Defaults
+            to False.
+    """
+
+    suffix = '.pickle'
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_size: int = 10 * 1024**3,
+        hash_files: bool = False,
+    ):
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.hash_files = hash_files
+        self._lock = threading.Lock()
+        self._file_hashes: Dict[Tuple[str, int, int], str] = {}
+
+    def __getstate__(self):
+        # the cache is sent to worker processes
+        return dict(
+            directory=self.directory, max_size=self.max_size, hash_files=self.hash_files
+        )
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(**state)
+
+    def __contains__(self, key: str):
+        return self._filename(key).exists()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Loads a result from the cache.
+
+        Args:
+            key (str): The key of the result.
+
+        Returns:
+            Tuple[bool, Any]: Whether the result was found and the result
+                (or `None`).
+        """
+        filename = self._filename(key)
+        try:
+            with open(filename, 'rb') as fp:
+                value = pickle.load(fp)
+        except FileNotFoundError:
+            return False, None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # corrupted or outdated entry
+            filename.unlink(missing_ok=True)
+            return False, None
+
+        # mark entry as recently used
+        try:
+            os.utime(filename)
+        except FileNotFoundError:
+            pass
+        return True, value
+
+    def put(self, key: str, value: Any) -> bool:
+        """Stores a result in the cache.
+
+        Args:
+            key (str): The key of the result.
+            value (Any): The result.
+
+        Returns:
+            bool: `False`, if the result cannot be pickled.
+        """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+        if len(data) > self.max_size:
+            return False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # write atomically, such that concurrent readers never see partial files
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(data)
+            os.replace(tmp, self._filename(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        self.evict()
+        return True
+
+    def evict(self):
+        """Removes the least recently used entries exceeding the maximum size."""
+        with self._lock:
+            entries = []
+            for filename in self.directory.glob(f'*{self.suffix}'):
+                try:
+                    stat = filename.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, filename))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, filename in sorted(entries, key=lambda item: item[0]):
+                if total <= self.max_size:
+                    break
+                filename.unlink(missing_ok=True)
+                total -= size
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        for filename in self.directory.glob(f'*{self.suffix}'):
+            filename.unlink(missing_ok=True)
+
+    def file_state(self, filename: str | os.PathLike) -> Optional[Dict[str, Any]]:
+        """Returns the state of an input file, which is included in the keys.
+
+        Args:
+            filename (str | os.PathLike): The input file.
+
+        Returns:
+            Optional[Dict[str, Any]]: The path and the size & modification
+                time (or content hash) of the file or `None`, if the file does
+                not exist.
+        """
+        path = Path(filename).resolve()
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        if not self.hash_files:
+            return dict(path=str(path), size=stat.st_size, mtime=stat.st_mtime_ns)
+
+        # files, which are touched without changing their contents, keep
+        # their cached results
+        index = (str(path), stat.st_size, stat.st_mtime_ns)
+        if index not in self._file_hashes:
+            self._file_hashes[index] = file_digest(path)
+        return dict(path=str(path), sha256=self._file_hashes[index])
+
+    def _filename(self, key: str):
+        return self.directory / f'{key}{self.suffix}'
@@ -1,4 +1,6 @@
 from pathlib import Path
+from typing import ClassVar
+
 import pandas as pd
 
 
@@ -11,6 +13,7 @@ class FileCache(ProcessBase):
     name: str = 'file.cache'
     version: str = '1'
     serializer: str = 'auto'
+    cacheable: ClassVar[bool] = False
 
     def get_serializer(self, source):
         if self.serializer == 'auto':
@@ -4,9 +4,14 @@ from typing import Any, Dict, Literal
 import pandas as pd
 import pydantic
 
+from ..dataframes.dataframes_columnar import (
+    READ_OPTIONS,
+    read_columnar,
+    write_columnar,
+)
 from ..process import Serializer
 
-DataFrameFormat = Literal['csv', 'HDF5']
+DataFrameFormat = Literal['csv', 'HDF5', 'parquet', 'feather']
 
 
 class PandasDataFrameSerializer(Serializer):
@@ -21,6 +26,13 @@ class PandasDataFrameSerializer(Serializer):
                 return pd.read_csv(uri, encoding='utf-8', **self.options)
             case 'HDF5':
                 return pd.read_hdf(uri, self.options.get('key', 'data'))
+            case 'parquet' | 'feather':
+                options = {
+                    key: value
+                    for key, value in self.options.items()
+                    if key in READ_OPTIONS
+                }
+                return read_columnar(uri, self.format, **options)
             case _:
                 raise ValueError(f'Unsupported format: {self.format}')
 
@@ -33,6 +45,15 @@ class PandasDataFrameSerializer(Serializer):
                 if 'key' not in options:
                     options.update(key='data')
                 source.to_hdf(self.ensure_parent_path_exists(uri), **options)
+            case 'parquet' | 'feather':
+                options = {
+                    key: value
+                    for key, value in self.options.items()
+                    if key not in READ_OPTIONS
+                }
+                write_columnar(
+                    source, self.ensure_parent_path_exists(uri), self.format, **options
+                )
             case _:
                 raise ValueError(f'Unsupported format: {self.format}')
 
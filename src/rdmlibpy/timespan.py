@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+import pydantic
+
+
+class Timespan(pydantic.BaseModel, frozen=True):
+    """Time window selected from a timestamp column (or variable).
+
+    Windows selected by `dataframe.select.timespan` and
+    `xarray.select.timespan` are pushed into upstream loaders when the
+    workflow is created (see `Workflow.create`), such that loaders can skip
+    files outside the window. The window is passed to the loader as the
+    `timespan` parameter (a plain mapping of this model).
+
+    Attributes:
+        column: The name of the timestamp column.
+        start: The start of the window (ISO 8601) or None (unbounded).
+        stop: The end of the window (ISO 8601) or None (unbounded).
+    """
+
+    column: str
+    start: Optional[str] = None
+    stop: Optional[str] = None
+
+    @classmethod
+    def create(cls, column: str, start: Any = None, stop: Any = None):
+        return cls(column=column, start=_isoformat(start), stop=_isoformat(stop))
+
+    @property
+    def bounds(self) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+        return _timestamp(self.start), _timestamp(self.stop)
+
+    def renamed(self, column: str) -> Timespan:
+        return self.model_copy(update=dict(column=column))
+
+    def shifted(self, offset: datetime.timedelta) -> Timespan:
+        """Shifts the window by the given offset."""
+        start, stop = self.bounds
+        return Timespan.create(
+            self.column,
+            None if start is None else start + offset,
+            None if stop is None else stop + offset,
+        )
+
+    def union(self, other: Timespan) -> Optional[Timespan]:
+        """Smallest window containing both windows of the same column (None,
+        if the columns differ).
+        """
+        if other.column != self.column:
+            return None
+        (start1, stop1), (start2, stop2) = self.bounds, other.bounds
+        return Timespan.create(
+            self.column,
+            None if (start1 is None) or (start2 is None) else min(start1, start2),
+            None if (stop1 is None) or (stop2 is None) else max(stop1, stop2),
+        )
+
+    def overlaps(self, first: Any, last: Any) -> bool:
+        """Checks whether the window overlaps the closed interval
+        `[first, last]` (`None` marks an unbounded end).
+        """
+        start, stop = self.bounds
+        first, last = _timestamp(first), _timestamp(last)
+        if (start is not None) and (last is not None) and (last < start):
+            return False
+        if (stop is not None) and (first is not None) and (stop < first):
+            return False
+        return True
+
+    def select_files(
+        self,
+        paths: Iterable[Path],
+        filename_format: Optional[str],
+        ranges: Optional[Dict[Path, Tuple[Any, Any]]] = None,
+        margin: Any = '1 s',
+    ) -> List[Path]:
+        """Selects the files, which may contain data within the window.
+
+        The files are assumed to be named by the timestamp of their first
+        record (e.g. log files of data loggers), such that the data of a file
+        ends before the start of the next file. As timestamps in file names
+        are typically truncated (e.g. to whole seconds), the ranges of files
+        derived from their names are widened by `margin`. Files without a
+        timestamp in their name are kept, unless their range of timestamps is
+        known (`ranges`). The order of the files is kept.
+
+        Args:
+            paths (Iterable[Path]): The files.
+            filename_format (Optional[str]): Format (see `datetime.strptime`)
+                of the timestamp in the file names (without suffix).
+            ranges (Optional[Dict[Path, Tuple[Any, Any]]], optional): Known
+                ranges (first & last timestamp) of files. Defaults to None.
+            margin (Any, optional): Margin of the ranges derived from file
+                names. Defaults to '1 s'.
+
+        Returns:
+            List[Path]: The selected files.
+        """
+        paths = list(paths)
+        ranges = {} if ranges is None else ranges
+
+        starts = {}
+        for path in paths if filename_format is not None else []:
+            try:
+                starts[path] = datetime.datetime.strptime(path.stem, filename_format)
+            except ValueError:
+                pass
+
+        # the data of a file ends before the next file starts
+        ends = {}
+        ordered = sorted(starts, key=lambda path: starts[path])
+        for path, following in zip(ordered, ordered[1:]):
+            ends[path] = starts[following]
+
+        margin = pd.Timedelta(margin)
+
+        def is_selected(path: Path):
+            if path in ranges:
+                return self.overlaps(*ranges[path])
+            elif path in starts:
+                first, end = starts[path] - margin, ends.get(path)
+                start, stop = self.bounds
+                if (end is not None) and (start is not None):
+                    if end + margin <= start:
+                        return False
+                return self.overlaps(first, None)
+            return True
+
+        return [path for path in paths if is_selected(path)]
+
+
+def _timestamp(value: Any) -> Optional[pd.Timestamp]:
+    if value is None:
+        return None
+    timestamp = pd.Timestamp(value)
+    # file names and data are compared by wall time
+    return timestamp.tz_localize(None) if timestamp.tzinfo is not None else timestamp
+
+
+def _isoformat(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return pd.Timestamp(value).isoformat()
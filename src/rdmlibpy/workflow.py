@@ -1,10 +1,31 @@
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import inspect
+import os
 from collections import deque
-from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 from . import base
-from .registry import get_runner
+from .execution import ExecutionContext, RemotePolicy
+from .planning import WorkflowPlan, create_plan
+from .process import Loader
+from .profiling import Profiler, ProfileReport
+from .registry import get_runner, is_registered
+from .result_cache import ResultCache
+from .timespan import Timespan
 from .metadata import MetadataNode, Metadata
 
 PlainProcessDescriptorType = str | base.ProcessBase
@@ -16,6 +37,28 @@ ProcessDescriptorType = (
     | PlainProcessDescriptorType
 )
 WorkflowDescriptorType = ProcessDescriptorType | Sequence['WorkflowDescriptorType']
+ExecutorType = Literal['serial', 'threads', 'processes']
+
+
+def _merge_timespans(first: Timespan, second: Timespan):
+    # rows within any of the windows selected downstream
+    return first.union(second)
+
+
+def _merge_columns(first: List[str], second: List[str]):
+    # columns used by any selection downstream
+    return first + [column for column in second if column not in first]
+
+
+# selections pushed into loaders: name of the loader parameter, merge of the
+# selections of multiple consumers of a node (None: select everything) and
+# the conversion into a plain parameter value; see `Workflow.create`
+PUSH_DOWN_PARAMS: Dict[
+    str, Tuple[Callable[[Any, Any], Any], Callable[[Any], Any]]
+] = dict(
+    timespan=(_merge_timespans, Timespan.model_dump),
+    columns=(_merge_columns, list),
+)
 
 
 def run(workflow: WorkflowDescriptorType):
@@ -26,14 +69,289 @@ class Workflow:
     def __init__(self, process: base.ProcessNode):
         self.process = process
 
-    def run(self, **kwargs):
-        return self.process.run(**kwargs)
+    def run(
+        self,
+        executor: ExecutorType = 'serial',
+        max_workers: Optional[int] = None,
+        remote_policy: RemotePolicy = 'cpu-bound',
+        result_cache: ResultCache | str | os.PathLike | None = None,
+        profile: bool = False,
+        **kwargs,
+    ):
+        """Runs the workflow.
+
+        Args:
+            executor (ExecutorType, optional): Use `threads` to evaluate
+                independent branches of the workflow (e.g. the inputs of a
+                join) concurrently in a thread pool, or `processes` to run
+                them in worker processes. Defaults to 'serial'.
+            max_workers (Optional[int], optional): Maximum number of workers.
+                Defaults to None (see `concurrent.futures`).
+            remote_policy (RemotePolicy, optional): Selects the branches, which
+                are run in worker processes (see `ExecutionContext`). Defaults
+                to 'cpu-bound'.
+            result_cache (ResultCache | str | os.PathLike | None, optional):
+                Persistent cache (or its directory) for the results of nodes.
+                Nodes with a valid cached result are skipped together with
+                their upstream nodes. Defaults to None.
+            profile (bool, optional): Measures the execution of each node
+                (see `ProfileReport`). Defaults to False.
+            **kwargs: Runtime arguments passed to the first process of the
+                main chain.
+
+        Returns:
+            Any: The result of the last process or, if `profile` is set, a
+                tuple of the result and the `ProfileReport`.
+        """
+        if (result_cache is not None) and not isinstance(result_cache, ResultCache):
+            result_cache = ResultCache(result_cache)
+
+        profiler = Profiler() if profile else None
+
+        with Workflow._create_executor(executor, max_workers) as pool:
+            with ExecutionContext(
+                self.process,
+                kwargs,
+                executor=pool,
+                remote_policy=remote_policy,
+                result_cache=result_cache,
+                profiler=profiler,
+            ):
+                result = self.process.run(**kwargs)
+
+        if profiler is not None:
+            return result, profiler.report()
+        return result
+
+    def plan(
+        self,
+        result_cache: ResultCache | str | os.PathLike | None = None,
+        profile: Optional[ProfileReport] = None,
+        **kwargs,
+    ) -> WorkflowPlan:
+        """Compiles the execution plan of the workflow without running it.
+
+        The plan lists the runners of all nodes, the caches which are
+        currently valid (including the result cache, if given), the files read
+        by loaders (and their total size) and the nodes ranked by their
+        estimated cost.
+
+        Args:
+            result_cache (ResultCache | str | os.PathLike | None, optional):
+                The result cache used to run the workflow. Defaults to None.
+            profile (Optional[ProfileReport], optional): Profile of a previous
+                run (see `run`), which is used to estimate the cost of nodes.
+                Defaults to None.
+            **kwargs: Runtime arguments passed to the first process of the
+                main chain.
+
+        Returns:
+            WorkflowPlan: The execution plan.
+        """
+        if (result_cache is not None) and not isinstance(result_cache, ResultCache):
+            result_cache = ResultCache(result_cache)
+        return create_plan(self.process, kwargs, result_cache, profile)
 
     @staticmethod
-    def create(descriptor: WorkflowDescriptorType):
+    def _create_executor(executor: ExecutorType, max_workers: Optional[int]):
+        match executor:
+            case 'serial':
+                return contextlib.nullcontext()
+            case 'threads':
+                return concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix='rdmlibpy'
+                )
+            case 'processes':
+                return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+            case _:
+                raise ValueError(f'Invalid executor: {executor}')
+
+    @staticmethod
+    def to_descriptor(node: base.ProcessNode) -> List[Dict[str, Any]]:
+        """Converts a process node (and its parents) into a workflow descriptor.
+
+        The descriptor contains the names and configurations of the runners,
+        such that the workflow can be re-created with `Workflow.create` (e.g.
+        in another process). All runners must be registered.
+
+        Args:
+            node (base.ProcessNode): The last node of the process chain.
+
+        Raises:
+            ValueError: If a runner is not registered.
+
+        Returns:
+            List[Dict[str, Any]]: The workflow descriptor.
+        """
+        chain = []
+        current: Optional[base.ProcessNode] = node
+        while current is not None:
+            runner = current.runner
+            if not is_registered(runner):
+                raise ValueError(f'The runner {runner.fullname} is not registered.')
+
+            params = {}
+            for key, param in current.params.items():
+                if isinstance(param, base.RunnableProcessParam):
+                    params[f'${key}'] = Workflow.to_descriptor(param.node)
+                else:
+                    params[key] = param.get_value()
+
+            chain.insert(
+                0,
+                {
+                    'run': runner.fullname,
+                    'config': runner.get_config(),
+                    'params': params,
+                },
+            )
+            current = current.parent
+        return chain
+
+    @staticmethod
+    def create(
+        descriptor: WorkflowDescriptorType,
+        share_nodes: bool = True,
+        push_down: bool = False,
+    ):
+        """Creates a workflow from the given descriptor.
+
+        Args:
+            descriptor (WorkflowDescriptorType): The workflow descriptor.
+            share_nodes (bool, optional): Replace structurally identical
+                (sub-)processes by a single node, such that they are executed
+                only once per run. Defaults to True.
+            push_down (bool, optional): Push selections of processes into
+                upstream loaders: time windows (e.g. of
+                `dataframe.select.timespan`), such that loaders skip files
+                outside the window, and columns (of
+                `dataframe.select.columns`), such that loaders parse the
+                selected columns only. Loaders shared by several branches
+                load the union of their selections. The selections are added
+                to the parameters of the loaders (changing the fingerprints of
+                their results). Defaults to False.
+
+        Returns:
+            Workflow: The workflow instance.
+        """
         if isinstance(descriptor, MetadataNode):
             descriptor = cast(dict, Metadata.to_container(descriptor))
-        return Workflow(Workflow._create(None, descriptor))
+        process = Workflow._create(None, descriptor)
+        if share_nodes:
+            process = Workflow._share_nodes(process, {}, {})
+        if push_down:
+            for param, (merge, to_value) in PUSH_DOWN_PARAMS.items():
+                Workflow._push_down(process, param, merge, to_value)
+        return Workflow(process)
+
+    @staticmethod
+    def _share_nodes(
+        node: base.ProcessNode,
+        shared: Dict[str, base.ProcessNode],
+        memo: Dict[int, str],
+    ) -> base.ProcessNode:
+        # hash-consing of process nodes; the graph is traversed bottom-up and
+        # each node is replaced by the first node with the same fingerprint
+        if node.parent is not None:
+            node.parent = Workflow._share_nodes(node.parent, shared, memo)
+        for param in node.params.values():
+            if isinstance(param, base.RunnableProcessParam):
+                param.node = Workflow._share_nodes(param.node, shared, memo)
+
+        return shared.setdefault(node.fingerprint(memo), node)
+
+    @staticmethod
+    def _push_down(
+        root: base.ProcessNode,
+        param: str,
+        merge: Callable[[Any, Any], Any],
+        to_value: Callable[[Any], Any],
+    ):
+        # pushes the selections of processes (e.g. the time window returned by
+        # `selected_timespan`) across upstream processes (`push_down_timespan`)
+        # into the loaders at the start of the chains; shared nodes receive
+        # the merged selections of all their consumers
+        order: List[base.ProcessNode] = []
+        visited = set()
+
+        def visit(node: base.ProcessNode):
+            if id(node) not in visited:
+                visited.add(id(node))
+                for dependency in node.get_dependencies():
+                    visit(dependency)
+                order.append(node)
+
+        visit(root)
+
+        # selections required by the consumers of each node (None: everything);
+        # consumers are visited before their dependencies
+        required: Dict[int, List[Any]] = {id(root): [None]}
+        for node in reversed(order):
+            selections = iter(required[id(node)])
+            value = next(selections)
+            for selection in selections:
+                if (value is None) or (selection is None):
+                    value = None
+                    break
+                value = merge(value, selection)
+
+            for item in node.params.values():
+                # executable parameters may use all of their data
+                if isinstance(item, base.RunnableProcessParam):
+                    required.setdefault(id(item.node), []).append(None)
+
+            params = Workflow._get_plain_params(node)
+            if node.parent is not None:
+                required.setdefault(id(node.parent), []).append(
+                    Workflow._get_input_selection(node, params, param, value)
+                )
+            elif (
+                (value is not None)
+                and (params is not None)
+                and (param not in params)
+                and isinstance(node.runner, Loader)
+                and (param in inspect.signature(node.runner.run).parameters)
+            ):
+                node.params[param] = base.PlainProcessParam(value=to_value(value))
+
+    @staticmethod
+    def _get_input_selection(
+        node: base.ProcessNode,
+        params: Optional[Dict[str, Any]],
+        param: str,
+        value: Any,
+    ) -> Any:
+        # selection of the input (parent) of a node, given the selection of
+        # its output
+        if params is None:
+            return None
+        selected_hook = getattr(node.runner, f'selected_{param}')
+        push_down_hook = getattr(node.runner, f'push_down_{param}')
+        try:
+            inspect.signature(selected_hook).bind(**params)
+            inspect.signature(push_down_hook).bind(value, **params)
+        except TypeError:
+            # invalid parameters (raised when running the process)
+            return None
+        try:
+            selected = selected_hook(**params)
+            if (selected is None) and (value is not None):
+                selected = push_down_hook(value, **params)
+        except Exception as exc:
+            raise ValueError(
+                f'Cannot push down {param} across {node.runner.fullname}: {exc}'
+            ) from exc
+        return selected
+
+    @staticmethod
+    def _get_plain_params(node: base.ProcessNode) -> Optional[Dict[str, Any]]:
+        # parameter values known before running the workflow (or None)
+        params = {}
+        for key, param in node.params.items():
+            if isinstance(param, base.RunnableProcessParam):
+                return None
+            params[key] = param.get_value()
+        return params
 
     @staticmethod
     def _create(
@@ -76,7 +394,9 @@ class Workflow:
             if key.startswith('$'):
                 # value itself is a process
                 params[key[1:]] = base.RunnableProcessParam(
-                    node=Workflow.create(value).process
+                    node=Workflow.create(
+                        value, share_nodes=False, push_down=False
+                    ).process
                 )
             else:
                 params[key] = base.PlainProcessParam(value=value)
@@ -15,6 +15,7 @@ from .xarray_transforms import (
     XArrayAttributes,
     XArrayCreateDataTree,
     XArrayMerge,
+    XArrayResample,
     XArraySetCoords,
     XArraySqueeze,
     XArrayStatisticsMean,
@@ -29,6 +30,7 @@ register(XArrayAttributes())
 register(XArrayCreateDataTree())
 register(XArrayFileCache())
 register(XArrayMerge())
+register(XArrayResample())
 register(XArraySelectIndexRange())
 register(XArraySelectRange())
 register(XArraySelectRangeV1_1())
@@ -1,7 +1,8 @@
 import logging
 from pathlib import Path
-from typing import Dict, List, Literal
+from typing import ClassVar, Dict, List, Literal, Optional
 
+import h5netcdf
 import numpy as np
 import pint
 import pint_xarray
@@ -10,11 +11,12 @@ from rdmlibpy.metadata.flattery import flatten, rebuild
 import xarray as xr
 
 from .._typing import FilePath
-from ..process import Cache
+from ..process import Cache, CacheManifest
 
 logger = logging.getLogger(__name__)
 
 ParseDatesType = None | List[str] | Dict[str, List[str]]
+MANIFEST_ATTRIBUTE = 'rdmlibpy:manifest'
 
 _ = pint_xarray.unit_registry
 
@@ -38,6 +40,7 @@ class TimeEncoding(pydantic.BaseModel):
 class XArrayFileCache(Cache):
     name: str = 'xarray.cache'
     version: str = '1'
+    uses_manifest: ClassVar[bool] = True
 
     flatten_attributes: bool = True
     flatten_separator: str = ':::'
@@ -45,6 +48,7 @@ class XArrayFileCache(Cache):
     read_method: Literal['load', 'open'] = 'load'
     data_structure: Literal['Dataset', 'DataArray', 'DataTree'] = 'Dataset'
     time_encoding: TimeEncoding = TimeEncoding()
+    hash_files: bool = False
 
     def read(self, filename: FilePath, rebuild: bool = False, **kwargs):
         if self.data_structure == 'DataArray':
@@ -129,9 +133,11 @@ class XArrayFileCache(Cache):
         self,
         source: xr.Dataset,
         filename: FilePath,
+        manifest: Optional[CacheManifest] = None,
         **kwargs,
     ):
         ds = self._pre_process_dataset(source)
+        self._set_manifest(ds, manifest)
 
         # create path (if necessary)
         self.ensure_path(filename)
@@ -143,9 +149,11 @@ class XArrayFileCache(Cache):
         self,
         source: xr.DataTree,
         filename: FilePath,
+        manifest: Optional[CacheManifest] = None,
         **kwargs,
     ):
         dt = xr.map_over_datasets(self._pre_process_dataset, source)
+        self._set_manifest(dt, manifest)
 
         # create path (if necessary)
         self.ensure_path(filename)
@@ -153,10 +161,38 @@ class XArrayFileCache(Cache):
         # write data to netCDF4 file
         dt.to_netcdf(filename, engine='h5netcdf')
 
-    def cache_is_valid(self, filename: FilePath, rebuild: bool = False, **kwargs):
+    def cache_is_valid(
+        self,
+        filename: FilePath,
+        rebuild: bool = False,
+        manifest: Optional[CacheManifest] = None,
+        **kwargs,
+    ):
         if rebuild:
             return False
-        return Path(filename).exists()
+        if not Path(filename).exists():
+            return False
+        if manifest is None:
+            # inputs of the workflow are unknown
+            return True
+
+        # read the attributes of the root group only
+        with h5netcdf.File(filename, 'r') as file:
+            stored = file.attrs.get(MANIFEST_ATTRIBUTE, None)
+        if stored is None:
+            # cache has been created without a manifest (e.g. by a previous
+            # version): rebuild once to store the manifest
+            return False
+        return CacheManifest.model_validate_json(stored).matches(manifest)
+
+    def _set_manifest(
+        self, data: xr.Dataset | xr.DataTree, manifest: Optional[CacheManifest]
+    ):
+        # save description of the inputs
+        if manifest is not None:
+            if self.hash_files:
+                manifest = manifest.with_hashes()
+            data.attrs[MANIFEST_ATTRIBUTE] = manifest.model_dump_json()
 
     def _pre_process_dataset(self, ds: xr.Dataset):
         ds = ds.copy()
@@ -200,6 +236,7 @@ class XArrayFileCache(Cache):
 
         if 'pint:quantify' in ds.attrs:
             del ds.attrs['pint:quantify']
+        ds.attrs.pop(MANIFEST_ATTRIBUTE, None)
 
         return ds
 
@@ -2,6 +2,7 @@ import numpy as np
 import xarray as xr
 
 from ..process import Transform
+from ..timespan import Timespan
 from .xarray_utils import KeepAttributesContext
 
 
@@ -35,6 +36,15 @@ class XArraySelectTimespan(Transform):
         with KeepAttributesContext():
             return source.where(selector, drop=self.drop)
 
+    def selected_timespan(self, column: str, start=None, stop=None):
+        if not self.drop or ((start is None) and (stop is None)):
+            # (without dropping, the result covers all input rows)
+            return None
+        return Timespan.create(column, start, stop)
+
+    def push_down_timespan(self, timespan: Timespan, **params):
+        return timespan
+
 
 class XArraySelectTimespanV1_1(XArraySelectTimespan):
     version: str = '1.1'
@@ -44,6 +54,9 @@ class XArraySelectTimespanV1_1(XArraySelectTimespan):
     ):
         return super().run(source, variable, start, stop)
 
+    def selected_timespan(self, variable: str, start=None, stop=None):
+        return super().selected_timespan(variable, start, stop)
+
 
 class XArraySelectRange(Transform):
     name: str = 'xarray.select.range'
@@ -1,4 +1,4 @@
-from typing import List, Literal, Mapping, Optional
+from typing import Any, ClassVar, List, Literal, Mapping, Optional, get_args
 
 import numpy as np
 import pint_xarray
@@ -7,6 +7,7 @@ import scipy.ndimage
 import skimage.transform
 from omegaconf import OmegaConf
 
+from ..dataframes.dataframes_resampling import ResampleMethod, bin_labels
 from ..process import Transform
 
 _ = pint_xarray.__version__
@@ -234,9 +235,60 @@ class XArrayStatisticsMean(XArrayTransform):
             return source.mean(dim=dim, **kwargs)
 
 
+class XArrayResample(XArrayTransform):
+    """
+    XArrayResample aggregates an xarray DataArray or Dataset into bins of a
+    fixed frequency along a (1-D) time coordinate, e.g. the `timestamp`
+    coordinate of spectra loaded by `BrukerOpusLoader`. Bins are aligned to
+    multiples of the frequency and bins without any values are omitted (see
+    `dataframe.resample`).
+
+    Attributes:
+        name (str): The name of the transform, set to 'xarray.resample'.
+        version (str): The version of the transform, set to '1'.
+    """
+
+    name: str = 'xarray.resample'
+    version: str = '1'
+
+    def run(
+        self,
+        source: xr.DataArray | xr.Dataset,
+        freq: Any = '1 s',
+        method: ResampleMethod = 'mean',
+        coord: str = 'timestamp',
+    ):
+        """
+        Resample the given xarray DataArray or Dataset.
+
+        Parameters:
+            source (xr.DataArray | xr.Dataset): The input xarray object.
+            freq (Any, optional): The frequency of the bins, e.g. '1 s'.
+            method (ResampleMethod, optional): The aggregation of each bin
+            (mean, min, max, first, last or count).
+            coord (str, optional): The name of the time coordinate.
+
+        Returns:
+            xr.DataArray | xr.Dataset: The resampled xarray object (with the
+            start of the bins as coordinate).
+        """
+        if method not in get_args(ResampleMethod):
+            raise ValueError(f'Unsupported resample method: {method}')
+        labels = source[coord]
+        labels = xr.DataArray(
+            bin_labels(labels.to_index(), freq),
+            dims=labels.dims,
+            coords={dim: source[dim] for dim in labels.dims if dim in source.coords},
+            name=coord,
+        )
+        with self.keep_attrs():
+            return getattr(source.groupby(labels), method)()
+
+
 class XArrayAffineTransform(XArrayTransform):
     name: str = 'xarray.affine.transform'
     version: str = '1'
+    cpu_bound: ClassVar[bool] = True
 
     def run(
         self, source: xr.DataArray | xr.Dataset, matrix=None, dims=('y', 'x'), **kwargs
@@ -356,7 +408,7 @@ class XArrayCreateDataTree(XArrayTransform):
         self,
         root: xr.Dataset,
         groups: dict[str, xr.Dataset] | None = None,
-        **groups_kwargs: xr.Dataset
+        **groups_kwargs: xr.Dataset,
     ):
         _groups = {'./': root}
 
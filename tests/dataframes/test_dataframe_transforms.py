@@ -7,11 +7,13 @@ import pint_pandas
 import pytest
 import xarray as xr
 
+from rdmlibpy import Workflow
 from rdmlibpy.dataframes import (
     DataFrameAsType,
     DataFrameAttributes,
     DataFrameFillNA,
     DataFrameJoin,
+    DataFrameJoinMany,
     DataFrameSetIndex,
     DataFrameTimeOffset,
     DataFrameToXArray,
@@ -237,6 +239,236 @@ class TestDataFrameJoin:
                 left, right, how='left', interpolate=True, non_numeric='raise'
             )
 
+    def test_join_linear(self):
+        transform = DataFrameJoin()
+        left, right = self._get_test_data()
+        right['C'] = pint_pandas.PintArray(right['C'], dtype='pint[m]')
+        right.iloc[2, 0] = np.nan
+
+        df = transform.run(left, right, how='left', mode='linear')
+
+        assert list(df.columns) == ['B', 'C']
+        assert list(df.index) == [0, 2, 4, 6, 8, 10, 12]
+        assert list(df.B) == [0, 1, 2, 3, 4, 5, 6]
+        assert df.C.dtype == 'pint[m][float64]'
+        assert np.allclose(
+            df.C.pint.m, [0, 1 + 1 / 3, 2 + 2 / 3, 4, 5 + 1 / 3, 6 + 2 / 3, 8]
+        )
+
+    def test_join_linear_right(self):
+        transform = DataFrameJoin()
+        left, right = self._get_test_data()
+
+        df = transform.run(left, right, how='right', mode='linear')
+
+        assert list(df.columns) == ['B', 'C']
+        assert list(df.index) == [0, 1.5, 3, 4.5, 6, 7.5, 9, 10.5, 12]
+        assert np.allclose(df.B, [0, 0.75, 1.5, 2.25, 3, 3.75, 4.5, 5.25, 6])
+        assert list(df.C) == [0, 1, 2, 3, 4, 5, 6, 7, 8]
+
+    def test_join_linear_unsorted(self):
+        transform = DataFrameJoin()
+        left, right = self._get_test_data()
+        expected = transform.run(left, right, how='left', interpolate=True)
+
+        df = transform.run(left, right[::-1], how='left', mode='linear')
+
+        tm.assert_index_equal(df.index, left.index)
+        assert np.allclose(df.C, expected.C)
+
+    @pytest.mark.parametrize(
+        'non_numeric, expected',
+        [
+            ('ignore', [np.nan, np.nan, np.nan, 'off', np.nan, np.nan, np.nan]),
+            ('fill forward', [np.nan, 'on', 'on', 'off', 'off', 'on', 'on']),
+            ('fill backward', ['on', 'off', 'off', 'off', 'on', np.nan, np.nan]),
+        ],
+    )
+    def test_join_linear_nonnumeric(self, non_numeric, expected):
+        transform = DataFrameJoin()
+        left, right = self._get_test_data()
+        right['obj'] = [
+            np.nan,
+            'on',
+            np.nan,
+            np.nan,
+            'off',
+            np.nan,
+            'on',
+            np.nan,
+            np.nan,
+        ]
+
+        df = transform.run(
+            left, right, how='left', mode='linear', non_numeric=non_numeric
+        )
+
+        assert list(df.columns) == ['B', 'C', 'obj']
+        assert list(df['obj']) == expected
+
+    def test_join_asof(self):
+        transform = DataFrameJoin()
+        left, right = self._get_test_data()
+
+        df = transform.run(left, right, how='left', mode='asof')
+
+        assert list(df.index) == [0, 2, 4, 6, 8, 10, 12]
+        assert list(df.B) == [0, 1, 2, 3, 4, 5, 6]
+        assert list(df.C) == [0, 1, 2, 4, 5, 6, 8]
+
+    @pytest.mark.parametrize('how', ['left', 'right'])
+    def test_join_asof_unsorted_and_mixed_dtypes(self, how):
+        transform = DataFrameJoin()
+        left, right = self._get_test_data()
+        expected = transform.run(left, right, how=how, mode='asof')
+        left.index = left.index.astype(np.int64)
+
+        df = transform.run(left[::-1], right[::-1], how=how, mode='asof')
+
+        if how == 'left':
+            tm.assert_index_equal(df.index, left.index[::-1])
+            tm.assert_frame_equal(df.set_axis(df.index.astype(float))[::-1], expected)
+        else:
+            tm.assert_index_equal(df.index, right.index[::-1])
+            tm.assert_frame_equal(df[::-1], expected)
+
+    def test_join_asof_nearest_with_tolerance(self):
+        transform = DataFrameJoin()
+        start = pd.Timestamp('2024-01-16T10:00:00')
+        left = pd.DataFrame(
+            dict(A=[1.0, 2.0, 3.0]),
+            index=start + pd.to_timedelta([0, 10, 20], unit='s'),
+        )
+        right = pd.DataFrame(
+            dict(B=[4.0, 5.0]), index=start + pd.to_timedelta([1, 12], unit='s')
+        )
+
+        df = transform.run(
+            left, right, how='left', mode='asof', direction='nearest', tolerance='2 s'
+        )
+
+        assert list(df.index) == list(left.index)
+        assert np.allclose(df.B, [4.0, 5.0, np.nan], equal_nan=True)
+
+    @pytest.mark.parametrize('mode', ['asof', 'linear'])
+    def test_join_nearest_requires_left_or_right(self, mode):
+        transform = DataFrameJoin()
+        left, right = self._get_test_data()
+
+        with pytest.raises(ValueError):
+            transform.run(left, right, how='outer', mode=mode)
+        with pytest.raises(ValueError):
+            transform.run(left, left, how='left', mode=mode)
+
+
+class TestDataFrameJoinMany:
+    def test_create_transform(self):
+        transform = DataFrameJoinMany()
+
+        assert transform.name == 'dataframe.join.many'
+        assert transform.version == '1'
+
+    def _get_test_data(self):
+        left, right = TestDataFrameJoin()._get_test_data()
+        other = pd.DataFrame(
+            dict(D=[10.0, 20.0, 30.0]), index=pd.Index([1.0, 5.0, 13.0], name='A')
+        )
+        return left, right, other
+
+    def test_join_like_chained_joins(self):
+        left, right, other = self._get_test_data()
+        join = DataFrameJoin()
+        expected = join.run(
+            join.run(left, right, interpolate=True), other, interpolate=True
+        )
+
+        df = DataFrameJoinMany().run(left, right=right, other=other)
+
+        assert list(df.columns) == ['B', 'C', 'D']
+        tm.assert_index_equal(df.index, expected.index)
+        for col in df.columns:
+            assert np.allclose(df[col], expected[col])
+
+    def test_join_list_on_index_of_frame(self):
+        left, right, other = self._get_test_data()
+        right['C'] = pint_pandas.PintArray(right['C'], dtype='pint[m]')
+
+        df = DataFrameJoinMany().run([left, right, other], on=0)
+
+        assert list(df.index) == [0, 2, 4, 6, 8, 10, 12]
+        assert list(df.B) == [0, 1, 2, 3, 4, 5, 6]
+        assert df.C.dtype == 'pint[m][float64]'
+        assert np.allclose(
+            df.C.pint.m, [0, 1 + 1 / 3, 2 + 2 / 3, 4, 5 + 1 / 3, 6 + 2 / 3, 8]
+        )
+        assert np.allclose(df.D, [10, 12.5, 17.5, 21.25, 23.75, 26.25, 28.75])
+
+    @pytest.mark.parametrize(
+        'on, freq', [(0, None), (1, None), (None, None), (None, 1.0)]
+    )
+    def test_join_unsorted_frames(self, on, freq):
+        left, right, other = self._get_test_data()
+        right.iloc[2, 0] = np.nan
+        expected = DataFrameJoinMany().run([left, right, other], on=on, freq=freq)
+
+        df = DataFrameJoinMany().run([left, right[::-1], other[::-1]], on=on, freq=freq)
+
+        if on == 1:
+            expected = expected[::-1]
+        tm.assert_frame_equal(df, expected)
+
+    def test_join_on_frequency(self):
+        start = pd.Timestamp('2024-01-16T10:00:00.3')
+        first = pd.DataFrame(
+            dict(A=[0.0, 3.0]), index=start + pd.to_timedelta([0, 3], unit='s')
+        )
+        second = pd.DataFrame(
+            dict(B=[0.0, 1.0]), index=start + pd.to_timedelta([1, 2], unit='s')
+        )
+
+        df = DataFrameJoinMany().run(first=first, second=second, freq='1 s')
+
+        assert list(df.index) == list(
+            pd.date_range('2024-01-16T10:00:00', periods=4, freq='1s')
+        )
+        assert np.allclose(df.A, [0.0, 0.7, 1.7, 2.7])
+        assert np.allclose(df.B, [0.0, 0.0, 0.7, 1.0])
+
+    def test_join_branches_of_workflow(self, data_path: Path):
+        def branch(select):
+            return [
+                (
+                    ChannelTCLoggerLoader(),
+                    dict(source=str(data_path / 'ChannelV2TCLog/*.csv')),
+                ),
+                ('dataframe.select.columns@v1', dict(select=select)),
+                ('dataframe.setindex@v1', dict(index_var='timestamp')),
+            ]
+
+        workflow = Workflow.create(
+            {
+                'run': 'dataframe.join.many@v1',
+                'params': {
+                    '$inlet': branch(['timestamp', 'inlet']),
+                    '$outlet': branch(['timestamp', 'outlet']),
+                    'freq': '1 s',
+                },
+            }
+        )
+        df = workflow.run()
+
+        assert list(df.columns) == ['inlet', 'outlet']
+        assert (df.index[1:] - df.index[:-1] == pd.Timedelta(1, 's')).all()
+        assert df.notna().all().all()
+
+    def test_raise_on_overlapping_columns_or_unknown_frame(self):
+        left, right, _ = self._get_test_data()
+
+        with pytest.raises(ValueError):
+            DataFrameJoinMany().run(left, right=left)
+        with pytest.raises(ValueError):
+            DataFrameJoinMany().run(left, right=right, on='other')
+
 
 class TestDataFrameSetIndex:
     def test_create_loader(self):
@@ -0,0 +1,127 @@
+import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+import pint_pandas
+import pytest
+
+from rdmlibpy.dataframes.dataframes_columnar import (
+    iter_columnar,
+    read_columnar,
+    read_columnar_metadata,
+    write_columnar,
+)
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def df():
+    df = pd.DataFrame(
+        data=dict(
+            A=pint_pandas.PintArray(np.arange(10.0), dtype='pint[degC][float64]'),
+            B=list('abcdefghij'),
+            C=np.arange(10),
+        ),
+        index=pd.date_range('2024-01-16T10:00', periods=10, freq='min', name='t'),
+    )
+    df.attrs.update(dict(date='2024-04-26', inlet=dict(flow_rate='1.0L/min')))
+    return df
+
+
+@pytest.mark.parametrize('format', ['parquet', 'feather'])
+class TestColumnarFormats:
+    def test_roundtrip(self, tmp_path: Path, df: pd.DataFrame, format):
+        filename = tmp_path / f'data.{format}'
+        write_columnar(df, filename, format, metadata=dict(key='value'))
+
+        cached = read_columnar(filename, format)
+
+        tm.assert_frame_equal(cached, df, check_freq=False)
+        assert cached.attrs == df.attrs
+        assert read_columnar_metadata(filename, format)['key'] == 'value'
+
+    def test_roundtrip_attrs(self, tmp_path: Path, df: pd.DataFrame, format):
+        filename = tmp_path / f'data.{format}'
+        df.attrs.update(
+            start=pd.Timestamp('2024-01-16T10:00:00.123456789+01:00'),
+            day=datetime.date(2024, 1, 16),
+            duration=pd.Timedelta('1 min'),
+            sampled=np.datetime64('2024-01-16T10:00'),
+            scale=np.float64(2.0),
+            offsets=np.array([1.0, 2.0]),
+        )
+        write_columnar(df, filename, format)
+
+        attrs = read_columnar(filename, format).attrs
+
+        assert attrs['start'] == df.attrs['start']
+        assert attrs['start'].tz == df.attrs['start'].tz
+        assert attrs['day'] == df.attrs['day']
+        assert attrs['duration'] == df.attrs['duration']
+        assert attrs['sampled'] == df.attrs['sampled']
+        assert attrs['scale'] == 2.0
+        np.testing.assert_array_equal(attrs['offsets'], df.attrs['offsets'])
+        assert attrs['inlet'] == df.attrs['inlet']
+
+    def test_raise_on_unsupported_attrs(self, tmp_path: Path, df: pd.DataFrame, format):
+        df.attrs.update(unsupported=object())
+
+        with pytest.raises(TypeError):
+            write_columnar(df, tmp_path / f'data.{format}', format)
+
+    def test_project_and_filter(self, tmp_path: Path, df: pd.DataFrame, format):
+        filename = tmp_path / f'data.{format}'
+        write_columnar(df, filename, format, row_group_size=3)
+
+        cached = read_columnar(
+            filename,
+            format,
+            columns=['A'],
+            start='2024-01-16T10:02',
+            stop='2024-01-16T10:05',
+        )
+
+        expected = df.loc['2024-01-16T10:02':'2024-01-16T10:05', ['A']]
+        tm.assert_frame_equal(cached, expected, check_freq=False)
+
+    def test_chunks(self, tmp_path: Path, df: pd.DataFrame, format):
+        filename = tmp_path / f'data.{format}'
+        write_columnar(iter([df.iloc[:4], df.iloc[4:]]), filename, format)
+
+        chunks = list(iter_columnar(filename, format))
+
+        assert [len(chunk) for chunk in chunks] == [4, 6]
+        tm.assert_frame_equal(pd.concat(chunks), df, check_freq=False)
+        assert chunks[1].attrs == df.attrs
+
+    def test_empty_chunks(self, tmp_path: Path, format):
+        filename = tmp_path / f'data.{format}'
+        write_columnar(iter([]), filename, format)
+
+        assert read_columnar(filename, format).empty
+
+
+class TestMemoryMap:
+    def test_read_without_copy(self, tmp_path: Path, df: pd.DataFrame):
+        filename = tmp_path / 'data.feather'
+        write_columnar(df, filename, 'feather')
+
+        cached = read_columnar(filename, 'feather', memory_map=True)
+
+        tm.assert_frame_equal(cached, df, check_freq=False)
+        # columns reference the read-only pages of the file
+        assert not cached['A'].pint.magnitude.to_numpy().flags.writeable
+        assert not cached['C'].to_numpy().flags.writeable
+
+    def test_replace_mapped_file(self, tmp_path: Path, df: pd.DataFrame):
+        filename = tmp_path / 'data.feather'
+        write_columnar(df, filename, 'feather')
+        cached = read_columnar(filename, 'feather', memory_map=True)
+
+        write_columnar(df.iloc[:2], filename, 'feather')
+
+        tm.assert_frame_equal(cached, df, check_freq=False)
+        assert len(read_columnar(filename, 'feather', memory_map=True)) == 2
@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+import pint_pandas
+import pytest
+
+from rdmlibpy.dataframes import DataFrameInterpolate
+from rdmlibpy.dataframes.dataframes_interpolation import (
+    index_to_float,
+    interpolate_columns,
+    interpolate_onto,
+)
+
+
+def expected_interpolation(x, values):
+    isnan = np.isnan(values)
+    if isnan.all():
+        return values
+    return np.interp(x, x[~isnan], values[~isnan])
+
+
+class TestInterpolateColumns:
+    def test_interpolate_like_numpy(self):
+        rng = np.random.default_rng(0)
+        x = np.cumsum(rng.random(200))
+        data = rng.random((200, 6))
+        shared = rng.random(200) < 0.3
+        data[shared, 0:3] = np.nan
+        data[rng.random(200) < 0.5, 3] = np.nan
+        data[:10, 4] = np.nan
+        data[-10:, 4] = np.nan
+        data[:, 5] = np.nan
+        df = pd.DataFrame(data, index=x, columns=list('ABCDEF'))
+
+        actual = interpolate_columns(df)
+
+        for col in df.columns:
+            np.testing.assert_allclose(
+                actual[col], expected_interpolation(x, df[col].to_numpy())
+            )
+
+    def test_keep_columns_without_missing_values(self):
+        df = pd.DataFrame(
+            dict(A=[1.0, np.nan, 3.0], B=[1.0, 2.0, 3.0], C=['a', None, 'c'])
+        )
+
+        actual = interpolate_columns(df, [0, 1])
+
+        assert list(actual['A']) == [1.0, 2.0, 3.0]
+        assert np.shares_memory(actual['B'].to_numpy(), df['B'].to_numpy())
+        assert list(actual['C']) == ['a', None, 'c']
+        assert np.isnan(df.loc[1, 'A'])
+
+    def test_interpolate_pint_columns(self):
+        df = pd.DataFrame(
+            dict(
+                A=pint_pandas.PintArray([1.0, np.nan, 3.0], dtype='pint[m]'),
+                B=pint_pandas.PintArray([2.0, np.nan, 6.0], dtype='pint[K][float64]'),
+            ),
+            index=[0.0, 1.0, 4.0],
+        )
+        df.attrs.update(source='test')
+
+        actual = interpolate_columns(df)
+
+        assert actual['A'].dtype == 'pint[m][float64]'
+        assert actual['B'].dtype == 'pint[K][float64]'
+        assert list(actual['A'].pint.m) == [1.0, 1.5, 3.0]
+        assert list(actual['B'].pint.m) == [2.0, 3.0, 6.0]
+        assert actual.attrs == df.attrs
+
+    def test_interpolate_on_datetime_index(self):
+        index = pd.to_datetime(
+            ['2024-01-16T10:00:00', '2024-01-16T10:00:01', '2024-01-16T10:00:04']
+        )
+        df = pd.DataFrame(dict(A=[0.0, np.nan, 4.0]), index=index)
+
+        actual = interpolate_columns(df)
+
+        assert list(actual['A']) == [0.0, 1.0, 4.0]
+
+    @pytest.mark.parametrize('tz', [None, 'UTC'])
+    def test_index_to_float(self, tz):
+        index = pd.date_range('2024-01-16', periods=3, freq='500ms', tz=tz)
+
+        assert list(index_to_float(index)) == [0.0, 0.5, 1.0]
+
+
+class TestDataFrameInterpolate:
+    def test_create_transform(self):
+        transform = DataFrameInterpolate()
+
+        assert transform.name == 'dataframe.interpolate'
+        assert transform.version == '1'
+
+    def test_include_and_exclude(self):
+        df = pd.DataFrame(
+            dict(A=[0.0, np.nan, 2.0], B=[0.0, np.nan, 4.0], C=[0.0, np.nan, 6.0])
+        )
+
+        actual = DataFrameInterpolate().run(df, include=['A', 'B'], exclude=['B'])
+
+        assert list(actual['A']) == [0.0, 1.0, 2.0]
+        assert np.isnan(actual.loc[1, 'B'])
+        assert np.isnan(actual.loc[1, 'C'])
+
+    def test_raise_on_unknown_column(self):
+        df = pd.DataFrame(dict(A=[0.0, np.nan, 2.0]))
+
+        with pytest.raises(KeyError):
+            DataFrameInterpolate().run(df, include=['X'])
+
+
+class TestInterpolateOnto:
+    def test_interpolate_like_numpy(self):
+        rng = np.random.default_rng(0)
+        x = np.cumsum(rng.random(100))
+        data = rng.random((100, 3))
+        data[rng.random(100) < 0.3, 0] = np.nan
+        data[:, 2] = np.nan
+        df = pd.DataFrame(data, index=x, columns=list('ABC'))
+        index = pd.Index(np.linspace(-1.0, x[-1] + 1.0, 250))
+
+        actual = interpolate_onto(df, index)
+
+        assert actual.index is index
+        for col in ['A', 'B']:
+            values = df[col].to_numpy()
+            isnan = np.isnan(values)
+            np.testing.assert_allclose(
+                actual[col], np.interp(index, x[~isnan], values[~isnan])
+            )
+        assert actual['C'].isna().all()
+
+    def test_select_columns_and_keep_units(self):
+        start = pd.Timestamp('2024-01-16T10:00:00')
+        df = pd.DataFrame(
+            dict(
+                A=[0.0, 2.0],
+                B=pint_pandas.PintArray([0.0, 4.0], dtype='pint[K]'),
+            ),
+            index=[start, start + pd.Timedelta(2, 's')],
+        )
+        index = pd.DatetimeIndex([start + pd.Timedelta(1, 's')])
+
+        actual = interpolate_onto(df, index, [1])
+
+        assert list(actual.columns) == ['B']
+        assert actual['B'].dtype == 'pint[K][float64]'
+        assert list(actual['B'].pint.m) == [2.0]
@@ -1,4 +1,5 @@
 import io
+import tracemalloc
 from pathlib import Path
 from textwrap import dedent
 
@@ -6,10 +7,22 @@ import numpy as np
 import pandas as pd
 import pandas._testing as tm
 import pint_pandas
+import pytest
 
+import rdmlibpy as rdm
 from rdmlibpy.base import PlainProcessParam, ProcessNode
-from rdmlibpy.dataframes import DataFrameFileCache, DataFrameReadCSV, DataFrameWriteCSV
-from rdmlibpy.dataframes.dataframes_io import quantify
+from rdmlibpy.dataframes import (
+    DataFrameFileCache,
+    DataFrameReadCSV,
+    DataFrameWriteCSV,
+    DataFrameTimeOffset,
+)
+from rdmlibpy.dataframes.dataframes_io import (
+    TimestampLayout,
+    parse_time_of_day,
+    quantify,
+)
+from rdmlibpy.loaders import ChannelEurothermLoggerLoader, ChannelTCLoggerLoader
 from rdmlibpy.process import DelegatedSource
 from omegaconf import OmegaConf
 
@@ -127,6 +140,127 @@ class TestDataFrameReadCSV:
         assert df.loc[1, 'timestamp'] == np.datetime64('2024-04-19T12:20:01')
         assert df.loc[2, 'timestamp'] == np.datetime64('2024-04-20T12:21:01')
 
+    @pytest.mark.parametrize(
+        'date_format',
+        ['%d.%m.%Y %H:%M:%S,%f', '%d.%m.%Y %H:%M:%S', '%d.%m.%Y %I:%M:%S %p'],
+    )
+    def test_parse_dates_joining_columns_like_rowwise_join(self, date_format):
+        date = pd.Series(['18.04.2024', '19.04.2024', 'x', '20.04.2024', None] * 3)
+        time = pd.Series(
+            [
+                '12:00:01,5',
+                '23:59:59,123456789',
+                '12:00:01,5',
+                '1:02:03,25',
+                '12:00:01',
+                '12:00:01,5x',
+                '25:00:00,1',
+                None,
+                '12:00:00 PM',
+                '01:00:00,1234567891',
+                '00:00:00,000',
+                '12:00:01.5',
+                '',
+                '1:2:3',
+                '12:00:01,',
+            ]
+        )
+        loader = DataFrameReadCSV(date_format=date_format)
+
+        expected = pd.to_datetime(
+            pd.concat([date, time], axis=1).astype(str).agg(' '.join, axis=1),
+            format=date_format,
+            errors='coerce',
+        )
+        tm.assert_series_equal(
+            loader._to_datetime_joining_columns([date, time]), expected
+        )
+
+    def test_parse_time_of_day(self):
+        times = pd.Series(['00:00:00,5', '23:59:59,123456789', '12:00:00', '1:00:00,1'])
+
+        nanoseconds, valid = parse_time_of_day(times, ',')
+
+        assert list(valid) == [True, True, False, False]
+        assert list(nanoseconds) == [500_000_000, 86_399_123_456_789, 0, 0]
+
+    @pytest.mark.parametrize(
+        'values',
+        [
+            ['2024-01-01T12:00:00', '2024-01-01T12:00:01', None, 'x'],
+            ['2024-01-01 12:00:00.5', '2024-01-01 12:00:01.123456'],
+            ['2024-01-01T12:00:00Z', '2024-01-01T12:00:01Z'],
+            ['2024-01-01T12:00:00+01:00', '2024-01-01T12:00:01+01:00', ''],
+            ['2024-01-01T12:00:00-0530', '2024-01-01T12:00:01-0530'],
+            ['2024-01-01', '2024-01-02'],
+            ['2024-01-01T12:00', '2024-01-01T12:01'],
+            ['2024-01-01T12:00:00', '2024-01-01T12:00:01.5', '2024-01-01'],
+            ['2024-01-01T12:00:00', '2024-01-01T25:00:01'],
+            ['01.01.2024 12:00:00', '2024-01-01T12:00:00'],
+        ],
+    )
+    def test_parse_iso8601_like_generic_parser(self, values):
+        series = pd.Series(values, name='timestamp')
+
+        expected = pd.to_datetime(series, format='ISO8601', errors='coerce')
+        tm.assert_series_equal(DataFrameReadCSV()._to_datetime(series), expected)
+
+    @pytest.mark.parametrize(
+        'value, layout',
+        [
+            ('2024-01-01T12:00:00', TimestampLayout(format='%Y-%m-%dT%H:%M:%S')),
+            (
+                '2024-01-01 12:00:00.123',
+                TimestampLayout(format='%Y-%m-%d %H:%M:%S.%f'),
+            ),
+            (
+                '2024-01-01T12:00+01:00',
+                TimestampLayout(format='%Y-%m-%dT%H:%M', offset='+01:00'),
+            ),
+            ('2024-01-01', TimestampLayout(format='%Y-%m-%d')),
+            ('01.01.2024 12:00:00', None),
+            (1.0, None),
+        ],
+    )
+    def test_sniff_timestamp_layout(self, value, layout):
+        assert TimestampLayout.sniff(value) == layout
+
+    def test_sniff_timestamp_layout_once_per_glob(self, tmp_path: Path):
+        (tmp_path / 'a.csv').write_text('t,A\n2024-01-01T12:00:00+01:00,1\n')
+        (tmp_path / 'b.csv').write_text('t,A\n2024-01-01T13:00:00+01:00,2\n')
+        loader = DataFrameReadCSV(parse_dates=['t'])
+
+        df = loader.run(tmp_path / '[ab].csv')
+
+        assert sorted(df['t'].dt.hour) == [12, 13]
+        assert str(df['t'].dt.tz) == 'UTC+01:00'
+        assert loader._timestamp_layouts == {
+            't': TimestampLayout(format='%Y-%m-%dT%H:%M:%S', offset='+01:00')
+        }
+
+        # files with a different layout fall back to the generic parser
+        (tmp_path / 'c.csv').write_text('t,A\n2024-01-02T12:00:00.5+01:00,3\n')
+        df = loader._read_csv(tmp_path / 'c.csv')
+        assert df['t'].iloc[0] == pd.Timestamp('2024-01-02T12:00:00.5+01:00')
+
+    def test_drop_layouts_shared_by_threads(self, tmp_path: Path):
+        class SharedLayouts(dict):
+            # another thread drops the layout right after it has been looked up
+            def __getitem__(self, key):
+                value = super().__getitem__(key)
+                super().pop(key)
+                return value
+
+        (tmp_path / 'a.csv').write_text('t,A\n2024-01-02T12:00:00.5+01:00,3\n')
+        loader = DataFrameReadCSV(parse_dates=['t'])
+        loader._timestamp_layouts = SharedLayouts(
+            t=TimestampLayout(format='%Y-%m-%dT%H:%M:%S', offset='+01:00')
+        )
+
+        df = loader._read_csv(tmp_path / 'a.csv')
+
+        assert df['t'].iloc[0] == pd.Timestamp('2024-01-02T12:00:00.5+01:00')
+
     def test_coerce_invalid_datetime_to_NaT(self):
         data = """
             idx,timestamp,A,B,C
@@ -194,6 +328,134 @@ class TestDataFrameReadCSV:
         assert list(df.columns) == ['A', 'B', 'C']
         assert list(df.C) == [10000.1, 2000.2, 30003.3]
 
+    @staticmethod
+    def create_files(path: Path, count: int = 8):
+        for i in range(count):
+            (path / f'data{i:02d}.csv').write_text(f'A,B\n{i},{2 * i}\n{i},{3 * i}\n')
+        return path / '*.csv'
+
+    @pytest.mark.parametrize('executor', ['threads', 'processes'])
+    def test_load_files_concurrently(self, tmp_path: Path, executor):
+        source = self.create_files(tmp_path)
+
+        expected = DataFrameReadCSV().run(source)
+        df = DataFrameReadCSV(workers=4, executor=executor).run(source)
+
+        tm.assert_frame_equal(df, expected)
+        # files are concatenated in glob order
+        assert len(df) == 16
+
+    def test_load_duplicate_files_concurrently(self, tmp_path: Path):
+        self.create_files(tmp_path, count=2)
+        paths = [tmp_path / 'data00.csv', tmp_path / 'data01.csv'] * 2
+
+        expected = DataFrameReadCSV()._read_files(paths)
+        frames = DataFrameReadCSV(workers=4)._read_files(paths)
+
+        assert len(frames) == 4
+        for df, expected_df in zip(frames, expected):
+            tm.assert_frame_equal(df, expected_df)
+
+    @pytest.mark.parametrize('workers', [1, 4])
+    def test_report_failures_of_concurrent_loads(self, tmp_path: Path, caplog, workers):
+        source = self.create_files(tmp_path)
+        (tmp_path / 'data03.csv').unlink()
+        (tmp_path / 'data03.csv').mkdir()
+
+        # the same error is raised by serial & concurrent loads
+        loader = DataFrameReadCSV(workers=workers)
+        with pytest.raises(IsADirectoryError, match='data03.csv'):
+            loader.run(source)
+        if workers > 1:
+            assert 'Failed to load 1 of 8 files' in caplog.text
+
+    def test_pyarrow_engine_options(self):
+        loader = DataFrameReadCSV(engine='pyarrow')
+
+        options = loader._read_csv_options()
+        assert options['engine'] == 'pyarrow'
+        assert options['dtype_backend'] == 'pyarrow'
+
+    @pytest.mark.parametrize(
+        'config, kwargs',
+        [
+            (dict(decimal=','), {}),
+            (dict(thousands="'"), {}),
+            (dict(options=dict(comment='#')), {}),
+            (dict(options=dict(skiprows=3)), {}),
+            ({}, dict(chunksize=10)),
+        ],
+    )
+    def test_pyarrow_engine_falls_back_on_unsupported_options(self, config, kwargs):
+        loader = DataFrameReadCSV(engine='pyarrow', **config)
+
+        options = loader._read_csv_options(**kwargs)
+        assert options['engine'] == 'c'
+        assert options['dtype_backend'] == 'pyarrow'
+
+    def test_default_engine_options(self):
+        options = DataFrameReadCSV()._read_csv_options()
+        assert 'engine' not in options
+        assert 'dtype_backend' not in options
+
+    @pytest.mark.parametrize('decimal', ['.', ','])
+    def test_load_with_pyarrow_engine(self, decimal):
+        pytest.importorskip('pyarrow')
+        text = (
+            'timestamp;A;B\n2024-01-01T12:00:00;1{0}5;x\n2024-01-01T12:00:01;2{0}5;y\n'
+        )
+        loader = DataFrameReadCSV(
+            engine='pyarrow',
+            separator=';',
+            decimal=decimal,
+            parse_dates=['timestamp'],
+        )
+
+        df = loader.run(io.StringIO(text.format(decimal)))
+
+        assert isinstance(df['A'].dtype, pd.ArrowDtype)
+        assert list(df['A']) == [1.5, 2.5]
+        assert list(df['timestamp']) == list(
+            pd.to_datetime(['2024-01-01T12:00:00', '2024-01-01T12:00:01'])
+        )
+
+    @pytest.mark.parametrize('interpolate', ['dataframe.interpolate', 'join'])
+    def test_transform_data_of_pyarrow_engine(self, data_path: Path, interpolate):
+        pytest.importorskip('pyarrow')
+
+        def branch(loader, source, engine):
+            return [
+                (
+                    loader(engine=engine),
+                    dict(source=str(data_path / source)),
+                ),
+                ('dataframe.timeoffset@v1', dict(offset='1 s', column='timestamp')),
+                ('dataframe.setindex@v1', dict(index_var='timestamp')),
+            ]
+
+        def create_workflow(engine):
+            tclogger = branch(ChannelTCLoggerLoader, 'ChannelV2TCLog/*.csv', engine)
+            if interpolate == 'join':
+                eurotherm = branch(
+                    ChannelEurothermLoggerLoader, 'eurotherm/*.txt', engine
+                )
+                steps = {
+                    'run': 'dataframe.join@v1',
+                    'params': {
+                        '$left': tclogger,
+                        '$right': eurotherm,
+                        'interpolate': True,
+                    },
+                }
+            else:
+                steps = [*tclogger, ('dataframe.interpolate@v1', {})]
+            return rdm.Workflow.create(steps)
+
+        df = create_workflow('pyarrow').run()
+
+        assert df.index.dtype == np.dtype('<M8[ns]')
+        tm.assert_frame_equal(df, create_workflow(None).run(), check_dtype=False)
+
 
 class TestDataFrameWriteCSV:
     def test_create_loader(self):
@@ -798,6 +1060,33 @@ class TestDataFrameFileCache:
         assert list(original.dtypes) == list(cached.dtypes)
         assert (original == cached).values.all()
 
+    def test_dataframe_with_interleaved_columns(self, tmp_path):
+        # float columns are written as a single block (the column order is kept)
+        path = tmp_path / 'cache.hd5'
+        df = pd.DataFrame(
+            data=dict(
+                A=pint_pandas.PintArray([1.0, None, 3.0], dtype='pint[m]'),
+                B=['aa', 'bb', 'cc'],
+                C=[4.0, 5.0, 6.0],
+                D=pd.date_range('2024-01-16T10:05', periods=3, freq='s'),
+                E=pint_pandas.PintArray([7.0, 8.0, 9.0], dtype='pint[K][float64]'),
+                F=[1, 2, 3],
+            ),
+            index=pd.Index([10, 20, 30], name='t'),
+        )
+
+        workflow = ProcessNode(
+            parent=ProcessNode(runner=DelegatedSource(delegate=lambda: df)),
+            runner=DataFrameFileCache(),
+            params={'filename': PlainProcessParam(value=str(path))},
+        )
+        workflow.run()
+
+        cached = workflow.run()
+        assert cached is not df
+        assert list(cached.columns) == list(df.columns)
+        tm.assert_frame_equal(cached, df, check_dtype=False)
+
     def test_preserve_attrs(self, tmp_path):
         path = tmp_path / 'cache.hd5'
         df = pd.DataFrame(
@@ -832,3 +1121,220 @@ class TestDataFrameFileCache:
         # assert content
         tm.assert_frame_equal(df, cached)
         assert df.attrs == cached.attrs
+
+    @staticmethod
+    def create_cached_csv_workflow(source: Path, path: Path, **config):
+        return ProcessNode(
+            parent=ProcessNode(
+                runner=DataFrameReadCSV(),
+                params={'source': PlainProcessParam(value=str(source))},
+            ),
+            runner=DataFrameFileCache(**config),
+            params={'filename': PlainProcessParam(value=str(path))},
+        )
+
+    def test_invalidate_cache_if_source_file_changes(self, tmp_path):
+        source = tmp_path / 'data.csv'
+        source.write_text('A,B\n1,2\n3,4\n')
+        path = tmp_path / 'cache.hd5'
+        workflow = self.create_cached_csv_workflow(source, path)
+
+        # create cache
+        workflow.run()
+        mtime = path.stat().st_mtime_ns
+
+        # unchanged source -> load from cache
+        assert list(workflow.run()['A']) == [1, 3]
+        assert path.stat().st_mtime_ns == mtime
+
+        # modified source -> rebuild cache
+        source.write_text('A,B\n5,6\n7,8\n9,10\n')
+        assert list(workflow.run()['A']) == [5, 7, 9]
+        assert list(workflow.run()['A']) == [5, 7, 9]
+
+    @pytest.mark.parametrize('format', ['HDF5', 'parquet'])
+    def test_rebuild_cache_without_manifest(self, tmp_path, format):
+        if format != 'HDF5':
+            pytest.importorskip('pyarrow')
+        source = tmp_path / 'data.csv'
+        source.write_text('A,B\n5,6\n7,8\n')
+        path = tmp_path / 'cache.dat'
+        workflow = self.create_cached_csv_workflow(source, path, format=format)
+
+        # cache written without a manifest (e.g. by a previous version)
+        outdated = pd.DataFrame(dict(A=[1, 3], B=[2, 4]))
+        DataFrameFileCache(format=format).write(outdated, filename=path)
+
+        assert list(workflow.run()['A']) == [5, 7]
+        mtime = path.stat().st_mtime_ns
+        assert list(workflow.run()['A']) == [5, 7]
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_invalidate_cache_if_upstream_workflow_changes(self, tmp_path):
+        source = tmp_path / 'data.csv'
+        source.write_text('A;B\n1,5;2\n3,5;4\n')
+        path = tmp_path / 'cache.hd5'
+
+        workflow = self.create_cached_csv_workflow(source, path)
+        assert list(workflow.run().columns) == ['A;B']
+
+        workflow.parent.runner = DataFrameReadCSV(separator=';', decimal=',')
+        assert list(workflow.run()['A']) == [1.5, 3.5]
+
+    def test_keep_cache_of_touched_files_with_hashes(self, tmp_path):
+        source = tmp_path / 'data.csv'
+        source.write_text('A,B\n1,2\n3,4\n')
+        path = tmp_path / 'cache.hd5'
+        workflow = self.create_cached_csv_workflow(source, path, hash_files=True)
+
+        workflow.run()
+        mtime = path.stat().st_mtime_ns
+
+        # touch source file
+        source.write_text('A,B\n1,2\n3,4\n')
+        workflow.run()
+        assert path.stat().st_mtime_ns == mtime
+
+        # modify source file (with same size)
+        source.write_text('A,B\n5,6\n7,8\n')
+        assert list(workflow.run()['A']) == [5, 7]
+
+    @pytest.mark.parametrize('format', ['parquet', 'feather'])
+    def test_columnar_formats(self, tmp_path, format):
+        pytest.importorskip('pyarrow')
+        source = tmp_path / 'data.csv'
+        source.write_text('A,B\n1,2\n3,4\n')
+        path = tmp_path / f'cache.{format}'
+        workflow = self.create_cached_csv_workflow(source, path, format=format)
+
+        # create cache
+        df = workflow.run()
+        df.attrs.update(date='2024-04-26')
+        mtime = path.stat().st_mtime_ns
+
+        # unchanged source -> load from cache
+        cached = workflow.run()
+        assert cached is not df
+        tm.assert_frame_equal(df, cached)
+        assert path.stat().st_mtime_ns == mtime
+
+        # modified source -> rebuild cache
+        source.write_text('A,B\n5,6\n7,8\n9,10\n')
+        assert list(workflow.run()['A']) == [5, 7, 9]
+        assert list(workflow.run()['A']) == [5, 7, 9]
+
+    @pytest.mark.parametrize('format', ['HDF5', 'parquet', 'feather'])
+    def test_columnar_formats_with_units(self, tmp_path, format):
+        if format != 'HDF5':
+            pytest.importorskip('pyarrow')
+        path = tmp_path / f'cache.{format}'
+        df = pd.DataFrame(data=dict(A=[1.1, 2.2, 3.3], B=['aa', 'bb', 'cc']))
+        df['E'] = pint_pandas.PintArray([1.0, 2.0, 3.0], dtype='pint[m][float64]')
+        df.attrs.update(dict(inlet=dict(flow_rate='1.0L/min', scale=2.0)))
+        df.attrs.update(start=pd.Timestamp('2024-04-26T10:00:00.5'))
+
+        workflow = ProcessNode(
+            parent=ProcessNode(runner=DelegatedSource(delegate=lambda: df)),
+            runner=DataFrameFileCache(format=format),
+            params={'filename': PlainProcessParam(value=str(path))},
+        )
+        workflow.run()
+
+        cached = workflow.run()
+        assert cached is not df
+        tm.assert_frame_equal(df, cached)
+        assert df.attrs == cached.attrs
+
+    @pytest.mark.parametrize('stream', [False, True])
+    @pytest.mark.parametrize('format', ['HDF5', 'parquet', 'feather'])
+    def test_read_selection_from_cache(self, tmp_path, format, stream):
+        if format != 'HDF5':
+            pytest.importorskip('pyarrow')
+        path = tmp_path / 'cache'
+        df = pd.DataFrame(
+            data=dict(A=np.arange(6.0), B=list('abcdef')),
+            index=pd.date_range('2024-01-16T10:00', periods=6, freq='1min', name='t'),
+        )
+        df['E'] = pint_pandas.PintArray(np.arange(6.0), dtype='pint[m][float64]')
+        df.attrs.update(dict(inlet='NO'))
+
+        workflow = ProcessNode(
+            parent=ProcessNode(runner=DelegatedSource(delegate=lambda: df)),
+            runner=DataFrameFileCache(format=format, stream=stream),
+            params={
+                'filename': PlainProcessParam(value=str(path)),
+                'columns': PlainProcessParam(value=['E', 'A']),
+                'start': PlainProcessParam(value='2024-01-16T10:01'),
+                'stop': PlainProcessParam(value='2024-01-16T10:03'),
+            },
+        )
+        expected = df.loc['2024-01-16T10:01':'2024-01-16T10:03', ['E', 'A']]
+
+        # cache misses & hits return the selection
+        written = workflow.run()
+        cached = workflow.run()
+        if stream:
+            cached = cached.collect()
+        tm.assert_frame_equal(written, expected)
+        tm.assert_frame_equal(cached, expected, check_freq=False)
+        assert cached.attrs == df.attrs
+
+    @pytest.mark.parametrize(
+        'format, max_write, max_read',
+        [('HDF5', 1.5, 2.5), ('parquet', 1.5, 1.5), ('feather', 1.5, 1.5)],
+    )
+    def test_round_trip_memory(self, tmp_path, format, max_write, max_read):
+        # peak memory of numpy allocations (relative to the size of the data;
+        # see benchmarks/cache_memory.py for the peak resident memory)
+        if format != 'HDF5':
+            pytest.importorskip('pyarrow')
+        rows, columns = 20_000, 8
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                f'T{index}': pint_pandas.PintArray(
+                    rng.random(rows), 'pint[degC][float64]'
+                )
+                for index in range(columns)
+            },
+            copy=False,
+        )
+        size = rows * columns * 8
+        cache = DataFrameFileCache(format=format)
+        filename = tmp_path / f'cache.{format}'
+        cache.write(df, filename=filename)
+
+        tracemalloc.start()
+        try:
+            cache.write(df, filename=filename)
+            _, write_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            cached = cache.read(filename=filename)
+            _, read_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        tm.assert_frame_equal(cached.pint.dequantify(), df.pint.dequantify())
+        assert write_peak < max_write * size
+        assert read_peak < max_read * size
+
+    def test_memory_mapped_cache(self, tmp_path):
+        pytest.importorskip('pyarrow')
+        source = tmp_path / 'data.csv'
+        source.write_text('t,A\n2024-01-16T10:00:00,1\n2024-01-16T10:00:01,3\n')
+        path = tmp_path / 'cache.feather'
+        workflow = ProcessNode(
+            parent=self.create_cached_csv_workflow(
+                source, path, format='feather', memory_map=True
+            ),
+            runner=DataFrameTimeOffset(),
+            params={
+                'offset': PlainProcessParam(value='1 min'),
+                'column': PlainProcessParam(value='t'),
+            },
+        )
+        workflow.parent.parent.runner = DataFrameReadCSV(parse_dates=['t'])
+
+        expected = workflow.run()
+        cached = workflow.run()
+        tm.assert_frame_equal(cached, expected)
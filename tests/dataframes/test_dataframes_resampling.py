@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+import pint_pandas
+import pytest
+
+from rdmlibpy.dataframes import DataFrameResample
+from rdmlibpy.dataframes.dataframes_streaming import DataFrameStream
+from rdmlibpy.timespan import Timespan
+
+
+def create_frame(rows: int = 50):
+    return pd.DataFrame(
+        dict(
+            A=np.arange(rows, dtype=np.float64),
+            B=pint_pandas.PintArray(np.arange(rows) * 2.0, dtype='pint[m][float64]'),
+            C=list('abcdefghij') * (rows // 10),
+        ),
+        index=pd.date_range(
+            '2024-01-16T10:00:00.3', periods=rows, freq='100ms', name='t'
+        ),
+    )
+
+
+def stream(df: pd.DataFrame, chunksize: int):
+    return DataFrameStream(
+        lambda: (df.iloc[i : i + chunksize] for i in range(0, len(df), chunksize))
+    )
+
+
+class TestDataFrameResample:
+    def test_create_transform(self):
+        transform = DataFrameResample()
+
+        assert transform.name == 'dataframe.resample'
+        assert transform.version == '1'
+
+    @pytest.mark.parametrize('method', ['mean', 'min', 'max', 'first', 'last'])
+    def test_resample_like_pandas(self, method):
+        df = create_frame()
+
+        actual = DataFrameResample().run(df, freq='1 s', method=method)
+
+        expected = getattr(df[['A']].assign(B=df['B'].pint.m).resample('1s'), method)()
+        assert list(actual.index) == list(expected.index)
+        assert actual.index.name == 't'
+        assert np.allclose(actual['A'], expected['A'])
+        assert actual['B'].dtype == 'pint[m][float64]'
+        assert np.allclose(actual['B'].pint.m, expected['B'])
+
+    def test_aggregate_numeric_columns_only(self):
+        df = create_frame()
+
+        assert list(DataFrameResample().run(df, method='mean').columns) == ['A', 'B']
+        assert list(DataFrameResample().run(df, method='last').columns) == [
+            'A',
+            'B',
+            'C',
+        ]
+
+    def test_count_and_skip_missing_values(self):
+        df = create_frame(20)
+        df.iloc[[0, 1], 0] = np.nan
+
+        count = DataFrameResample().run(df, freq='1 s', method='count')
+        mean = DataFrameResample().run(df, freq='1 s', method='mean')
+
+        assert list(count['A']) == [5, 10, 3]
+        assert list(count['C']) == [7, 10, 3]
+        assert mean['A'].iloc[0] == np.mean([2.0, 3.0, 4.0, 5.0, 6.0])
+
+    def test_resample_time_column(self):
+        df = create_frame().reset_index()
+
+        actual = DataFrameResample().run(df, freq='2 s', method='max', column='t')
+
+        assert actual.index.name == 't'
+        assert list(actual.columns) == ['A', 'B']
+        assert list(actual['A']) == [16.0, 36.0, 49.0]
+
+    @pytest.mark.parametrize('method', ['mean', 'min', 'max', 'first', 'last', 'count'])
+    @pytest.mark.parametrize('chunksize', [1, 7, 10, 100])
+    def test_resample_stream(self, method, chunksize):
+        df = create_frame()
+
+        actual = DataFrameResample().run(stream(df, chunksize), method=method)
+
+        assert isinstance(actual, DataFrameStream)
+        tm.assert_frame_equal(
+            actual.collect(), DataFrameResample().run(df, method=method)
+        )
+
+    def test_push_down_timespan_of_time_column(self):
+        transform = DataFrameResample()
+        timespan = Timespan.create(
+            't', '2024-01-16T10:00:00.5', '2024-01-16T10:00:03.5'
+        )
+
+        assert transform.push_down_timespan(timespan, freq='1 s') is None
+        assert transform.push_down_timespan(
+            timespan, freq='1 s', column='t'
+        ) == Timespan.create(
+            't', '2024-01-16T10:00:01', '2024-01-16T10:00:03.999999999'
+        )
+        assert transform.push_down_columns(['A'], column='t') == ['A', 't']
@@ -1,8 +1,11 @@
 from pathlib import Path
 
 import pandas as pd
+import pandas._testing as tm
+import pytest
 
-from rdmlibpy.loaders import ChannelTCLoggerLoader
+from rdmlibpy import Workflow
+from rdmlibpy.loaders import ChannelTCLoggerLoader, MksFTIRLoader
 from rdmlibpy.dataframes import SelectColumns, SelectTimespan
 
 
@@ -88,3 +91,129 @@ class TestSelectTimespan:
         )
 
         assert len(df) == 4  # type: ignore
+
+
+class TestColumnPushDown:
+    @staticmethod
+    def create_workflow(data_path: Path, *steps, push_down: bool = True):
+        return Workflow.create(
+            [
+                (
+                    ChannelTCLoggerLoader(),
+                    dict(source=str(data_path / 'ChannelV2TCLog/*.csv')),
+                ),
+                *steps,
+            ],
+            push_down=push_down,
+        )
+
+    def test_do_not_push_down_by_default(self, data_path: Path):
+        workflow = Workflow.create(
+            [
+                (
+                    ChannelTCLoggerLoader(),
+                    dict(source=str(data_path / 'ChannelV2TCLog/*.csv')),
+                ),
+                ('dataframe.select.columns@v1', dict(select=['inlet'])),
+            ]
+        )
+
+        assert 'columns' not in workflow.process.parent.params
+
+    def test_push_down_selected_columns(self, data_path: Path):
+        steps = [
+            ('dataframe.timeoffset@v1', dict(offset='1 s', column='timestamp')),
+            ('dataframe.select.columns@v1', dict(select={'inlet': 'T'})),
+        ]
+        workflow = self.create_workflow(data_path, *steps)
+
+        loader = workflow.process.parent.parent
+        assert loader.params['columns'].get_value() == ['inlet', 'timestamp']
+        df = workflow.run()
+        assert list(df.columns) == ['T']
+        tm.assert_frame_equal(
+            df, self.create_workflow(data_path, *steps, push_down=False).run()
+        )
+
+    def test_push_down_to_pyarrow_engine(self, data_path: Path):
+        pytest.importorskip('pyarrow')
+
+        def create_workflow(push_down: bool = True):
+            return Workflow.create(
+                [
+                    (
+                        ChannelTCLoggerLoader(engine='pyarrow'),
+                        dict(source=str(data_path / 'ChannelV2TCLog/*.csv')),
+                    ),
+                    (
+                        'dataframe.select.columns@v1',
+                        dict(select=['timestamp', 'inlet']),
+                    ),
+                ],
+                push_down=push_down,
+            )
+
+        df = create_workflow().run()
+
+        assert list(df.columns) == ['timestamp', 'inlet']
+        tm.assert_frame_equal(df, create_workflow(push_down=False).run())
+
+    def test_keep_columns_required_to_parse_dates(self, data_path: Path):
+        workflow = Workflow.create(
+            [
+                (MksFTIRLoader(), dict(source=str(data_path / 'mks_ftir/*.prn'))),
+                ('dataframe.select.columns@v1', dict(select=['NO (350,3000) 191C'])),
+            ],
+            push_down=True,
+        )
+        loader = workflow.process.parent
+
+        df = loader.run(columns=['NO (350,3000) 191C'])
+
+        assert list(df.columns) == ['timestamp', 'NO (350,3000) 191C']
+        assert df['timestamp'].notna().all()
+        assert list(workflow.run().columns) == ['NO (350,3000) 191C']
+
+    def test_merge_nested_selections(self, data_path: Path):
+        workflow = self.create_workflow(
+            data_path,
+            ('dataframe.select.columns@v1', dict(select=['timestamp', 'inlet'])),
+            ('dataframe.select.columns@v1', dict(select=['inlet'])),
+        )
+
+        loader = workflow.process.parent.parent
+        assert loader.params['columns'].get_value() == ['timestamp', 'inlet']
+
+    def test_merge_selections_of_shared_loader(self, data_path: Path):
+        def branch(select):
+            return [
+                (
+                    ChannelTCLoggerLoader(),
+                    dict(source=str(data_path / 'ChannelV2TCLog/*.csv')),
+                ),
+                ('dataframe.select.columns@v1', dict(select=select)),
+                ('dataframe.setindex@v1', dict(index_var='timestamp')),
+            ]
+
+        workflow = Workflow.create(
+            {
+                'run': 'dataframe.join@v1',
+                'params': {
+                    '$left': branch(['timestamp', 'inlet']),
+                    '$right': branch(['timestamp', 'outlet']),
+                },
+            },
+            push_down=True,
+        )
+
+        left = workflow.process.params['left'].node
+        right = workflow.process.params['right'].node
+        loader = left.parent.parent
+        assert loader is right.parent.parent
+        assert sorted(loader.params['columns'].get_value()) == [
+            'inlet',
+            'outlet',
+            'timestamp',
+        ]
+        df = workflow.run()
+        assert list(df.columns) == ['inlet', 'outlet']
@@ -0,0 +1,276 @@
+import io
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+import pint_pandas
+import pytest
+
+import rdmlibpy as rdm
+from rdmlibpy.dataframes import (
+    DataFrameFileCache,
+    DataFrameReadCSV,
+    DataFrameWriteCSV,
+)
+from rdmlibpy.dataframes.dataframe_transforms import DataFrameUnits
+from rdmlibpy.dataframes.dataframes_streaming import DataFrameStream
+from rdmlibpy.loaders import HidenRGALoader
+
+
+def create_sources(path: Path, files: int = 3, rows: int = 10):
+    for i in range(files):
+        timestamps = pd.date_range(f'2024-01-{i + 1:02d}', periods=rows, freq='1h')
+        df = pd.DataFrame(
+            dict(
+                timestamp=timestamps.strftime('%Y-%m-%dT%H:%M:%S'),
+                A=np.arange(rows) + 100 * i,
+                B=np.linspace(0.0, 1.0, rows),
+            )
+        )
+        df.to_csv(path / f'data{i}.csv', index=False)
+    return path / 'data*.csv'
+
+
+def create_workflow(source: Path, chunksize=None, sink=None):
+    steps = [
+        (
+            DataFrameReadCSV(chunksize=chunksize, parse_dates=['timestamp']),
+            dict(source=str(source)),
+        ),
+        ('dataframe.select.columns@v1', dict(select=['timestamp', 'A', 'B'])),
+        ('dataframe.timeoffset@v1', dict(offset='30 min', column='timestamp')),
+        (
+            'dataframe.select.timespan@v1',
+            dict(column='timestamp', start='2024-01-01T12:00', stop='2024-01-03T03:00'),
+        ),
+        ('dataframe.astype@v1', dict(dtypes=dict(A='float64'))),
+        ('dataframe.units@v1', dict(units=dict(A='m', B='s'))),
+    ]
+    if sink is not None:
+        steps.append(sink)
+    return rdm.Workflow.create(steps)
+
+
+class TestDataFrameStream:
+    def test_map_and_collect(self):
+        stream = DataFrameStream(
+            lambda: (pd.DataFrame(dict(A=[i, i + 1])) for i in range(0, 6, 2))
+        )
+        doubled = stream.map(lambda chunk: chunk * 2)
+
+        assert list(doubled.collect()['A']) == [0, 2, 4, 6, 8, 10]
+        # streams can be iterated repeatedly
+        assert len(list(doubled)) == 3
+
+    def test_collect_empty_stream(self):
+        assert DataFrameStream(lambda: []).collect().empty
+
+
+class TestStreamingLoader:
+    def test_read_chunks(self, tmp_path: Path):
+        source = create_sources(tmp_path)
+        loader = DataFrameReadCSV(chunksize=4, parse_dates=['timestamp'])
+
+        stream = loader.run(source)
+
+        assert isinstance(stream, DataFrameStream)
+        chunks = list(stream)
+        # chunks do not span multiple files
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2] * 3
+        assert chunks[0]['timestamp'].dtype == np.dtype('<M8[ns]')
+
+        expected = DataFrameReadCSV(parse_dates=['timestamp']).run(source)
+        tm.assert_frame_equal(stream.collect(), expected)
+
+    def test_read_chunks_lazily(self, tmp_path: Path):
+        source = create_sources(tmp_path)
+        stream = DataFrameReadCSV(chunksize=4).run(source)
+
+        # files are read when iterating the stream only
+        (tmp_path / 'data2.csv').unlink()
+        assert len(stream.collect()) == 20
+
+    def test_read_chunks_from_buffer(self):
+        buffer = io.StringIO('A,B\n1,2\n3,4\n5,6\n')
+        stream = DataFrameReadCSV(chunksize=2).run(buffer)
+
+        assert [len(chunk) for chunk in stream] == [2, 1]
+
+
+class TestStreamingWorkflow:
+    def test_transform_chunks(self, tmp_path: Path):
+        source = create_sources(tmp_path)
+
+        expected = create_workflow(source).run()
+        stream = create_workflow(source, chunksize=4).run()
+
+        assert isinstance(stream, DataFrameStream)
+        tm.assert_frame_equal(stream.collect(), expected)
+
+    def test_resample_chunks(self, tmp_path: Path):
+        source = create_sources(tmp_path)
+        resample = ('dataframe.resample@v1', dict(freq='3 h', column='timestamp'))
+
+        expected = create_workflow(source, sink=resample).run()
+        stream = create_workflow(source, chunksize=4, sink=resample).run()
+
+        assert isinstance(stream, DataFrameStream)
+        tm.assert_frame_equal(stream.collect(), expected)
+
+    def test_transform_chunk_by_chunk(self):
+        stream = DataFrameStream(
+            lambda: (pd.DataFrame(dict(A=[1.0, 2.0])) for _ in range(2))
+        )
+        result = DataFrameUnits().run(stream, units=dict(A='m'))
+
+        assert isinstance(result, DataFrameStream)
+        for chunk in result:
+            assert isinstance(chunk['A'].values, pint_pandas.PintArray)
+
+    def test_write_csv(self, tmp_path: Path):
+        source = create_sources(tmp_path)
+
+        create_workflow(
+            source, sink=(DataFrameWriteCSV(), dict(filename=tmp_path / 'full.csv'))
+        ).run()
+        create_workflow(
+            source,
+            chunksize=4,
+            sink=(DataFrameWriteCSV(), dict(filename=tmp_path / 'chunked.csv')),
+        ).run()
+
+        expected = (tmp_path / 'full.csv').read_text()
+        assert (tmp_path / 'chunked.csv').read_text() == expected
+
+    def test_write_cache(self, tmp_path: Path):
+        source = create_sources(tmp_path)
+        expected = create_workflow(source).run()
+
+        workflow = create_workflow(
+            source,
+            chunksize=4,
+            sink=(DataFrameFileCache(), dict(filename=tmp_path / 'cache.h5')),
+        )
+        workflow.run()
+        with pd.HDFStore(tmp_path / 'cache.h5', 'r') as store:
+            assert len(store.keys()) > 1
+
+        # read from cache
+        cached = workflow.run()
+        assert isinstance(cached, pd.DataFrame)
+        tm.assert_frame_equal(cached, expected)
+
+    def test_read_cache_as_stream(self, tmp_path: Path):
+        source = create_sources(tmp_path)
+        expected = create_workflow(source).run()
+
+        workflow = create_workflow(
+            source,
+            chunksize=4,
+            sink=(
+                DataFrameFileCache(stream=True),
+                dict(filename=tmp_path / 'cache.h5'),
+            ),
+        )
+        workflow.run()
+
+        cached = workflow.run()
+        assert isinstance(cached, DataFrameStream)
+        tm.assert_frame_equal(cached.collect(), expected)
+
+    @pytest.mark.parametrize('format', ['parquet', 'feather'])
+    def test_write_stream_to_columnar_cache(self, tmp_path: Path, format):
+        pytest.importorskip('pyarrow')
+        source = create_sources(tmp_path)
+        expected = create_workflow(source).run()
+
+        workflow = create_workflow(
+            source,
+            chunksize=4,
+            sink=(
+                DataFrameFileCache(stream=True, format=format),
+                dict(filename=tmp_path / f'cache.{format}'),
+            ),
+        )
+        workflow.run()
+
+        cached = workflow.run()
+        assert isinstance(cached, DataFrameStream)
+        chunks = list(cached)
+        assert len(chunks) > 1
+        tm.assert_frame_equal(pd.concat(chunks), expected)
+
+    @pytest.mark.parametrize(
+        'sink',
+        [
+            (DataFrameWriteCSV(), dict(filename='out/data.csv')),
+            (DataFrameFileCache(), dict(filename='out/cache.h5')),
+            (DataFrameFileCache(format='parquet'), dict(filename='out/cache.parquet')),
+        ],
+        ids=['csv', 'hdf5', 'parquet'],
+    )
+    def test_pass_on_written_stream(self, tmp_path: Path, sink):
+        if sink[1]['filename'].endswith('.parquet'):
+            pytest.importorskip('pyarrow')
+        source = create_sources(tmp_path)
+        expected = create_workflow(source).run()
+        writer, params = sink
+        sink = (writer, dict(filename=tmp_path / params['filename']))
+
+        stream = create_workflow(source, chunksize=4, sink=sink).run()
+
+        # the written chunks are passed on (without reading the sources again)
+        for path in tmp_path.glob('data*.csv'):
+            path.unlink()
+        assert isinstance(stream, DataFrameStream)
+        tm.assert_frame_equal(stream.collect(), expected)
+
+    def test_written_stream_equals_written_frame(self, tmp_path: Path):
+        # (the CSV file cuts nanoseconds & keeps units and attrs in the header)
+        timestamps = pd.date_range('2024-01-01', periods=10, freq='1001ns')
+        df = pd.DataFrame(
+            dict(
+                timestamp=timestamps,
+                A=pint_pandas.PintArray(np.linspace(0.0, 1.0, 10) / 3, 'm'),
+            ),
+            index=pd.Index(np.arange(10) * 0.5, name='x'),
+        )
+        df.attrs['sample'] = 'S1'
+        chunks = DataFrameStream(lambda: (df.iloc[i : i + 4] for i in range(0, 10, 4)))
+
+        written = DataFrameWriteCSV().run(df, tmp_path / 'frame.csv')
+        stream = DataFrameWriteCSV().run(chunks, tmp_path / 'stream.csv')
+
+        assert isinstance(stream, DataFrameStream)
+        tm.assert_frame_equal(stream.collect(), written)
+        assert (tmp_path / 'stream.csv').read_text() == (
+            tmp_path / 'frame.csv'
+        ).read_text()
+
+    @pytest.mark.parametrize(
+        'step',
+        [
+            ('dataframe.setindex@v1', dict(index_var='timestamp')),
+            ('dataframe.interpolate@v1', dict()),
+            ('dataframe.fillna@v1', dict()),
+        ],
+    )
+    def test_collect_stream_of_transforms_across_rows(self, tmp_path: Path, step):
+        source = create_sources(tmp_path)
+
+        expected = create_workflow(source, sink=step).run()
+        result = create_workflow(source, chunksize=4, sink=step).run()
+
+        assert isinstance(result, pd.DataFrame)
+        tm.assert_frame_equal(result, expected)
+
+    def test_load_hiden_rga_chunks(self, data_path: Path):
+        source = data_path / 'hiden/ae03_20240123_nh3lo_n2_2nlpm_f06_test1.csv'
+        expected = HidenRGALoader().run(source)
+
+        stream = HidenRGALoader(chunksize=4).run(source)
+
+        assert isinstance(stream, DataFrameStream)
+        assert [len(chunk) for chunk in stream] == [4, 4, 2]
+        tm.assert_frame_equal(stream.collect(), expected)
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+import pint_pandas
+
+from rdmlibpy.dataframes.dataframes_units import (
+    dequantify,
+    magnitudes,
+    pint_array,
+    quantify,
+)
+
+
+def test_pint_array_wraps_magnitudes():
+    values = np.array([1.0, 2.0, 3.0])
+
+    array = pint_array(pd.Series(values), 'm')
+
+    assert str(array.dtype) == 'pint[meter][float64]'
+    assert np.shares_memory(magnitudes(pd.Series(array)), values)
+
+
+def test_magnitudes_without_copy():
+    values = np.array([1.0, 2.0, 3.0])
+    series = pd.Series(pint_pandas.PintArray(values, dtype='pint[m][float64]'))
+
+    actual = magnitudes(series)
+
+    assert isinstance(actual, np.ndarray)
+    assert np.shares_memory(actual, magnitudes(series))
+
+
+def test_magnitudes_with_missing_values():
+    series = pd.Series(pint_pandas.PintArray([1.0, None, 3.0], dtype='pint[m]'))
+
+    actual = magnitudes(series)
+
+    assert isinstance(actual, np.ndarray)
+    np.testing.assert_array_equal(actual, [1.0, np.nan, 3.0])
+
+
+def test_magnitudes_of_plain_columns():
+    series = pd.Series(['a', 'b'])
+
+    assert list(magnitudes(series)) == ['a', 'b']
+
+
+def test_quantify_and_dequantify_without_copy():
+    values = np.array([1.0, 2.0, 3.0])
+    df = pd.DataFrame(
+        {
+            ('A', 'm'): values,
+            ('B', 'No Unit'): ['aa', 'bb', 'cc'],
+        },
+        index=pd.Index([10, 20, 30], name='t'),
+        copy=False,
+    )
+    df.attrs.update(source='test')
+
+    quantified = quantify(df)
+
+    assert list(quantified.columns) == ['A', 'B']
+    assert str(quantified['A'].pint.units) == 'meter'
+    assert np.shares_memory(magnitudes(quantified['A']), values)
+    assert quantified.attrs == df.attrs
+
+    dequantified = dequantify(quantified)
+
+    assert list(dequantified.columns) == [('A', 'meter'), ('B', 'No Unit')]
+    tm.assert_index_equal(dequantified.index, df.index)
+    assert np.shares_memory(dequantified.iloc[:, 0].to_numpy(), values)
@@ -2,6 +2,8 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pandas._testing as tm
+import pytest
 
 from rdmlibpy.loaders import (
     ChannelEurothermLoggerLoader,
@@ -35,6 +37,16 @@ class TestChannelEurothermLoggerLoader:
         assert df['timestamp'].iloc[0] == np.datetime64('2024-01-18T08:49:01.551')
         assert df['timestamp'].iloc[-1] == np.datetime64('2024-01-18T09:28:01.359')
 
+    def test_load_with_pyarrow_engine(self, data_path: Path):
+        pytest.importorskip('pyarrow')
+        source = data_path / 'eurotherm/*.txt'
+        expected = ChannelEurothermLoggerLoader().run(source=source)
+
+        df = ChannelEurothermLoggerLoader(engine='pyarrow').run(source=source)
+
+        assert df['timestamp'].dtype == expected['timestamp'].dtype
+        tm.assert_frame_equal(df, expected, check_dtype=False)
+
 
 class TestChannelEurothermLoggerLoaderV1_1:
     def test_create_loader(self):
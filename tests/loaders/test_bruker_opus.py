@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import numpy as np
+import pytest
 import xarray as xr
 
 from rdmlibpy.loaders import BrukerOpusLoader
@@ -123,3 +124,51 @@ class TestBrukerOpusLoader:
         assert da.name == 'igrf'
 
         assert da.timestamp[0] == np.datetime64('2024-10-17T16:08:45.180000')
+
+    def test_stack_like_concat(self, data_path: Path):
+        loader = BrukerOpusLoader(sort_by_timestamp=False)
+        paths = sorted((data_path / 'bruker').glob('LC003.*'))
+
+        da = loader.run(source=paths)
+
+        expected = xr.concat(
+            [loader._load_single_spectrum(path) for path in paths], dim='timestamp'
+        )
+        xr.testing.assert_identical(da, expected)
+
+    def test_stack_along_new_dimension(self, data_path: Path):
+        loader = BrukerOpusLoader(concat_dim='index')
+        da = loader.run(source=data_path / 'bruker/LC003.*')
+
+        assert da.dims == ('index', 'nu')
+        assert da.timestamp.dims == ('index',)
+        assert da.timestamp[0] == np.datetime64('2024-10-17T16:19:04.075')
+
+    @pytest.mark.parametrize('executor', ['threads', 'processes'])
+    def test_load_concurrently(self, data_path: Path, executor):
+        source = data_path / 'bruker/LC003.*'
+        expected = BrukerOpusLoader().run(source=source)
+
+        loader = BrukerOpusLoader(workers=2, executor=executor)
+        xr.testing.assert_identical(loader.run(source=source), expected)
+
+        loader = BrukerOpusLoader(workers=2, executor=executor, concatenate=False)
+        data = loader.run(source=source)
+        assert [da.timestamp for da in data] == list(expected.timestamp)
+
+    def test_concat_spectra_with_different_wavenumbers(self, data_path: Path):
+        class TruncatingLoader(BrukerOpusLoader):
+            # truncates the spectrum of the last file
+            def _read_spectrum(self, source):
+                y, nu, timestamp = super()._read_spectrum(source)
+                if str(source).endswith('3450'):
+                    return y[:100], nu[:100], timestamp
+                return y, nu, timestamp
+
+        da = TruncatingLoader().run(source=data_path / 'bruker/LC003.*')
+
+        assert da.dims == ('timestamp', 'nu')
+        assert len(da.nu) == 4978  # type: ignore
+        assert len(da.timestamp) == 3  # type: ignore
+        assert da[2].notnull().sum() == 100
+        assert da[:2].notnull().all()
@@ -29,3 +29,13 @@ class TestDavisImageSet:
         assert len(images.buffer) == 10
         assert len(images.y) == 250
         assert len(images.x) == 2560
+
+    def test_input_files_include_images(self, data_path):
+        loader = DavisImageSetLoader()
+        path = data_path / 'davis' / 'SimpleImageSet'
+
+        files = loader.get_input_files(source=path)
+
+        assert files[0] == data_path / 'davis' / 'SimpleImageSet.set'
+        assert sorted(files[1:]) == sorted(path.iterdir())
+        assert loader.get_input_files(source=path.with_suffix('.set')) == files
@@ -2,6 +2,8 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pandas._testing as tm
+import pytest
 
 from rdmlibpy.loaders import HidenRGALoader
 
@@ -67,3 +69,13 @@ class TestHidenRGALoader:
         assert isinstance(df, pd.DataFrame)
         assert df['timestamp'].iloc[0] == np.datetime64('2024-02-07T06:43:27')
         assert df['timestamp'].iloc[1] == np.datetime64('2024-02-07T06:43:28.017')
+
+    def test_load_with_pyarrow_engine(self, data_path: Path):
+        pytest.importorskip('pyarrow')
+        source = data_path / 'hiden/ae03_20240123_nh3lo_n2_2nlpm_f06_test1.csv'
+        expected = HidenRGALoader().run(source=source)
+
+        df = HidenRGALoader(engine='pyarrow').run(source=source)
+
+        assert df['timestamp'].dtype == expected['timestamp'].dtype
+        tm.assert_frame_equal(df, expected, check_dtype=False)
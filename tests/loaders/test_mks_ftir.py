@@ -2,6 +2,8 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pandas._testing as tm
+import pytest
 
 from rdmlibpy.loaders import MksFTIRLoader
 
@@ -32,3 +34,13 @@ class TestMksFTIRLoader:
         assert 'timestamp' in df.columns
         assert df['timestamp'].dtype == np.dtype('<M8[ns]')  # type: ignore
         assert df['timestamp'].iloc[0] == np.datetime64('2024-01-16T10:05:21')
+
+    def test_load_with_pyarrow_engine(self, data_path: Path):
+        pytest.importorskip('pyarrow')
+        source = data_path / 'mks_ftir/2024-01-16-conc.prn'
+        expected = MksFTIRLoader().run(source=source)
+
+        df = MksFTIRLoader(engine='pyarrow').run(source=source)
+
+        assert df['timestamp'].dtype == expected['timestamp'].dtype
+        tm.assert_frame_equal(df, expected, check_dtype=False)
@@ -1,6 +1,8 @@
 from pathlib import Path
 
 import pandas as pd
+import pint_pandas
+import pytest
 
 from rdmlibpy.serializers import PandasDataFrameSerializer
 
@@ -80,3 +82,28 @@ class TestPandasDataFrameSerializer:
         assert path.exists()
         assert list(df.A) == [1.1, 2.2, 3.3]
         assert list(df.B) == ['aa', 'bb', 'cc']
+
+    @pytest.mark.parametrize('format', ['parquet', 'feather'])
+    def test_roundtrip_columnar(self, tmp_path: Path, format):
+        pytest.importorskip('pyarrow')
+        source = pd.DataFrame(
+            data=dict(
+                A=pint_pandas.PintArray([1.1, 2.2, 3.3], dtype='pint[m][float64]'),
+                B=['aa', 'bb', 'cc'],
+            )
+        )
+        source.attrs.update(date='2024-04-26')
+        path = tmp_path / f'data.{format}'
+
+        serializer = PandasDataFrameSerializer(
+            format=format, options=dict(columns=['A'], start=1)
+        )
+        serializer.write(source, path)
+        df = serializer.load(path)
+
+        assert path.exists()
+        assert list(df.columns) == ['A']
+        assert list(df.index) == [1, 2]
+        assert str(df.A.pint.units) == 'meter'
+        assert list(df.A.pint.magnitude) == [2.2, 3.3]
+        assert df.attrs == dict(date='2024-04-26')
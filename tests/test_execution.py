@@ -0,0 +1,262 @@
+import os
+import threading
+from typing import Any, ClassVar, List
+
+import pytest
+
+from rdmlibpy.base import ProcessBase, ProcessNode, RunnableProcessParam
+from rdmlibpy.execution import ExecutionContext, current_context
+from rdmlibpy.registry import register
+from rdmlibpy.workflow import Workflow
+
+
+class CountingSource(ProcessBase):
+    name: str = 'test.counting.source'
+    version: str = '1'
+    calls: ClassVar[int] = 0
+
+    def run(self, value: Any = None):
+        CountingSource.calls += 1
+        return [value]
+
+
+class Pair(ProcessBase):
+    name: str = 'test.pair'
+    version: str = '1'
+
+    def run(self, left: List[Any], right: List[Any]):
+        return left, right
+
+
+class Append(ProcessBase):
+    name: str = 'test.append'
+    version: str = '1'
+
+    def run(self, source: List[Any], value: Any = None, **kwargs):
+        source.append(value)
+        return source
+
+
+class BarrierSource(ProcessBase):
+    name: str = 'test.barrier.source'
+    version: str = '1'
+    barrier: ClassVar[threading.Barrier] = threading.Barrier(2, timeout=5.0)
+
+    def run(self, value: Any = None):
+        # only passes, if both sources are evaluated concurrently
+        BarrierSource.barrier.wait()
+        return [value]
+
+
+class ProcessId(ProcessBase):
+    name: str = 'test.process.id'
+    version: str = '1'
+
+    def run(self, value: Any = None):
+        return value, os.getpid()
+
+
+register(ProcessId())
+
+
+def source_node(value: Any = None):
+    return ProcessNode(runner=CountingSource(), params={'value': value})
+
+
+class TestExecutionContext:
+    def test_no_active_context_outside_of_run(self):
+        assert current_context() is None
+
+        with ExecutionContext(source_node(1)) as context:
+            assert current_context() is context
+
+        assert current_context() is None
+
+    def test_key_is_content_addressed(self):
+        node = source_node(1)
+        with ExecutionContext(node) as context:
+            assert context.key(node) == context.key(source_node(1))
+            assert context.key(node) != context.key(source_node(2))
+            assert context.key(node) != context.key(node, dict(value=2))
+
+    def test_memoize_structurally_identical_nodes(self):
+        # different node instances, which are not shared by `Workflow.create`
+        workflow = Workflow(
+            ProcessNode(
+                runner=Pair(),
+                params={
+                    'left': RunnableProcessParam(node=source_node(1)),
+                    'right': RunnableProcessParam(node=source_node(1)),
+                },
+            )
+        )
+
+        CountingSource.calls = 0
+        assert workflow.run() == ([1], [1])
+        assert CountingSource.calls == 1
+
+    def test_memoize_parent_used_as_parameter(self):
+        source = source_node(1)
+        workflow = Workflow(
+            ProcessNode(
+                runner=Pair(),
+                parent=ProcessNode(
+                    runner=Append(), parent=source, params={'value': 'x'}
+                ),
+                params={'right': RunnableProcessParam(node=source)},
+            )
+        )
+
+        CountingSource.calls = 0
+        # `Pair.run` receives the output of `Append` as `left`
+        assert workflow.run() == ([1, 'x'], [1])
+        assert CountingSource.calls == 1
+
+    def test_runtime_arguments_are_part_of_the_key(self):
+        source = ProcessNode(runner=CountingSource())
+        workflow = Workflow(
+            ProcessNode(
+                runner=Pair(),
+                parent=source,
+                params={'right': RunnableProcessParam(node=source)},
+            )
+        )
+
+        CountingSource.calls = 0
+        # the parent receives the runtime arguments, the parameter does not
+        assert workflow.run(value=1) == ([1], [None])
+        assert CountingSource.calls == 2
+
+    def test_last_consumer_receives_memoized_result(self):
+        value = ['value']
+        workflow = Workflow(
+            ProcessNode(
+                runner=Pair(),
+                params={
+                    'left': RunnableProcessParam(node=source_node(value)),
+                    'right': RunnableProcessParam(node=source_node(value)),
+                },
+            )
+        )
+
+        left, right = workflow.run()
+        assert left is not right
+        assert left == right == [['value']]
+        assert (left[0] is value) != (right[0] is value)
+
+
+class TestThreadExecutor:
+    def test_evaluate_branches_concurrently(self):
+        BarrierSource.barrier.reset()
+        workflow = Workflow(
+            ProcessNode(
+                runner=Pair(),
+                params={
+                    'left': RunnableProcessParam(
+                        node=ProcessNode(runner=BarrierSource(), params={'value': 1})
+                    ),
+                    'right': RunnableProcessParam(
+                        node=ProcessNode(runner=BarrierSource(), params={'value': 2})
+                    ),
+                },
+            )
+        )
+
+        assert workflow.run(executor='threads', max_workers=2) == ([1], [2])
+
+    def test_nested_branches_with_single_worker(self):
+        def pair(left, right):
+            return ProcessNode(
+                runner=Pair(),
+                params={
+                    'left': RunnableProcessParam(node=left),
+                    'right': RunnableProcessParam(node=right),
+                },
+            )
+
+        workflow = Workflow(
+            pair(
+                pair(pair(source_node(1), source_node(2)), source_node(3)),
+                pair(source_node(4), pair(source_node(5), source_node(6))),
+            )
+        )
+
+        expected = workflow.run()
+        assert workflow.run(executor='threads', max_workers=1) == expected
+
+    def test_shared_node_runs_once(self):
+        workflow = Workflow(
+            ProcessNode(
+                runner=Pair(),
+                params={
+                    'left': RunnableProcessParam(node=source_node(1)),
+                    'right': RunnableProcessParam(node=source_node(1)),
+                },
+            )
+        )
+
+        CountingSource.calls = 0
+        assert workflow.run(executor='threads') == ([1], [1])
+        assert CountingSource.calls == 1
+
+    def test_invalid_executor(self):
+        workflow = Workflow(source_node(1))
+        with pytest.raises(ValueError):
+            workflow.run(executor='invalid')  # type: ignore
+
+
+class TestProcessExecutor:
+    @staticmethod
+    def create_workflow(runner: ProcessBase):
+        return Workflow(
+            ProcessNode(
+                runner=Pair(),
+                params={
+                    'left': RunnableProcessParam(
+                        node=ProcessNode(runner=runner, params={'value': 1})
+                    ),
+                    'right': RunnableProcessParam(
+                        node=ProcessNode(runner=runner, params={'value': 2})
+                    ),
+                },
+            )
+        )
+
+    def test_run_branches_in_worker_processes(self):
+        workflow = self.create_workflow(ProcessId())
+
+        left, right = workflow.run(
+            executor='processes', max_workers=2, remote_policy='all'
+        )
+        assert left[0] == 1
+        assert right[0] == 2
+        assert left[1] != os.getpid()
+        assert right[1] != os.getpid()
+
+    def test_keep_branches_local_by_default(self):
+        # `ProcessId` is not CPU-bound
+        workflow = self.create_workflow(ProcessId())
+
+        left, right = workflow.run(executor='processes', max_workers=2)
+        assert left == (1, os.getpid())
+        assert right == (2, os.getpid())
+
+    def test_callable_remote_policy(self):
+        workflow = self.create_workflow(ProcessId())
+
+        left, right = workflow.run(
+            executor='processes',
+            max_workers=2,
+            remote_policy=lambda node: node.get_param('value') == 2,
+        )
+        assert left == (1, os.getpid())
+        assert right[0] == 2
+        assert right[1] != os.getpid()
+
+    def test_unregistered_runners_stay_local(self):
+        workflow = self.create_workflow(CountingSource())
+
+        CountingSource.calls = 0
+        result = workflow.run(executor='processes', remote_policy='all')
+        assert result == ([1], [2])
+        assert CountingSource.calls == 2
@@ -0,0 +1,118 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from rdmlibpy.glob_index import GlobIndex
+
+
+def backdate(root: Path, seconds: float = 10.0):
+    # directories modified just now are considered "racy" and are not cached
+    mtime = time.time() - seconds
+    for path, _, _ in os.walk(root):
+        os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def tree(tmp_path: Path):
+    for name in ['a/b/c', 'd', '.hidden']:
+        (tmp_path / name).mkdir(parents=True)
+    for name in [
+        'x.csv',
+        'a/y.csv',
+        'a/b/z.csv',
+        'a/b/c/w.txt',
+        'd/v.CSV',
+        '.hidden/h.csv',
+    ]:
+        (tmp_path / name).write_text('A\n1\n')
+    backdate(tmp_path)
+    return tmp_path
+
+
+class CountingScandir:
+    def __init__(self, monkeypatch):
+        self.calls = 0
+        scandir = os.scandir
+
+        def counting_scandir(path):
+            self.calls += 1
+            return scandir(path)
+
+        monkeypatch.setattr(os, 'scandir', counting_scandir)
+
+
+class TestGlobIndex:
+    @pytest.mark.parametrize(
+        'pattern',
+        [
+            '*.csv',
+            '**/*.csv',
+            '**',
+            'a/**/*.csv',
+            '*/*.csv',
+            'a/b/z.csv',
+            'a/b',
+            '[ad]/*',
+            '**/b/**/*',
+            'missing/*.csv',
+        ],
+    )
+    def test_matches_path_glob(self, tree: Path, pattern):
+        index = GlobIndex()
+
+        expected = list(tree.glob(pattern))
+        assert list(index.glob(tree, pattern)) == expected
+        # cached expansion
+        assert list(index.glob(tree, pattern)) == expected
+
+    def test_reuse_expansion(self, tree: Path, monkeypatch):
+        index = GlobIndex()
+        scandir = CountingScandir(monkeypatch)
+
+        first = list(index.glob(tree, '**/*.csv'))
+        assert scandir.calls == 6
+        assert list(index.glob(tree, '**/*.csv')) == first
+        assert scandir.calls == 6
+
+        # directory listings are shared by patterns
+        assert list(index.glob(tree, '**/*.txt')) == [tree / 'a/b/c/w.txt']
+        assert scandir.calls == 6
+
+    def test_invalidate_on_changed_directory(self, tree: Path):
+        index = GlobIndex()
+        assert len(list(index.glob(tree, '**/*.csv'))) == 4
+
+        (tree / 'a/b/c/new.csv').write_text('A\n2\n')
+        backdate(tree / 'a/b/c', 5.0)
+        assert tree / 'a/b/c/new.csv' in list(index.glob(tree, '**/*.csv'))
+
+        (tree / 'x.csv').unlink()
+        assert tree / 'x.csv' not in list(index.glob(tree, '**/*.csv'))
+
+    def test_do_not_cache_racy_directories(self, tree: Path, monkeypatch):
+        index = GlobIndex()
+        (tree / 'a/u.csv').write_text('A\n3\n')
+
+        assert tree / 'a/u.csv' in list(index.glob(tree, 'a/*.csv'))
+        assert index._entries == {}
+
+    def test_expand_lazily(self, tree: Path):
+        index = GlobIndex()
+        matches = index.glob(tree, '**/*.csv')
+
+        assert next(matches) == tree / 'x.csv'
+        assert index._entries == {}
+        list(matches)
+        assert len(index._entries) == 1
+
+    def test_persisted_index(self, tree: Path, tmp_path_factory, monkeypatch):
+        directory = tmp_path_factory.mktemp('index')
+        expected = list(GlobIndex(directory).glob(tree, '**/*.csv'))
+        assert len(list(directory.glob('*.json'))) == 1
+
+        # new (empty) in-memory cache reusing the index file
+        scandir = CountingScandir(monkeypatch)
+        assert list(GlobIndex(directory).glob(tree, '**/*.csv')) == expected
+        assert scandir.calls == 0
@@ -0,0 +1,97 @@
+from pathlib import Path
+
+from rdmlibpy.planning import WorkflowPlan
+from rdmlibpy.workflow import Workflow
+from rdmlibpy.xarrays import XArrayFileCache
+
+
+class TestWorkflowPlan:
+    @staticmethod
+    def create_workflow(source: Path, cache: Path):
+        return Workflow.create(
+            [
+                ('dataframe.read.csv@v1', dict(source=str(source))),
+                ('dataframe.setindex@v1', dict(index_var='x')),
+                'dataframe.to_xarray@v1',
+                (XArrayFileCache(), dict(filename=str(cache))),
+            ]
+        )
+
+    @staticmethod
+    def create_source(tmp_path: Path):
+        source = tmp_path / 'data'
+        source.mkdir()
+        (source / 'a.csv').write_text('x,A\n1,2\n3,4\n')
+        (source / 'b.csv').write_text('x,A\n5,6\n')
+        return source / '*.csv'
+
+    def test_plan_without_running(self, tmp_path: Path):
+        source = self.create_source(tmp_path)
+        workflow = self.create_workflow(source, tmp_path / 'cache.nc')
+
+        plan = workflow.plan()
+
+        assert isinstance(plan, WorkflowPlan)
+        assert [node.runner for node in plan.nodes] == [
+            'xarray.cache@v1',
+            'dataframe.to_xarray@v1',
+            'dataframe.setindex@v1',
+            'dataframe.read.csv@v1',
+        ]
+        assert all(node.registered for node in plan.nodes)
+        assert not (tmp_path / 'cache.nc').exists()
+
+        cache, *_, loader = plan.nodes
+        assert cache.cache_valid is False
+        assert not any(node.skipped for node in plan.nodes)
+        assert sorted(Path(file).name for file in loader.files) == ['a.csv', 'b.csv']
+        assert loader.file_bytes == 20
+        assert cache.input_bytes == 20
+        assert plan.total_bytes == 20
+        assert plan.ranking()[0].input_bytes == 20
+
+    def test_plan_with_valid_cache(self, tmp_path: Path):
+        source = self.create_source(tmp_path)
+        workflow = self.create_workflow(source, tmp_path / 'cache.nc')
+        workflow.run()
+
+        plan = workflow.plan()
+
+        cache, *upstream = plan.nodes
+        assert cache.cache_valid is True
+        assert not cache.skipped
+        assert all(node.skipped for node in upstream)
+        assert plan.total_bytes == 0
+        assert plan.ranking() == [cache]
+
+    def test_plan_with_result_cache(self, tmp_path: Path):
+        source = self.create_source(tmp_path)
+        workflow = Workflow.create(
+            [
+                ('dataframe.read.csv@v1', dict(source=str(source))),
+                ('dataframe.setindex@v1', dict(index_var='x')),
+            ]
+        )
+        workflow.run(result_cache=tmp_path / 'results')
+
+        plan = workflow.plan(result_cache=tmp_path / 'results')
+        assert [node.result_cached for node in plan.nodes] == [True, True]
+        assert [node.skipped for node in plan.nodes] == [False, True]
+
+        # modified input files invalidate all results
+        (tmp_path / 'data' / 'c.csv').write_text('x,A\n7,8\n')
+        plan = workflow.plan(result_cache=tmp_path / 'results')
+        assert [node.result_cached for node in plan.nodes] == [False, False]
+
+    def test_estimate_cost_from_profile(self, tmp_path: Path):
+        source = self.create_source(tmp_path)
+        workflow = self.create_workflow(source, tmp_path / 'cache.nc')
+        _, report = workflow.run(profile=True)
+        (tmp_path / 'cache.nc').unlink()
+
+        plan = workflow.plan(profile=report)
+
+        assert all(node.estimated_time is not None for node in plan.nodes)
+        times = [node.estimated_time for node in plan.ranking()]
+        assert times == sorted(times, reverse=True)
+        assert 'nodes skipped' in str(plan)
@@ -1,7 +1,7 @@
 from pathlib import Path
 from typing import Any, ClassVar
 
-from rdmlibpy.base import ProcessBase, ProcessNode
+from rdmlibpy.base import ProcessBase, ProcessNode, RunnableProcessParam
 from rdmlibpy.process import Cache, Loader, Writer, DelegatedSource
 
 
@@ -208,3 +208,49 @@ class TestCache:
         # 3rd run
         assert workflow.run(3) == 1
         assert MyCache.cached == 1
+
+    def test_resolve_parameters_once(self):
+        class CountingSource(ProcessBase):
+            name: str = 'counting_source'
+            version: str = '1'
+            calls: ClassVar[int] = 0
+
+            def run(self, value: Any = None) -> Any:
+                CountingSource.calls += 1
+                return value
+
+        class MyCache(Cache):
+            name: str = 'my_cache'
+            version: str = '1'
+            cached: ClassVar[None | Any] = None
+
+            def cache_is_valid(self, key: str, **kwargs):
+                return (MyCache.cached is not None) and (MyCache.cached[0] == key)
+
+            def write(self, source: int, key: str, extra: Any = None):
+                MyCache.cached = (key, source, extra)
+
+            def read(self, key: str, **kwargs):
+                return MyCache.cached[1]  # type: ignore
+
+        def counting_node(value: Any):
+            return ProcessNode(runner=CountingSource(), params={'value': value})
+
+        workflow = ProcessNode(
+            parent=counting_node(1),
+            runner=MyCache(),
+            params={
+                'key': RunnableProcessParam(node=counting_node('a')),
+                'extra': RunnableProcessParam(node=counting_node('x')),
+            },
+        )
+
+        # 1st run: all nodes are evaluated exactly once
+        assert workflow.run() == 1
+        assert CountingSource.calls == 3
+        assert MyCache.cached == ('a', 1, 'x')
+
+        # 2nd run: only the parameter required by `cache_is_valid`
+        CountingSource.calls = 0
+        assert workflow.run() == 1
+        assert CountingSource.calls == 1
@@ -0,0 +1,160 @@
+import json
+import time
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from rdmlibpy.base import (
+    PlainProcessParam,
+    ProcessBase,
+    ProcessNode,
+    RunnableProcessParam,
+)
+from rdmlibpy.dataframes import DataFrameFileCache
+from rdmlibpy.process import DelegatedSource
+from rdmlibpy.profiling import ProfileReport
+from rdmlibpy.registry import register
+from rdmlibpy.workflow import Workflow
+
+
+class SleepingSource(ProcessBase):
+    name: str = 'test.profiling.sleeping.source'
+    version: str = '1'
+
+    def run(self, delay: float = 0.0):
+        time.sleep(delay)
+        return pd.DataFrame(dict(A=[1, 2, 3], B=[4, 5, 6]))
+
+
+class Failing(ProcessBase):
+    name: str = 'test.profiling.failing'
+    version: str = '1'
+
+    def run(self, source: Any):
+        raise RuntimeError('failed')
+
+
+class Identity(ProcessBase):
+    name: str = 'test.profiling.identity'
+    version: str = '1'
+
+    def run(self, source: Any):
+        return source
+
+
+class Concat(ProcessBase):
+    name: str = 'test.profiling.concat'
+    version: str = '1'
+
+    def run(self, source: pd.DataFrame, other: pd.DataFrame):
+        return pd.concat([source, other])
+
+
+register(SleepingSource())
+register(Concat())
+register(Identity())
+
+
+def create_workflow(delay: float = 0.05):
+    return Workflow.create(
+        [(SleepingSource(), dict(delay=delay)), Identity()], share_nodes=False
+    )
+
+
+class TestProfiling:
+    def test_profile_nodes(self):
+        result, report = create_workflow().run(profile=True)
+
+        assert isinstance(result, pd.DataFrame)
+        assert isinstance(report, ProfileReport)
+        assert [node.runner for node in report.nodes] == [
+            'test.profiling.identity@v1',
+            'test.profiling.sleeping.source@v1',
+        ]
+
+        identity, source = report.nodes
+        # the wall time of a node includes its inputs, the self time does not
+        assert identity.wall_time >= 0.05
+        assert identity.self_time < 0.05
+        assert source.self_time >= 0.05
+        # sleeping does not consume CPU time
+        assert source.cpu_time < 0.05
+
+        assert source.output_type == 'DataFrame'
+        assert source.output_shape == [3, 2]
+        assert source.output_rows == 3
+        assert source.cache is None
+        assert report.ranking()[0] is source
+
+    def test_run_without_profile(self):
+        result = create_workflow().run()
+        assert isinstance(result, pd.DataFrame)
+
+    def test_profile_failing_node(self):
+        workflow = Workflow.create([SleepingSource(), Failing()])
+        with pytest.raises(RuntimeError):
+            workflow.run(profile=True)
+
+    def test_cache_hit_and_miss(self, tmp_path):
+        df = pd.DataFrame(dict(A=[1.0, 2.0]))
+        workflow = Workflow(
+            ProcessNode(
+                parent=ProcessNode(runner=DelegatedSource(delegate=lambda: df)),
+                runner=DataFrameFileCache(),
+                params={'filename': PlainProcessParam(value=tmp_path / 'cache.h5')},
+            )
+        )
+
+        _, report = workflow.run(profile=True)
+        assert [node.cache for node in report.nodes] == ['miss', None]
+
+        _, report = workflow.run(profile=True)
+        assert [node.cache for node in report.nodes] == ['hit']
+
+    def test_result_cache_hit_and_miss(self, tmp_path):
+        workflow = create_workflow(delay=0.0)
+
+        _, report = workflow.run(result_cache=tmp_path, profile=True)
+        assert [node.cache for node in report.nodes] == ['miss', 'miss']
+
+        _, report = workflow.run(result_cache=tmp_path, profile=True)
+        assert [node.cache for node in report.nodes] == ['hit']
+
+    def test_collect_profiles_of_worker_processes(self):
+        def source(delay: float):
+            return ProcessNode(runner=SleepingSource(), params={'delay': delay})
+
+        workflow = Workflow(
+            ProcessNode(
+                runner=Concat(),
+                parent=source(0.0),
+                params={'other': RunnableProcessParam(node=source(0.01))},
+            )
+        )
+
+        _, report = workflow.run(
+            executor='processes', max_workers=2, remote_policy='all', profile=True
+        )
+        assert len(report.nodes) == 3
+        assert len({node.pid for node in report.nodes}) > 1
+
+    def test_export_json(self, tmp_path):
+        _, report = create_workflow(delay=0.0).run(profile=True)
+
+        text = report.to_json(tmp_path / 'profile.json')
+        assert (tmp_path / 'profile.json').read_text() == text
+        assert ProfileReport.model_validate_json(text) == report
+
+    def test_export_chrome_trace(self, tmp_path):
+        _, report = create_workflow(delay=0.0).run(profile=True)
+
+        trace = report.to_chrome_trace(tmp_path / 'trace.json')
+        assert json.loads((tmp_path / 'trace.json').read_text()) == trace
+
+        events = trace['traceEvents']
+        assert len(events) == 2
+        assert all(event['ph'] == 'X' for event in events)
+        assert min(event['ts'] for event in events) == 0
+        assert events[0]['name'] == 'test.profiling.identity@v1'
+        assert events[0]['args']['output_rows'] == 3
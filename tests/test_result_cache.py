@@ -0,0 +1,159 @@
+import os
+from pathlib import Path
+from typing import Any, ClassVar, Dict
+
+from rdmlibpy.base import ProcessBase, ProcessNode
+from rdmlibpy.process import Loader, Transform
+from rdmlibpy.result_cache import ResultCache
+from rdmlibpy.workflow import Workflow
+
+
+class CountingLoader(Loader):
+    name: str = 'test.counting.loader'
+    version: str = '1'
+    calls: ClassVar[int] = 0
+
+    def run(self, source: str | os.PathLike):
+        CountingLoader.calls += 1
+        return [Path(filename).read_text() for filename in Loader.glob(source)]
+
+
+class CountingScale(Transform):
+    name: str = 'test.counting.scale'
+    version: str = '1'
+    calls: ClassVar[Dict[Any, int]] = {}
+
+    def run(self, source, factor: int = 1):
+        CountingScale.calls[factor] = CountingScale.calls.get(factor, 0) + 1
+        return [item * factor for item in source]
+
+
+class Unstable(ProcessBase):
+    name: str = 'test.unstable'
+    version: str = '1'
+    calls: ClassVar[int] = 0
+
+    def run(self, source, value: Any = None):
+        Unstable.calls += 1
+        return source
+
+
+def create_workflow(source: Path, factors=(1,)):
+    node = ProcessNode(runner=CountingLoader(), params={'source': source})
+    for factor in factors:
+        node = ProcessNode(
+            runner=CountingScale(), parent=node, params={'factor': factor}
+        )
+    return Workflow(node)
+
+
+def reset_counters():
+    CountingLoader.calls = 0
+    CountingScale.calls = {}
+    Unstable.calls = 0
+
+
+class TestResultCache:
+    def test_put_and_get(self, tmp_path: Path):
+        cache = ResultCache(tmp_path)
+
+        assert cache.get('key') == (False, None)
+        assert cache.put('key', [1, 2, 3])
+        assert 'key' in cache
+        assert cache.get('key') == (True, [1, 2, 3])
+
+    def test_values_which_cannot_be_pickled(self, tmp_path: Path):
+        cache = ResultCache(tmp_path)
+
+        assert not cache.put('key', lambda: None)
+        assert 'key' not in cache
+
+    def test_evict_least_recently_used(self, tmp_path: Path):
+        cache = ResultCache(tmp_path, max_size=2500)
+        cache.put('a', b'a' * 1000)
+        cache.put('b', b'b' * 1000)
+        os.utime(cache._filename('a'), ns=(1, 1))
+        os.utime(cache._filename('b'), ns=(2, 2))
+
+        # loading an entry marks it as recently used
+        cache.get('a')
+        cache.put('c', b'c' * 1000)
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+
+    def test_clear(self, tmp_path: Path):
+        cache = ResultCache(tmp_path)
+        cache.put('a', 1)
+        cache.clear()
+        assert 'a' not in cache
+
+
+class TestWorkflowWithResultCache:
+    def test_skip_cached_nodes(self, tmp_path: Path):
+        source = tmp_path / 'data.txt'
+        source.write_text('x')
+        workflow = create_workflow(source, factors=[2, 3])
+
+        reset_counters()
+        assert workflow.run(result_cache=tmp_path / 'cache') == ['xxxxxx']
+        assert workflow.run(result_cache=tmp_path / 'cache') == ['xxxxxx']
+        assert CountingLoader.calls == 1
+        assert CountingScale.calls == {2: 1, 3: 1}
+
+    def test_recompute_changed_suffix(self, tmp_path: Path):
+        source = tmp_path / 'data.txt'
+        source.write_text('x')
+        cache = ResultCache(tmp_path / 'cache')
+
+        reset_counters()
+        create_workflow(source, factors=[2, 3]).run(result_cache=cache)
+        result = create_workflow(source, factors=[2, 4]).run(result_cache=cache)
+
+        assert result == ['xxxxxxxx']
+        assert CountingLoader.calls == 1
+        assert CountingScale.calls == {2: 1, 3: 1, 4: 1}
+
+    def test_invalidate_modified_files(self, tmp_path: Path):
+        source = tmp_path / 'data.txt'
+        source.write_text('x')
+        workflow = create_workflow(source, factors=[2])
+        cache = ResultCache(tmp_path / 'cache')
+
+        reset_counters()
+        workflow.run(result_cache=cache)
+        source.write_text('yy')
+        os.utime(source, ns=(1, 1))
+
+        assert workflow.run(result_cache=cache) == ['yyyy']
+        assert CountingLoader.calls == 2
+
+    def test_touched_files_with_hashes(self, tmp_path: Path):
+        source = tmp_path / 'data.txt'
+        source.write_text('x')
+        workflow = create_workflow(source, factors=[2])
+        cache = ResultCache(tmp_path / 'cache', hash_files=True)
+
+        reset_counters()
+        workflow.run(result_cache=cache)
+        os.utime(source, ns=(1, 1))
+
+        assert workflow.run(result_cache=cache) == ['xx']
+        assert CountingLoader.calls == 1
+
+    def test_unstable_parameters_are_not_cached(self, tmp_path: Path):
+        # objects without a stable representation (e.g. functions)
+        workflow = Workflow(
+            ProcessNode(
+                runner=Unstable(),
+                parent=ProcessNode(runner=CountingScale()),
+                params={'value': lambda: None},
+            )
+        )
+
+        reset_counters()
+        workflow.run(result_cache=tmp_path, source=[1])
+        workflow.run(result_cache=tmp_path, source=[1])
+        assert Unstable.calls == 2
+        assert CountingScale.calls == {1: 1}
@@ -0,0 +1,255 @@
+import collections
+from pathlib import Path
+
+import pandas as pd
+import pandas._testing as tm
+import pytest
+
+from rdmlibpy import Workflow
+from rdmlibpy.dataframes import (
+    DataFrameReadCSV,
+    DataFrameTimeOffset,
+    DataFrameWriteCSV,
+)
+from rdmlibpy.dataframes import dataframes_io
+from rdmlibpy.dataframes.dataframes_io import DataFrameReadCSVBase
+from rdmlibpy.loaders import ChannelEurothermLoggerLoader, ChannelTCLoggerLoader
+from rdmlibpy.timespan import Timespan
+
+FILES = [
+    Path(name)
+    for name in [
+        '20240118T084901.txt',
+        '20240118T085901.txt',
+        '20240118T090901.txt',
+        '20240118T091901.txt',
+        'unknown.txt',
+    ]
+]
+
+
+class TestTimespan:
+    @pytest.mark.parametrize(
+        'start, stop, expected',
+        [
+            ('2024-01-18T09:00', '2024-01-18T09:05', [1, 4]),
+            # (files starting within the margin of the window are kept)
+            ('2024-01-18T08:59:01', '2024-01-18T09:09:01', [0, 1, 2, 4]),
+            ('2024-01-18T08:59:02', '2024-01-18T09:08:59', [1, 4]),
+            ('2024-01-18T09:30', None, [3, 4]),
+            (None, '2024-01-18T08:50', [0, 4]),
+            ('2024-01-17', '2024-01-18T08:00', [4]),
+            (None, None, [0, 1, 2, 3, 4]),
+        ],
+    )
+    def test_select_files_by_name(self, start, stop, expected):
+        timespan = Timespan.create('timestamp', start, stop)
+
+        selected = timespan.select_files(FILES, '%Y%m%dT%H%M%S')
+
+        assert selected == [FILES[index] for index in expected]
+
+    def test_keep_files_with_truncated_names(self):
+        # the data of the first file ends after the (truncated) start of the
+        # second file
+        timespan = Timespan.create('timestamp', '2024-01-18T08:59:01.2', None)
+
+        selected = timespan.select_files(FILES[:2], '%Y%m%dT%H%M%S')
+
+        assert selected == FILES[:2]
+        assert timespan.select_files(FILES[:2], '%Y%m%dT%H%M%S', margin=0) == [FILES[1]]
+
+    def test_select_files_by_range(self):
+        timespan = Timespan.create('timestamp', '2024-01-18T09:00', '2024-01-18T09:05')
+        ranges = {FILES[4]: ('2024-01-19', '2024-01-20')}
+
+        assert timespan.select_files(FILES, None, ranges) == FILES[:4]
+
+    def test_shift_and_union(self):
+        timespan = Timespan.create('t', '2024-01-18T09:00', '2024-01-18T11:00')
+
+        shifted = timespan.shifted(-pd.Timedelta('30min'))
+        assert shifted == Timespan(
+            column='t', start='2024-01-18T08:30:00', stop='2024-01-18T10:30:00'
+        )
+
+        other = Timespan.create('t', '2024-01-18T08:00', None)
+        assert shifted.union(other) == Timespan(column='t', start='2024-01-18T08:00:00')
+        assert shifted.union(Timespan(column='x')) is None
+
+
+class TestTimespanPushDown:
+    @staticmethod
+    def create_workflow(data_path: Path, *steps, push_down: bool = True):
+        return Workflow.create(
+            [
+                (
+                    ChannelEurothermLoggerLoader(),
+                    dict(source=str(data_path / 'eurotherm/*.txt')),
+                ),
+                *steps,
+                (
+                    'dataframe.select.timespan@v1',
+                    dict(
+                        column='timestamp',
+                        start='2024-01-18T09:00',
+                        stop='2024-01-18T09:05',
+                    ),
+                ),
+            ],
+            push_down=push_down,
+        )
+
+    @staticmethod
+    def count_files(monkeypatch):
+        files = []
+        read_csv = DataFrameReadCSVBase._read_csv
+
+        def counting_read_csv(self, source, **kwargs):
+            files.append(source)
+            return read_csv(self, source, **kwargs)
+
+        monkeypatch.setattr(DataFrameReadCSVBase, '_read_csv', counting_read_csv)
+        return files
+
+    def test_skip_files_outside_of_window(self, data_path: Path, monkeypatch):
+        # a cold run (without ranges recorded by previous reads)
+        monkeypatch.setattr(
+            DataFrameReadCSVBase, '_time_ranges', collections.OrderedDict()
+        )
+        workflow = self.create_workflow(
+            data_path, ('dataframe.units@v1', dict(units=dict(temperature='degC')))
+        )
+        loader = workflow.process.parent.parent
+        assert loader.params['timespan'].get_value() == dict(
+            column='timestamp', start='2024-01-18T09:00:00', stop='2024-01-18T09:05:00'
+        )
+
+        files = self.count_files(monkeypatch)
+        df = workflow.run()
+        assert sorted(path.name for path in files) == ['20240118T085901.txt']
+
+        expected = self.create_workflow(
+            data_path,
+            ('dataframe.units@v1', dict(units=dict(temperature='degC'))),
+            push_down=False,
+        ).run()
+        assert len(df) > 0
+        tm.assert_frame_equal(
+            df.sort_values('timestamp'), expected.sort_values('timestamp')
+        )
+
+    def test_skip_files_of_tclogger_on_cold_run(self, data_path: Path, monkeypatch):
+        monkeypatch.setattr(
+            DataFrameReadCSVBase, '_time_ranges', collections.OrderedDict()
+        )
+        workflow = Workflow.create(
+            [
+                (
+                    ChannelTCLoggerLoader(),
+                    dict(source=str(data_path / 'ChannelV2TCLog/*.csv')),
+                ),
+                (
+                    'dataframe.select.timespan@v1',
+                    dict(column='timestamp', start='2024-01-16T11:26:55', stop=None),
+                ),
+            ],
+            push_down=True,
+        )
+
+        files = self.count_files(monkeypatch)
+        df = workflow.run()
+
+        assert [path.name for path in files] == ['2024-01-16T11-26-54.csv']
+        assert len(df) > 0
+        assert df['timestamp'].min() >= pd.Timestamp('2024-01-16T11:26:55')
+
+    def test_push_down_time_offset(self, data_path: Path):
+        workflow = self.create_workflow(
+            data_path,
+            ('dataframe.timeoffset@v1', dict(offset='-10 min', column='timestamp')),
+        )
+
+        loader = workflow.process.parent.parent
+        assert loader.params['timespan'].get_value() == dict(
+            column='timestamp', start='2024-01-18T09:10:00', stop='2024-01-18T09:15:00'
+        )
+        df = workflow.run()
+        assert df['timestamp'].min() >= pd.Timestamp('2024-01-18T09:00')
+        assert len(df) > 0
+
+    def test_report_failing_push_down(self, data_path: Path, monkeypatch):
+        def fail(self, timespan, **params):
+            raise KeyError('offset')
+
+        monkeypatch.setattr(DataFrameTimeOffset, 'push_down_timespan', fail)
+
+        with pytest.raises(ValueError, match='dataframe.timeoffset'):
+            self.create_workflow(
+                data_path,
+                ('dataframe.timeoffset@v1', dict(offset='-10 min', column='timestamp')),
+            )
+
+    def test_do_not_push_down_across_writers(self, data_path: Path, tmp_path: Path):
+        workflow = self.create_workflow(
+            data_path, (DataFrameWriteCSV(), dict(filename=tmp_path / 'all.csv'))
+        )
+
+        loader = workflow.process.parent.parent
+        assert 'timespan' not in loader.params
+
+    def test_skip_files_by_recorded_ranges(self, tmp_path: Path, monkeypatch):
+        for day in [1, 2, 3]:
+            (tmp_path / f'data-{day}.csv').write_text(
+                f't,A\n2024-01-0{day}T12:00:00,{day}\n2024-01-0{day}T13:00:00,{day}\n'
+            )
+        workflow = Workflow.create(
+            [
+                (
+                    DataFrameReadCSV(parse_dates=['t']),
+                    dict(source=str(tmp_path / '*.csv')),
+                ),
+                (
+                    'dataframe.select.timespan@v1',
+                    dict(column='t', start='2024-01-02', stop='2024-01-02T23:00'),
+                ),
+            ],
+            push_down=True,
+        )
+        assert list(workflow.run()['A']) == [2, 2]
+
+        # ranges of files are known after the first run
+        files = self.count_files(monkeypatch)
+        assert list(workflow.run()['A']) == [2, 2]
+        assert [path.name for path in files] == ['data-2.csv']
+
+    def test_recorded_ranges_depend_on_configuration(self, tmp_path: Path):
+        (tmp_path / 'data.csv').write_text('t,A\n01/02/2024 12:00,1\n')
+        timespan = Timespan.create('t', '2024-02-01', '2024-02-02')
+        day_first = DataFrameReadCSV(parse_dates=['t'], date_format='%d/%m/%Y %H:%M')
+        month_first = day_first.updated(date_format='%m/%d/%Y %H:%M')
+
+        df = day_first.run(tmp_path / 'data.csv', timespan=timespan.model_dump())
+        assert df['t'].iloc[0] == pd.Timestamp('2024-02-01T12:00')
+
+        # ranges recorded with another date format are not used
+        path = tmp_path / 'data.csv'
+        assert month_first._time_range_key(path, 't') not in month_first._time_ranges
+        assert day_first._time_range_key(path, 't') in day_first._time_ranges
+
+    def test_bound_recorded_ranges(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(dataframes_io, 'MAX_TIME_RANGES', 2)
+        monkeypatch.setattr(
+            DataFrameReadCSVBase, '_time_ranges', collections.OrderedDict()
+        )
+        loader = DataFrameReadCSV(parse_dates=['t'])
+        timespan = Timespan.create('t', '2024-01-01', '2024-01-31')
+        for day in [1, 2, 3]:
+            (tmp_path / f'data-{day}.csv').write_text(f't,A\n2024-01-0{day},{day}\n')
+            loader.run(tmp_path / f'data-{day}.csv', timespan=timespan.model_dump())
+
+        keys = list(DataFrameReadCSVBase._time_ranges)
+        assert [key[1] for key in keys] == [
+            str(tmp_path / 'data-2.csv'),
+            str(tmp_path / 'data-3.csv'),
+        ]
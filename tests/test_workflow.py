@@ -1,4 +1,7 @@
+from typing import Any, ClassVar, List
+
 import pandas as pd
+import pytest
 
 from rdmlibpy import Workflow, base, loaders, run
 
@@ -301,6 +304,96 @@ class TestWorkflow:
         assert len(df) == 16
         assert len(df.columns) == 7
 
+    def test_workflow_with_process_params_in_threads(self, data_path):
+        descriptor = [
+            {
+                'run': 'mks.ftir@v1',
+                'params': {
+                    'source': str(data_path / 'mks_ftir/2024-01-16-conc.prn'),
+                },
+            },
+            {
+                'run': 'dataframe.setindex@v1',
+                'params': {
+                    'index_var': 'timestamp',
+                },
+            },
+            {
+                'run': 'dataframe.join@v1',
+                'params': {
+                    'interpolate': True,
+                    'how': 'left',
+                    '$right': [
+                        {
+                            'run': 'channel.tclogger@v1',
+                            'params': {
+                                'source': str(
+                                    data_path / 'ChannelV2TCLog/2024-01-16T10-05-21.csv'
+                                ),
+                            },
+                        },
+                        {
+                            'run': 'dataframe.setindex@v1',
+                            'params': {
+                                'index_var': 'timestamp',
+                            },
+                        },
+                    ],
+                },
+            },
+        ]
+
+        workflow = Workflow.create(descriptor)
+        expected = workflow.run()
+        df = workflow.run(executor='threads', max_workers=4)
+        pd.testing.assert_frame_equal(df, expected)
+
+        # run branches in worker processes
+        df = workflow.run(executor='processes', max_workers=2, remote_policy='all')
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_convert_workflow_to_descriptor(self, data_path):
+        workflow = Workflow.create(
+            [
+                {
+                    'run': 'mks.ftir@v1',
+                    'params': {
+                        'source': str(data_path / 'mks_ftir/2024-01-16-conc.prn'),
+                    },
+                },
+                {
+                    'run': 'dataframe.join@v1',
+                    'params': {
+                        'how': 'left',
+                        '$right': {
+                            'run': 'channel.tclogger@v1',
+                            'config': {'separator': ';'},
+                            'params': {'source': 'dummy.csv'},
+                        },
+                    },
+                },
+            ]
+        )
+
+        descriptor = Workflow.to_descriptor(workflow.process)
+        assert [item['run'] for item in descriptor] == [
+            'mks.ftir@v1',
+            'dataframe.join@v1',
+        ]
+        assert descriptor[0]['params'] == {
+            'source': str(data_path / 'mks_ftir/2024-01-16-conc.prn')
+        }
+        assert descriptor[1]['params']['how'] == 'left'
+        assert descriptor[1]['params']['$right'][0]['run'] == 'channel.tclogger@v1'
+
+        # re-create the workflow from the descriptor
+        recreated = Workflow.create(descriptor)
+        assert recreated.process.fingerprint() == workflow.process.fingerprint()
+
+    def test_convert_unregistered_runner_to_descriptor(self):
+        with pytest.raises(ValueError):
+            Workflow.to_descriptor(Workflow.create(CountingSource()).process)
+
     def test_create_with_single_process_instance(self, data_path):
         # create workflow
         workflow = Workflow.create(loaders.MksFTIRLoader())
@@ -431,3 +524,166 @@ class TestWorkflow:
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 5
         assert len(df.columns) == 7
+
+
+class CountingSource(base.ProcessBase):
+    name: str = 'test.counting.source'
+    version: str = '1'
+    calls: ClassVar[int] = 0
+
+    def run(self, value: Any = None):
+        CountingSource.calls += 1
+        return [value]
+
+
+class Combine(base.ProcessBase):
+    name: str = 'test.combine'
+    version: str = '1'
+
+    def run(self, left: List[Any], right: List[Any]):
+        left.append('left')
+        right.append('right')
+        return left + right
+
+
+class TestSharedNodes:
+    def test_share_identical_subprocesses(self):
+        workflow = Workflow.create(
+            (
+                Combine(),
+                {
+                    '$left': (CountingSource(), dict(value=1)),
+                    '$right': (CountingSource(), dict(value=1)),
+                },
+            )
+        )
+
+        left = workflow.process.params['left']
+        right = workflow.process.params['right']
+        assert isinstance(left, base.RunnableProcessParam)
+        assert isinstance(right, base.RunnableProcessParam)
+        assert left.node is right.node
+
+    def test_do_not_share_different_subprocesses(self):
+        workflow = Workflow.create(
+            (
+                Combine(),
+                {
+                    '$left': (CountingSource(), dict(value=1)),
+                    '$right': (CountingSource(), dict(value=2)),
+                },
+            )
+        )
+
+        left = workflow.process.params['left']
+        right = workflow.process.params['right']
+        assert isinstance(left, base.RunnableProcessParam)
+        assert isinstance(right, base.RunnableProcessParam)
+        assert left.node is not right.node
+
+    def test_share_parent_and_executable_parameter(self):
+        workflow = Workflow.create(
+            [
+                (CountingSource(), dict(value=1)),
+                (Combine(), {'$right': (CountingSource(), dict(value=1))}),
+            ]
+        )
+
+        right = workflow.process.params['right']
+        assert isinstance(right, base.RunnableProcessParam)
+        assert workflow.process.parent is right.node
+
+    def test_shared_node_runs_once(self):
+        workflow = Workflow.create(
+            (
+                Combine(),
+                {
+                    '$left': (CountingSource(), dict(value=1)),
+                    '$right': (CountingSource(), dict(value=1)),
+                },
+            )
+        )
+
+        CountingSource.calls = 0
+        assert workflow.run() == [1, 'left', 1, 'right']
+        assert CountingSource.calls == 1
+
+        # the node is executed again in the next run
+        assert workflow.run() == [1, 'left', 1, 'right']
+        assert CountingSource.calls == 2
+
+    def test_without_sharing_nodes(self):
+        workflow = Workflow.create(
+            (
+                Combine(),
+                {
+                    '$left': (CountingSource(), dict(value=1)),
+                    '$right': (CountingSource(), dict(value=1)),
+                },
+            ),
+            share_nodes=False,
+        )
+
+        left = workflow.process.params['left']
+        right = workflow.process.params['right']
+        assert isinstance(left, base.RunnableProcessParam)
+        assert isinstance(right, base.RunnableProcessParam)
+        assert left.node is not right.node
+
+        # results are still shared at runtime (content-addressed)
+        CountingSource.calls = 0
+        assert workflow.run() == [1, 'left', 1, 'right']
+        assert CountingSource.calls == 1
+
+    def test_share_loader_in_yaml_style_workflow(self, data_path):
+        source = {
+            'run': 'channel.tclogger@v1',
+            'params': {
+                'source': str(data_path / 'ChannelV2TCLog/2024-01-16T10-05-21.csv'),
+            },
+        }
+        workflow = Workflow.create(
+            {
+                'run': 'dataframe.join@v1',
+                'params': {
+                    'how': 'inner',
+                    '$left': [
+                        source,
+                        {
+                            'run': 'dataframe.select.columns@v1',
+                            'params': {'select': {'timestamp': 'timestamp'}},
+                        },
+                        {
+                            'run': 'dataframe.setindex@v1',
+                            'params': {'index_var': 'timestamp'},
+                        },
+                    ],
+                    '$right': [
+                        source,
+                        {
+                            'run': 'dataframe.select.columns@v1',
+                            'params': {
+                                'select': {
+                                    'timestamp': 'timestamp',
+                                    'sample-downstream': 'temperature',
+                                }
+                            },
+                        },
+                        {
+                            'run': 'dataframe.setindex@v1',
+                            'params': {'index_var': 'timestamp'},
+                        },
+                    ],
+                },
+            }
+        )
+
+        left = workflow.process.params['left']
+        right = workflow.process.params['right']
+        assert isinstance(left, base.RunnableProcessParam)
+        assert isinstance(right, base.RunnableProcessParam)
+        assert left.node.parent.parent is right.node.parent.parent  # type: ignore
+
+        df = workflow.run()
+        assert isinstance(df, pd.DataFrame)
+        assert list(df.columns) == ['temperature']
@@ -541,6 +541,57 @@ class TestXArrayFileCache:
         # assert content
         assert source.attrs == cached.attrs
 
+    def test_rebuild_cache_without_manifest(self, tmp_path):
+        source = tmp_path / 'data.csv'
+        source.write_text('x,A\n1,5\n3,6\n')
+        path = tmp_path / 'cache.nc'
+        workflow = rdm.Workflow.create(
+            [
+                ('dataframe.read.csv@v1', dict(source=str(source))),
+                ('dataframe.setindex@v1', dict(index_var='x')),
+                'dataframe.to_xarray@v1',
+                (XArrayFileCache(), dict(filename=str(path))),
+            ]
+        )
+
+        # cache written without a manifest (e.g. by a previous version)
+        outdated = xr.Dataset(dict(A=('x', [2, 4])), coords=dict(x=[1, 3]))
+        XArrayFileCache().write(outdated, filename=path)
+
+        assert list(workflow.run()['A'].values) == [5, 6]
+        mtime = path.stat().st_mtime_ns
+        assert list(workflow.run()['A'].values) == [5, 6]
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_invalidate_cache_if_source_file_changes(self, tmp_path):
+        source = tmp_path / 'data.csv'
+        source.write_text('x,A\n1,2\n3,4\n')
+        path = tmp_path / 'cache.nc'
+
+        workflow = rdm.Workflow.create(
+            [
+                ('dataframe.read.csv@v1', dict(source=str(source))),
+                ('dataframe.setindex@v1', dict(index_var='x')),
+                'dataframe.to_xarray@v1',
+                (XArrayFileCache(), dict(filename=str(path))),
+            ]
+        )
+
+        # create cache
+        workflow.run()
+        mtime = path.stat().st_mtime_ns
+
+        # unchanged source -> load from cache
+        cached = workflow.run()
+        assert list(cached['A'].values) == [2, 4]
+        assert 'rdmlibpy:manifest' not in cached.attrs
+        assert path.stat().st_mtime_ns == mtime
+
+        # modified source -> rebuild cache
+        source.write_text('x,A\n1,5\n3,6\n5,7\n')
+        assert list(workflow.run()['A'].values) == [5, 6, 7]
+        assert list(workflow.run()['A'].values) == [5, 6, 7]
+
     class TestDataArray:
         def test_cache_data_array(self, tmp_path):
             path = tmp_path / 'cache.h5'
@@ -14,6 +14,8 @@ from rdmlibpy.xarrays.xarray_transforms import XArrayAssign
 from rdmlibpy.xarrays.xarray_transforms import XArraySwapDims
 from rdmlibpy.xarrays.xarray_transforms import XArrayMerge
 from rdmlibpy.xarrays.xarray_transforms import XArraySetCoords
+from rdmlibpy.xarrays.xarray_transforms import XArrayResample
+from rdmlibpy.loaders import BrukerOpusLoader
 
 _ = pint_xarray.unit_registry
 
@@ -848,3 +850,54 @@ class TestXArrayMerge:
         assert result["var2"].values.tolist() == pytest.approx(
             [4.0, np.nan, 5.0], nan_ok=True
         )
+
+
+class TestXArrayResample:
+    def test_create_transform(self):
+        transform = XArrayResample()
+
+        assert transform.name == 'xarray.resample'
+        assert transform.version == '1'
+
+    def test_resample_spectra(self, data_path: Path):
+        da = BrukerOpusLoader().run(source=data_path / 'bruker/LC003.*')
+
+        actual = XArrayResample().run(da, freq='10 s')
+
+        assert actual.dims == ('timestamp', 'nu')
+        assert list(actual.timestamp.values) == [
+            np.datetime64('2024-10-17T16:19:00'),
+            np.datetime64('2024-10-17T16:19:10'),
+        ]
+        np.testing.assert_allclose(actual[0], da[0:2].mean('timestamp'))
+        np.testing.assert_allclose(actual[1], da[2])
+
+    @pytest.mark.parametrize(
+        'method, expected',
+        [
+            ('mean', [1.0, 3.5]),
+            ('min', [0.0, 3.0]),
+            ('max', [2.0, 4.0]),
+            ('first', [0.0, 3.0]),
+            ('last', [2.0, 4.0]),
+            ('count', [3, 2]),
+        ],
+    )
+    def test_resample_methods_on_coordinate(self, method, expected):
+        ds = xr.Dataset(
+            dict(T=('index', np.arange(5.0), dict(units='K'))),
+            coords=dict(
+                time=(
+                    'index',
+                    np.datetime64('2024-01-16T10:00:00.2')
+                    + np.arange(5) * np.timedelta64(300, 'ms'),
+                )
+            ),
+            attrs=dict(source='test'),
+        )
+
+        actual = XArrayResample().run(ds, freq='1 s', method=method, coord='time')
+
+        assert list(actual['T'].values) == expected
+        assert actual.attrs == ds.attrs
+        assert actual['T'].attrs == ds['T'].attrs